@@ -59,7 +59,15 @@ btn-prev-page = <- Back
 delete-confirm = Are you sure you want to delete this post?
 post-deleted = Post deleted.
 btn-delete-yes = Yes, delete
+btn-select = Select
+btn-delete-all = Delete all
+my-posts-select-title = Tap posts to select them ({ $count } selected):
+btn-delete-selected = Delete selected ({ $count })
+delete-selected-confirm = Delete { $count } selected posts?
+delete-all-confirm = Delete all of your posts? This cannot be undone.
+posts-deleted = Posts deleted: { $count }.
 post-actions-hint = Share this post or manage it using the buttons below.
+post-shares = 📤 Shares: { $count }
 btn-back-to-list = Back to list
 btn-back-to-menu = Back to menu
 
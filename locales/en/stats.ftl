@@ -11,6 +11,12 @@ stats-top-inviters-header = 🏆 Top { $limit } inviters:
 
 stats-no-inviters = No inviters yet
 
+stats-top-posts-btn = 🔥 Top posts
+
+stats-top-posts-header = 🔥 Top { $limit } shared posts:
+
+stats-no-shared-posts = No posts shared yet
+
 referral-info =
     🔗 Your referral link:
     { $link }
@@ -62,7 +62,15 @@ btn-prev-page = <- Назад
 delete-confirm = Вы уверены, что хотите удалить этот пост?
 post-deleted = Пост удалён.
 btn-delete-yes = Да, удалить
+btn-select = Выбрать
+btn-delete-all = Удалить все
+my-posts-select-title = Нажмите на посты, чтобы выбрать их (выбрано: { $count }):
+btn-delete-selected = Удалить выбранные ({ $count })
+delete-selected-confirm = Удалить выбранные посты ({ $count })?
+delete-all-confirm = Удалить все ваши посты? Это действие нельзя отменить.
+posts-deleted = Удалено постов: { $count }.
 post-actions-hint = Поделитесь постом или управляйте им с помощью кнопок ниже.
+post-shares = 📤 Отправок: { $count }
 btn-back-to-list = К списку
 btn-back-to-menu = В меню
 
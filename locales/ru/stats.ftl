@@ -11,6 +11,12 @@ stats-top-inviters-header = 🏆 Топ-{ $limit } инвайтеров:
 
 stats-no-inviters = Пока нет инвайтеров
 
+stats-top-posts-btn = 🔥 Топ постов
+
+stats-top-posts-header = 🔥 Топ-{ $limit } постов по отправкам:
+
+stats-no-shared-posts = Постами пока не делились
+
 referral-info =
     🔗 Ваша реферальная ссылка:
     { $link }
@@ -0,0 +1,65 @@
+"""Shared helpers for the benchmarks in this directory.
+
+Database benchmarks run against the database from the given config file
+(config.yaml by default) with the schema already migrated
+(`alembic upgrade head`). Run them from the project root, e.g.
+`python -m scripts.benchmarks.user_upsert`.
+"""
+
+import argparse
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.infrastructure.config import load_config
+from src.infrastructure.db.factory import create_engine
+
+
+def make_parser(description: str) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--config", default="config.yaml", help="config file")
+    return parser
+
+
+def engine_from_args(args: argparse.Namespace) -> AsyncEngine:
+    config = load_config(args.config)
+    return create_engine(config.postgres, pool_size=20, max_overflow=0)
+
+
+@dataclass
+class Timings:
+    name: str
+    samples: list[float]
+
+    @property
+    def total(self) -> float:
+        return sum(self.samples)
+
+    def percentile(self, pct: float) -> float:
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+        return ordered[index]
+
+    def report(self) -> str:
+        ms = 1000
+        return (
+            f"{self.name:<32} n={len(self.samples):<7} "
+            f"mean={statistics.fmean(self.samples) * ms:8.3f}ms "
+            f"p50={self.percentile(50) * ms:8.3f}ms "
+            f"p95={self.percentile(95) * ms:8.3f}ms "
+            f"p99={self.percentile(99) * ms:8.3f}ms"
+        )
+
+
+async def measure(
+    name: str, iterations: int, func: Callable[[int], Awaitable[object]]
+) -> Timings:
+    samples = []
+    for i in range(iterations):
+        started = time.perf_counter()
+        await func(i)
+        samples.append(time.perf_counter() - started)
+    return Timings(name=name, samples=samples)
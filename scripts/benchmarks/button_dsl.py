@@ -0,0 +1,91 @@
+"""Cost of the button DSL across the post wizard, before and after parse-once.
+
+The wizard used to parse the buttons text three times: to validate it, to
+build the preview keyboard and again when creating the post. It now parses
+once, keeps the rows in FSM state (round-tripped through JSON here, as a
+Redis storage would) and builds the preview and the post from them. Also
+times a single cold parse against a memoized one. No database is needed.
+"""
+
+import asyncio
+import json
+from collections.abc import Awaitable, Callable
+
+from src.application.post.button_dsl import _parse_cached, parse_buttons_dsl
+from src.application.post.dtos import PostButtonDTO
+from src.presentation.bot.routers.post_wizard import (
+    _buttons_from_state,
+    _buttons_to_state,
+)
+from src.presentation.bot.utils.markups.post import build_inline_keyboard_from_buttons
+
+from ._common import Timings, make_parser, measure
+
+_parse_uncached = _parse_cached.__wrapped__
+
+
+def _dsl(rows: int, columns: int) -> str:
+    colors = ("", " + green", " + синий", " + red")
+    return "\n".join(
+        " ".join(
+            f"[Button {row}.{col} + example.com/{row}/{col}{colors[(row + col) % 4]}]"
+            for col in range(columns)
+        )
+        for row in range(rows)
+    )
+
+
+def _three_parses(raw: str) -> None:
+    _parse_uncached(raw)
+    preview_rows = _parse_uncached(raw)
+    build_inline_keyboard_from_buttons(
+        [
+            [PostButtonDTO(btn.text, btn.url, btn.style.value) for btn in row]
+            for row in preview_rows
+        ]
+    )
+    _parse_uncached(raw)
+
+
+def _parse_once(raw: str) -> None:
+    rows = [list(row) for row in _parse_uncached(raw)]
+    data = json.loads(json.dumps({"buttons": _buttons_to_state(rows)}))
+    build_inline_keyboard_from_buttons(_buttons_from_state(data) or [])
+    _buttons_from_state(data)
+
+
+def _bind(func: Callable[[str], object], raw: str) -> Callable[[int], Awaitable[None]]:
+    async def run(_: int) -> None:
+        func(raw)
+
+    return run
+
+
+async def main() -> None:
+    parser = make_parser(__doc__)
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--columns", type=int, default=8)
+    args = parser.parse_args()
+
+    results: list[Timings] = []
+    for rows in (10, 100, 1000):
+        raw = _dsl(rows, args.columns)
+        size = f"{rows}x{args.columns}"
+        cases: list[tuple[str, Callable[[str], object]]] = [
+            ("parse, cold", _parse_uncached),
+            ("parse, memoized", parse_buttons_dsl),
+            ("wizard, three parses", _three_parses),
+            ("wizard, parse once", _parse_once),
+        ]
+        for name, func in cases:
+            iterations = max(1, args.iterations * 10 // rows)
+            results.append(
+                await measure(f"{size} {name}", iterations, _bind(func, raw))
+            )
+
+    for timings in results:
+        print(timings.report())
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,105 @@
+"""Throughput of parsing many distinct button DSL strings, as a bulk import.
+
+Parses `--strings` generated DSL texts of varying size, mostly valid with
+some broken buttons, once each so the memoization never helps. Compares the
+single-pass tokenizer with the regex and urlparse based parser it replaced,
+which stopped at the first error. No database is needed.
+"""
+
+import asyncio
+import random
+import re
+import time
+from collections.abc import Callable
+from urllib.parse import urlparse
+
+from src.application.post.button_dsl import (
+    COLOR_ALIASES,
+    ButtonDslError,
+    _parse_cached,
+)
+from src.domain.post.vo import ButtonStyle
+
+from ._common import make_parser
+
+_parse_uncached = _parse_cached.__wrapped__
+_BUTTON_PATTERN = re.compile(r"\[([^\]]+)\]")
+_VALID_STYLES = {s.value for s in ButtonStyle}
+
+
+def _regex_parse(raw: str) -> list[list[tuple[str, str, str]]]:
+    rows = []
+    for raw_line in raw.strip().splitlines():
+        line = raw_line.strip()
+        if not line:
+            continue
+        matches = _BUTTON_PATTERN.findall(line)
+        if not matches:
+            raise ButtonDslError([])
+        row = []
+        for match in matches:
+            parts = [p.strip() for p in match.split("+")]
+            if len(parts) < 2 or not parts[0]:
+                raise ButtonDslError([])
+            url = parts[1]
+            if not url.startswith(("http://", "https://")):
+                url = f"https://{url}"
+            result = urlparse(url)
+            if not result.scheme or not result.netloc:
+                raise ButtonDslError([])
+            style = (parts[2] if len(parts) >= 3 else "default").lower()
+            style = COLOR_ALIASES.get(style, style)
+            if style not in _VALID_STYLES:
+                raise ButtonDslError([])
+            row.append((parts[0], url, style))
+        rows.append(row)
+    return rows
+
+
+def _dsl(rng: random.Random, index: int) -> str:
+    colors = ("", " + green", " + синий", " + red", " + purple")
+    lines = []
+    for row in range(rng.randint(1, 10)):
+        buttons = []
+        for col in range(rng.randint(1, 8)):
+            url = (
+                "https://" if rng.random() < 0.002 else f"shop{index}.example.com/{row}"
+            )
+            color = colors[4] if rng.random() < 0.002 else rng.choice(colors[:4])
+            buttons.append(f"[Item {index}.{row}.{col} + {url}{color}]")
+        lines.append(" ".join(buttons))
+    return "\n".join(lines)
+
+
+def _run(name: str, parse: Callable[[str], object], texts: list[str]) -> None:
+    failed = 0
+    started = time.perf_counter()
+    for raw in texts:
+        try:
+            parse(raw)
+        except ButtonDslError:
+            failed += 1
+    elapsed = time.perf_counter() - started
+    print(
+        f"{name:<32} {len(texts) / elapsed:10.0f} strings/s "
+        f"{elapsed / len(texts) * 1e6:8.1f}us/string {failed} rejected"
+    )
+
+
+async def main() -> None:
+    parser = make_parser(__doc__)
+    parser.add_argument("--strings", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    texts = [_dsl(rng, i) for i in range(args.strings)]
+    buttons = sum(raw.count("[") for raw in texts)
+    print(f"{len(texts)} strings, {buttons} buttons")
+
+    _run("regex + urlparse", _regex_parse, texts)
+    _run("single-pass tokenizer", _parse_uncached, texts)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
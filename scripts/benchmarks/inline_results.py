@@ -0,0 +1,197 @@
+"""Inline query handler latency with and without the inline result cache.
+
+Runs the real `inline_query_handler` through dishka against a stubbed search
+interactor and a session that serializes the answer instead of sending it,
+for text, photo, video and gif posts with a large button grid. No database
+is needed.
+"""
+
+import asyncio
+import uuid
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from aiogram import Bot
+from aiogram.client.session.base import BaseSession
+from aiogram.methods import TelegramMethod
+from aiogram.types import InlineQuery, User
+from dishka import AsyncContainer, Provider, Scope, make_async_container, provide
+from fluentogram import TranslatorRunner
+
+from src.application.post.dtos import (
+    PostButtonDTO,
+    PostDetailDTO,
+    PostSearchPageDTO,
+)
+from src.application.post.search_by_key import (
+    SearchPostsByKeyInputDTO,
+    SearchPostsByKeyInteractor,
+)
+from src.application.post.search_by_text import (
+    SearchPostsByTextInputDTO,
+    SearchPostsByTextInteractor,
+)
+from src.infrastructure.i18n import create_translator_hub
+from src.presentation.bot.routers.inline import inline_query_handler
+from src.presentation.bot.utils.inline_results import (
+    InlineCachePolicy,
+    InlineResult,
+    InlineResultCache,
+    build_inline_result,
+)
+
+from ._common import Timings, make_parser, measure
+
+GRID_ROWS = 10
+GRID_COLUMNS = 8
+
+
+class _SerializingSession(BaseSession):
+    """Does the request serialization work of a real session, sends nothing."""
+
+    async def make_request(
+        self,
+        bot: Bot,
+        method: TelegramMethod[Any],
+        timeout: int | None = None,  # noqa: ASYNC109 - fixed by BaseSession
+    ) -> Any:  # noqa: ANN401
+        files: dict[str, Any] = {}
+        for value in method.model_dump(warnings=False).values():
+            self.prepare_value(value, bot=bot, files=files)
+        return True
+
+    async def stream_content(self, *args: object, **kwargs: object) -> Any:  # noqa: ANN401
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        pass
+
+
+class _StubSearch(SearchPostsByKeyInteractor):
+    def __init__(self, posts: dict[str, PostDetailDTO]) -> None:
+        self._posts = posts
+
+    async def __call__(self, data: SearchPostsByKeyInputDTO) -> PostSearchPageDTO:
+        return PostSearchPageDTO(items=[self._posts[data.query]])
+
+
+class _NoTextSearch(SearchPostsByTextInteractor):
+    """Never reached: every benchmark query is a known key."""
+
+    def __init__(self) -> None:
+        pass
+
+    async def __call__(self, data: SearchPostsByTextInputDTO) -> PostSearchPageDTO:
+        return PostSearchPageDTO(items=[])
+
+
+class _NoCache(InlineResultCache):
+    def get_or_build(self, post: PostDetailDTO) -> InlineResult | None:
+        return build_inline_result(post)
+
+
+class _BenchProvider(Provider):
+    scope = Scope.APP
+
+    def __init__(self, search: _StubSearch, cache: InlineResultCache) -> None:
+        super().__init__()
+        self._search = search
+        self._cache = cache
+
+    @provide
+    def get_search(self) -> SearchPostsByKeyInteractor:
+        return self._search
+
+    @provide
+    def get_text_search(self) -> SearchPostsByTextInteractor:
+        return _NoTextSearch()
+
+    @provide
+    def get_cache(self) -> InlineResultCache:
+        return self._cache
+
+    @provide
+    def get_cache_policy(self) -> InlineCachePolicy:
+        return InlineCachePolicy(content_cache_seconds={}, short_cache_seconds=5)
+
+
+def _post(key: str, content_type: str) -> PostDetailDTO:
+    now = datetime.now(UTC)
+    styles = ("default", "green", "blue", "red")
+    return PostDetailDTO(
+        id=uuid.uuid4(),
+        unique_key=key,
+        content_type=content_type,
+        text_md="Benchmark post with a moderately long caption. " * 4,
+        telegram_file_id=None if content_type == "text" else "A" * 80,
+        buttons=[
+            [
+                PostButtonDTO(
+                    text=f"Button {row}.{col}",
+                    url=f"https://example.com/{row}/{col}",
+                    style=styles[(row + col) % len(styles)],
+                )
+                for col in range(GRID_COLUMNS)
+            ]
+            for row in range(GRID_ROWS)
+        ],
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def _bind(
+    container: AsyncContainer, bot: Bot, key: str, i18n: TranslatorRunner
+) -> Callable[[int], Awaitable[None]]:
+    async def run(i: int) -> None:
+        query = InlineQuery(
+            id=str(i),
+            from_user=User(id=1, is_bot=False, first_name="Bench"),
+            query=key,
+            offset="",
+        ).as_(bot)
+        async with container() as request_container:
+            await inline_query_handler(
+                query, i18n=i18n, dishka_container=request_container
+            )
+
+    return run
+
+
+async def main() -> None:
+    parser = make_parser(__doc__)
+    parser.add_argument("--iterations", type=int, default=5000)
+    args = parser.parse_args()
+
+    posts = {
+        f"{content_type[:4]:a<8}": _post(f"{content_type[:4]:a<8}", content_type)
+        for content_type in ("text", "photo", "video", "gif")
+    }
+    hub = create_translator_hub(Path(__file__).parents[2] / "locales")
+    i18n = hub.get_translator_by_locale("en")
+    bot = Bot("42:BENCHMARK", session=_SerializingSession())
+    results: list[Timings] = []
+
+    for name, cache in (
+        ("without cache", _NoCache(max_size=1)),
+        ("with cache", InlineResultCache(max_size=100)),
+    ):
+        container = make_async_container(_BenchProvider(_StubSearch(posts), cache))
+        try:
+            for key, post in posts.items():
+                run = _bind(container, bot, key, i18n)
+                timings = await measure(
+                    f"{name}: {post.content_type}", args.iterations, run
+                )
+                results.append(timings)
+        finally:
+            await container.close()
+
+    for timings in results:
+        print(timings.report())
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
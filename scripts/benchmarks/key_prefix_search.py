@@ -0,0 +1,163 @@
+"""Latency of inline key prefix search over a large seeded posts table.
+
+Seeds `--posts` active posts (keys are the first 8 hex digits of an md5, so
+they are valid keys) owned by a dedicated benchmark user, then measures
+`search_posts_by_key` for prefixes of 3 to 8 characters taken from real keys
+and for prefixes that match nothing; partial keys are matched against the
+benchmark user's posts, as the inline search does. The plan of one 3-character lookup is
+printed so the index usage can be checked.
+
+Seeding millions of rows takes a while; pass `--keep` to leave them in
+place and reuse them on the next run.
+"""
+
+import asyncio
+import random
+from collections.abc import Awaitable, Callable
+
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.application.post.keygen import KEY_LENGTH
+from src.infrastructure.db.factory import create_session_maker
+from src.infrastructure.db.models import UserModel
+from src.infrastructure.db.models.post import PostModel
+from src.infrastructure.db.queries import PostQueryServiceImpl
+
+from ._common import Timings, engine_from_args, make_parser, measure
+
+# Far above real Telegram ids so the benchmark never touches real rows
+BENCH_USER_ID = 9_100_000_000_000
+SEED_CHUNK = 200_000
+
+
+async def _seed(session_maker: async_sessionmaker[AsyncSession], posts: int) -> None:
+    async with session_maker() as session:
+        await session.execute(
+            postgresql.insert(UserModel)
+            .values(id=BENCH_USER_ID, first_name="Bench")
+            .on_conflict_do_nothing()
+        )
+        existing = await session.scalar(
+            select(func.count())
+            .select_from(PostModel)
+            .where(PostModel.owner_user_id == BENCH_USER_ID)
+        )
+        await session.commit()
+
+    for start in range(existing or 0, posts, SEED_CHUNK):
+        stop = min(start + SEED_CHUNK, posts)
+        async with session_maker() as session:
+            await session.execute(
+                text(
+                    "INSERT INTO posts (id, owner_user_id, unique_key, content_type,"
+                    " text_md, buttons, status)"
+                    " SELECT gen_random_uuid(), :owner,"
+                    " left(md5('bench' || i), 8), 'text', 'Benchmark post', '[]',"
+                    " 'active'"
+                    " FROM generate_series(:start, :stop - 1) AS i"
+                    " ON CONFLICT (unique_key) DO NOTHING"
+                ),
+                {"owner": BENCH_USER_ID, "start": start, "stop": stop},
+            )
+            await session.commit()
+        print(f"seeded {stop}/{posts}")
+
+    async with session_maker() as session:
+        await session.execute(text("ANALYZE posts"))
+        await session.commit()
+
+
+async def _cleanup(session_maker: async_sessionmaker[AsyncSession]) -> None:
+    async with session_maker() as session:
+        await session.execute(
+            delete(PostModel).where(PostModel.owner_user_id == BENCH_USER_ID)
+        )
+        await session.execute(delete(UserModel).where(UserModel.id == BENCH_USER_ID))
+        await session.commit()
+
+
+async def _sample_keys(
+    session_maker: async_sessionmaker[AsyncSession], count: int
+) -> list[str]:
+    async with session_maker() as session:
+        result = await session.scalars(
+            select(PostModel.unique_key)
+            .where(PostModel.owner_user_id == BENCH_USER_ID)
+            .order_by(func.random())
+            .limit(count)
+        )
+        return list(result)
+
+
+async def _explain(session_maker: async_sessionmaker[AsyncSession], key: str) -> str:
+    prefix = key[:3]
+    async with session_maker() as session:
+        rows = await session.execute(
+            text(
+                "EXPLAIN (ANALYZE, BUFFERS) SELECT * FROM posts"
+                " WHERE unique_key ~>=~ :lower AND unique_key ~<~ :upper"
+                " AND owner_user_id = :owner AND status = 'active'"
+                " ORDER BY unique_key USING ~<~ LIMIT 10"
+            ),
+            {
+                "lower": prefix,
+                "upper": prefix[:-1] + chr(ord(prefix[-1]) + 1),
+                "owner": BENCH_USER_ID,
+            },
+        )
+        return "\n".join(row[0] for row in rows)
+
+
+def _bind(
+    session_maker: async_sessionmaker[AsyncSession], prefixes: list[str]
+) -> Callable[[int], Awaitable[None]]:
+    async def run(i: int) -> None:
+        prefix = prefixes[i % len(prefixes)]
+        # As the interactor does: partial keys only match the user's posts
+        owner = BENCH_USER_ID if len(prefix) < KEY_LENGTH else None
+        async with session_maker() as session:
+            await PostQueryServiceImpl(session).search_posts_by_key(
+                prefix, limit=10, owner_user_id=owner
+            )
+
+    return run
+
+
+async def main() -> None:
+    parser = make_parser(__doc__)
+    parser.add_argument("--posts", type=int, default=2_000_000)
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--keep", action="store_true", help="keep seeded posts")
+    args = parser.parse_args()
+
+    engine = engine_from_args(args)
+    session_maker = create_session_maker(engine)
+    results: list[Timings] = []
+
+    try:
+        await _seed(session_maker, args.posts)
+        keys = await _sample_keys(session_maker, 1000)
+        print(await _explain(session_maker, keys[0]))
+
+        for length in (3, 4, 5, 8):
+            prefixes = [key[:length] for key in keys]
+            run = _bind(session_maker, prefixes)
+            results.append(await measure(f"prefix len {length}", args.iterations, run))
+
+        # 'z' never appears in hex-derived keys, so these match nothing
+        misses = [f"z{random.choice('0123456789')}{key[:2]}" for key in keys]
+        run = _bind(session_maker, misses)
+        results.append(await measure("no match", args.iterations, run))
+    finally:
+        if not args.keep:
+            await _cleanup(session_maker)
+        await engine.dispose()
+
+    for timings in results:
+        print(timings.report())
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,170 @@
+"""Throughput of concurrent post creation per key allocation scheme.
+
+Runs `--concurrency` workers that each create posts through the real
+`CreatePostInteractor`, one session and transaction per post, with keys
+from the pre-reserved key pool, with keys permuted from the `post_key_seq`
+sequence one by one, and with the former scheme of random keys checked
+with `key_exists` before the insert. Posts are owned by a dedicated
+benchmark user and removed afterwards, together with the pool's leases.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+
+from sqlalchemy import delete
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.application.interfaces.post_key_allocator import PostKeyAllocator
+from src.application.post.create import CreatePostInteractor
+from src.application.post.dtos import CreatePostInputDTO
+from src.application.post.key_allocator import SequenceKeyAllocator
+from src.application.post.keygen import KeyPermutation, generate_unique_key
+from src.domain.post.repository import PostRepository
+from src.infrastructure.cache import PostKeyBloomFilter
+from src.infrastructure.db.factory import create_session_maker
+from src.infrastructure.db.key_pool import PostKeyPool
+from src.infrastructure.db.models import UserModel
+from src.infrastructure.db.models.post import PostModel
+from src.infrastructure.db.repos.post import PostRepositoryImpl
+from src.infrastructure.db.transaction import TransactionManagerImpl
+
+from ._common import Timings, engine_from_args, make_parser
+
+# Far above real Telegram ids so the benchmark never touches real rows
+BENCH_USER_ID = 9_100_000_000_001
+
+
+class _RandomKeyAllocator(PostKeyAllocator):
+    """The allocation scheme before the key sequence: draw and check."""
+
+    def __init__(self, post_repository: PostRepository) -> None:
+        self.post_repository = post_repository
+
+    async def allocate(self) -> str:
+        for _ in range(10):
+            key = generate_unique_key()
+            if not await self.post_repository.key_exists(key):
+                return key
+        msg = "Failed to generate unique key after multiple attempts"
+        raise RuntimeError(msg)
+
+    def mark_used(self, key: str) -> None:
+        pass
+
+    def release(self, key: str) -> None:
+        pass
+
+
+type _AllocatorFactory = Callable[[PostRepository], PostKeyAllocator]
+
+
+async def _seed(session_maker: async_sessionmaker[AsyncSession]) -> None:
+    async with session_maker() as session:
+        await session.execute(
+            postgresql.insert(UserModel)
+            .values(id=BENCH_USER_ID, first_name="Bench")
+            .on_conflict_do_nothing()
+        )
+        await session.commit()
+
+
+async def _cleanup(session_maker: async_sessionmaker[AsyncSession]) -> None:
+    async with session_maker() as session:
+        await session.execute(
+            delete(PostModel).where(PostModel.owner_user_id == BENCH_USER_ID)
+        )
+        await session.execute(delete(UserModel).where(UserModel.id == BENCH_USER_ID))
+        await session.commit()
+
+
+def _bind(
+    session_maker: async_sessionmaker[AsyncSession],
+    allocator_factory: _AllocatorFactory,
+    key_filter: PostKeyBloomFilter,
+) -> Callable[[], Awaitable[None]]:
+    data = CreatePostInputDTO(
+        owner_user_id=BENCH_USER_ID, content_type="text", text_md="Benchmark post"
+    )
+
+    async def run() -> None:
+        async with session_maker() as session:
+            repository = PostRepositoryImpl(session)
+            interactor = CreatePostInteractor(
+                post_repository=repository,
+                transaction_manager=TransactionManagerImpl(session),
+                key_filter=key_filter,
+                key_allocator=allocator_factory(repository),
+            )
+            await interactor(data)
+
+    return run
+
+
+async def _run_workers(
+    name: str, posts: int, concurrency: int, func: Callable[[], Awaitable[None]]
+) -> tuple[Timings, float]:
+    samples: list[float] = []
+    remaining = iter(range(posts))
+
+    async def worker() -> None:
+        for _ in remaining:
+            started = time.perf_counter()
+            await func()
+            samples.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return Timings(name=name, samples=samples), posts / elapsed
+
+
+async def main() -> None:
+    parser = make_parser(__doc__)
+    parser.add_argument("--posts", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+
+    engine = engine_from_args(args)
+    session_maker = create_session_maker(engine)
+    key_filter = PostKeyBloomFilter(capacity=args.posts * 2)
+    key_permutation = KeyPermutation(b"benchmark")
+    key_pool = PostKeyPool(
+        session_maker, key_permutation, low_water=args.posts // 4, batch_size=1000
+    )
+    results: list[tuple[Timings, float]] = []
+
+    try:
+        await _seed(session_maker)
+        # Fill the pool up front, as it would be well before real traffic
+        await key_pool.refill()
+        key_pool.start()
+
+        schemes: list[tuple[str, _AllocatorFactory]] = [
+            ("key pool", lambda _: key_pool),
+            (
+                "sequence keys",
+                lambda repository: SequenceKeyAllocator(repository, key_permutation),
+            ),
+            ("random keys + key_exists", _RandomKeyAllocator),
+        ]
+        for name, allocator_factory in schemes:
+            run = _bind(session_maker, allocator_factory, key_filter)
+            results.append(await _run_workers(name, args.posts, args.concurrency, run))
+    finally:
+        await key_pool.close()
+        await _cleanup(session_maker)
+        await engine.dispose()
+
+    print(
+        f"key pool: {key_pool.stats.starved} starved allocations, "
+        f"last refill {key_pool.stats.last_refill_seconds * 1000:.1f}ms"
+    )
+
+    for timings, throughput in results:
+        print(f"{timings.report()} {throughput:8.1f} posts/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,212 @@
+"""Rows per second read into DTOs: ORM entities versus column projections.
+
+Seeds `--posts` active posts with a long text and a few button rows for a
+dedicated benchmark user, then pages through all of them `--page-size` rows
+at a time in two ways. The former read path selects whole `PostModel` rows,
+maps them with `PostMapper.to_domain` and builds the DTOs from the domain
+posts; the read side selects only the needed columns through
+`PostQueryServiceImpl` and builds the DTOs from the rows. Both are measured
+for My Posts list pages, where the preview is cut in SQL, and for key search
+detail pages, where buttons are decoded.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+
+from sqlalchemy import Select, delete, or_, select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.application.interfaces.post_queries import PostCursor
+from src.application.post.dtos import PostListItemDTO, post_to_detail
+from src.domain.post.entity import Post
+from src.infrastructure.db.factory import create_session_maker
+from src.infrastructure.db.mappers.post import PostMapper
+from src.infrastructure.db.models import UserModel
+from src.infrastructure.db.models.post import PostModel, active_post_filter
+from src.infrastructure.db.queries import PostQueryServiceImpl
+
+from ._common import Timings, engine_from_args, make_parser
+
+# Far above real Telegram ids so the benchmark never touches real rows
+BENCH_USER_ID = 9_100_000_000_002
+# Every seeded key starts with it, so one prefix search pages through all
+KEY_PREFIX = "h"
+
+_BUTTONS = (
+    '[[{"text": "Open", "url": "https://example.com/a", "style": "green"},'
+    ' {"text": "More", "url": "https://example.com/b", "style": "default"}],'
+    ' [{"text": "Share", "url": "https://example.com/c", "style": "blue"}]]'
+)
+
+# Reads the page after the cursor; returns the next cursor and the row count
+type _PageReader[C] = Callable[
+    [AsyncSession, C | None, int], Awaitable[tuple[C | None, int]]
+]
+
+
+async def _seed(session_maker: async_sessionmaker[AsyncSession], posts: int) -> None:
+    async with session_maker() as session:
+        await session.execute(
+            postgresql.insert(UserModel)
+            .values(id=BENCH_USER_ID, first_name="Bench", active_post_count=posts)
+            .on_conflict_do_nothing()
+        )
+        await session.execute(
+            text(
+                "INSERT INTO posts (id, owner_user_id, unique_key, content_type,"
+                " text_md, buttons, status, created_at)"
+                " SELECT gen_random_uuid(), :owner, :prefix || lpad(i::text, 7, '0'),"
+                " 'text', repeat('Benchmark post text. ', 40), CAST(:buttons AS json),"
+                " 'active', now() - i * interval '1 second'"
+                " FROM generate_series(1, :posts) AS i"
+            ),
+            {
+                "owner": BENCH_USER_ID,
+                "prefix": KEY_PREFIX,
+                "posts": posts,
+                "buttons": _BUTTONS,
+            },
+        )
+        await session.execute(text("ANALYZE posts"))
+        await session.commit()
+
+
+async def _cleanup(session_maker: async_sessionmaker[AsyncSession]) -> None:
+    async with session_maker() as session:
+        await session.execute(
+            delete(PostModel).where(PostModel.owner_user_id == BENCH_USER_ID)
+        )
+        await session.execute(delete(UserModel).where(UserModel.id == BENCH_USER_ID))
+        await session.commit()
+
+
+async def _entities(
+    session: AsyncSession, stmt: Select[tuple[PostModel]]
+) -> list[Post]:
+    return [PostMapper.to_domain(model) for model in await session.scalars(stmt)]
+
+
+async def _orm_list(
+    session: AsyncSession, cursor: PostCursor | None, limit: int
+) -> tuple[PostCursor | None, int]:
+    stmt = select(PostModel).where(
+        PostModel.owner_user_id == BENCH_USER_ID, active_post_filter()
+    )
+    if cursor is not None:
+        stmt = stmt.where(
+            PostModel.created_at <= cursor.created_at,
+            or_(PostModel.created_at < cursor.created_at, PostModel.id < cursor.id),
+        )
+    stmt = stmt.order_by(PostModel.created_at.desc(), PostModel.id.desc()).limit(limit)
+    items = [
+        PostListItemDTO(
+            id=post.id,
+            unique_key=post.unique_key.value,
+            content_type=post.content_type.value,
+            text_preview=post.text_md.value[:50] if post.text_md else None,
+            created_at=post.created_at,
+        )
+        for post in await _entities(session, stmt)
+    ]
+    if not items:
+        return None, 0
+    return PostCursor(items[-1].created_at, items[-1].id), len(items)
+
+
+async def _projected_list(
+    session: AsyncSession, cursor: PostCursor | None, limit: int
+) -> tuple[PostCursor | None, int]:
+    items, _ = await PostQueryServiceImpl(session).get_user_posts(
+        BENCH_USER_ID, limit=limit, cursor=cursor
+    )
+    if not items:
+        return None, 0
+    return PostCursor(items[-1].created_at, items[-1].id), len(items)
+
+
+async def _orm_detail(
+    session: AsyncSession, after: str | None, limit: int
+) -> tuple[str | None, int]:
+    stmt = select(PostModel).where(
+        PostModel.owner_user_id == BENCH_USER_ID, active_post_filter()
+    )
+    if after is not None:
+        stmt = stmt.where(PostModel.unique_key > after)
+    stmt = stmt.order_by(PostModel.unique_key).limit(limit)
+    details = [post_to_detail(post) for post in await _entities(session, stmt)]
+    return (details[-1].unique_key, len(details)) if details else (None, 0)
+
+
+async def _projected_detail(
+    session: AsyncSession, after: str | None, limit: int
+) -> tuple[str | None, int]:
+    details = await PostQueryServiceImpl(session).search_posts_by_key(
+        KEY_PREFIX, limit=limit, after=after, owner_user_id=BENCH_USER_ID
+    )
+    return (details[-1].unique_key, len(details)) if details else (None, 0)
+
+
+async def _read_all[C](
+    session_maker: async_sessionmaker[AsyncSession],
+    name: str,
+    reader: _PageReader[C],
+    page_size: int,
+) -> tuple[Timings, float]:
+    samples: list[float] = []
+    rows = 0
+    cursor: C | None = None
+    async with session_maker() as session:
+        started = time.perf_counter()
+        while True:
+            page_started = time.perf_counter()
+            cursor, count = await reader(session, cursor, page_size)
+            samples.append(time.perf_counter() - page_started)
+            rows += count
+            if cursor is None:
+                break
+            # Entities would otherwise pile up in the identity map
+            session.expunge_all()
+        elapsed = time.perf_counter() - started
+    return Timings(name=name, samples=samples), rows / elapsed
+
+
+async def main() -> None:
+    parser = make_parser(__doc__)
+    parser.add_argument("--posts", type=int, default=200_000)
+    parser.add_argument("--page-size", type=int, default=100)
+    args = parser.parse_args()
+
+    engine = engine_from_args(args)
+    session_maker = create_session_maker(engine)
+    results: list[tuple[Timings, float]] = []
+
+    try:
+        await _seed(session_maker, args.posts)
+        results.append(
+            await _read_all(session_maker, "list: ORM", _orm_list, args.page_size)
+        )
+        results.append(
+            await _read_all(
+                session_maker, "list: projection", _projected_list, args.page_size
+            )
+        )
+        results.append(
+            await _read_all(session_maker, "detail: ORM", _orm_detail, args.page_size)
+        )
+        results.append(
+            await _read_all(
+                session_maker, "detail: projection", _projected_detail, args.page_size
+            )
+        )
+    finally:
+        await _cleanup(session_maker)
+        await engine.dispose()
+
+    for timings, throughput in results:
+        print(f"{timings.report()} {throughput:10.1f} rows/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,145 @@
+"""Insert throughput and primary key index health: uuid4 versus UUIDv7 ids.
+
+Inserts `--rows` rows into two scratch tables shaped like the posts primary
+key, one keyed by `uuid.uuid4` and one by `uuid7`, `--batch-size` rows per
+transaction on a single connection. Reports the batch latencies, overall
+and tail throughput (the last tenth of the batches, once the index has
+grown), the size of each primary key index and its buffer cache hit ratio.
+
+Random ids touch a random leaf page per insert, so once the index outgrows
+`shared_buffers` the hit ratio drops and pages split half empty; time
+ordered ids append to the rightmost leaf. Run it with millions of rows to
+see the difference. Statistics are read from `pg_statio_user_indexes`,
+which needs PostgreSQL 15 or later for `pg_stat_force_next_flush`.
+"""
+
+import asyncio
+import time
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.application.post.ids import uuid7
+
+from ._common import Timings, engine_from_args, make_parser
+
+_UUID_ARRAY = ARRAY(UUID(as_uuid=True))
+
+
+@dataclass
+class _Result:
+    timings: Timings
+    throughput: float
+    tail_throughput: float
+    index_bytes: int
+    hit_ratio: float
+
+    def report(self) -> str:
+        return (
+            f"{self.timings.report()} {self.throughput:9.0f} rows/s "
+            f"tail {self.tail_throughput:9.0f} rows/s "
+            f"index {self.index_bytes / 2**20:8.1f}MB "
+            f"hit {self.hit_ratio:6.2%}"
+        )
+
+
+async def _create(engine: AsyncEngine, table: str) -> None:
+    async with engine.begin() as conn:
+        await conn.execute(text(f"DROP TABLE IF EXISTS {table}"))
+        await conn.execute(
+            text(
+                f"CREATE TABLE {table} (id uuid PRIMARY KEY,"
+                " created_at timestamptz NOT NULL DEFAULT now())"
+            )
+        )
+
+
+async def _drop(engine: AsyncEngine, table: str) -> None:
+    async with engine.begin() as conn:
+        await conn.execute(text(f"DROP TABLE IF EXISTS {table}"))
+
+
+async def _insert_all(
+    engine: AsyncEngine,
+    table: str,
+    new_id: Callable[[], uuid.UUID],
+    rows: int,
+    batch_size: int,
+) -> _Result:
+    stmt = text(f"INSERT INTO {table} (id) SELECT unnest(:ids)").bindparams(
+        bindparam("ids", type_=_UUID_ARRAY)
+    )
+    samples: list[float] = []
+
+    async with engine.connect() as conn:
+        started = time.perf_counter()
+        for offset in range(0, rows, batch_size):
+            ids = [new_id() for _ in range(min(batch_size, rows - offset))]
+            batch_started = time.perf_counter()
+            await conn.execute(stmt, {"ids": ids})
+            await conn.commit()
+            samples.append(time.perf_counter() - batch_started)
+        elapsed = time.perf_counter() - started
+
+        # Statistics reach the shared counters when this transaction ends
+        await conn.execute(text("SELECT pg_stat_force_next_flush()"))
+        await conn.commit()
+
+    async with engine.connect() as conn:
+        index_bytes, hit, read = (
+            await conn.execute(
+                text(
+                    "SELECT pg_relation_size(indexrelid), idx_blks_hit, idx_blks_read"
+                    " FROM pg_statio_user_indexes WHERE indexrelname = :index"
+                ),
+                {"index": f"{table}_pkey"},
+            )
+        ).one()
+
+    tail = samples[-max(1, len(samples) // 10) :]
+    tail_rows = min(rows, len(tail) * batch_size)
+    return _Result(
+        timings=Timings(name=table.removeprefix("bench_post_ids_"), samples=samples),
+        throughput=rows / elapsed,
+        tail_throughput=tail_rows / sum(tail),
+        index_bytes=index_bytes,
+        hit_ratio=hit / (hit + read) if hit + read else 1.0,
+    )
+
+
+async def main() -> None:
+    parser = make_parser(__doc__)
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--keep", action="store_true", help="keep scratch tables")
+    args = parser.parse_args()
+
+    engine = engine_from_args(args)
+    schemes: list[tuple[str, Callable[[], uuid.UUID]]] = [
+        ("bench_post_ids_uuid4", uuid.uuid4),
+        ("bench_post_ids_uuid7", uuid7),
+    ]
+    results: list[_Result] = []
+
+    try:
+        for table, new_id in schemes:
+            await _create(engine, table)
+            results.append(
+                await _insert_all(engine, table, new_id, args.rows, args.batch_size)
+            )
+    finally:
+        if not args.keep:
+            for table, _ in schemes:
+                await _drop(engine, table)
+        await engine.dispose()
+
+    for result in results:
+        print(result.report())
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
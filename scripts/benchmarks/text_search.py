@@ -0,0 +1,222 @@
+"""Latency of inline full-text search over a large seeded posts table.
+
+Seeds `--posts` active text posts of 12 random words each; one post in a
+hundred belongs to the querying benchmark user, the rest to another one.
+Then measures `search_posts_by_text` for a common word, a word being typed,
+a two-word query, a fragment from inside a word (trigram fallback) and a
+query that matches nothing. Only the querying user's posts are searched,
+so the other user's posts are there to make the matches by word common;
+the plan of the full-text lookup is printed so the index usage can be
+checked.
+
+Pass `--keep` to leave the seeded rows in place for the next run.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.domain.user.vo import UserId
+from src.infrastructure.db.factory import create_session_maker
+from src.infrastructure.db.models import UserModel
+from src.infrastructure.db.models.post import PostModel
+from src.infrastructure.db.repos.post import PostRepositoryImpl
+
+from ._common import Timings, engine_from_args, make_parser, measure
+
+# Far above real Telegram ids so the benchmark never touches real rows
+OWN_USER_ID = 9_200_000_000_000
+OTHER_USER_ID = 9_200_000_000_001
+SEED_CHUNK = 200_000
+
+WORDS = [
+    "summer",
+    "winter",
+    "spring",
+    "autumn",
+    "sale",
+    "discount",
+    "offer",
+    "price",
+    "free",
+    "new",
+    "best",
+    "top",
+    "daily",
+    "weekly",
+    "news",
+    "update",
+    "release",
+    "version",
+    "feature",
+    "guide",
+    "tutorial",
+    "tips",
+    "photo",
+    "video",
+    "music",
+    "movie",
+    "game",
+    "sport",
+    "football",
+    "travel",
+    "food",
+    "recipe",
+    "coffee",
+    "tea",
+    "city",
+    "beach",
+    "mountain",
+    "river",
+    "forest",
+    "garden",
+    "house",
+    "home",
+    "work",
+    "office",
+    "meeting",
+    "event",
+    "party",
+    "concert",
+    "ticket",
+    "invite",
+    "channel",
+    "group",
+    "chat",
+    "bot",
+    "link",
+]
+
+QUERIES = {
+    "common word": "sale",
+    "word being typed": "summ",
+    "two words": "summer sale",
+    "inner fragment": "ountai",
+    "no match": "zzzqqq",
+}
+
+
+async def _seed(session_maker: async_sessionmaker[AsyncSession], posts: int) -> None:
+    async with session_maker() as session:
+        await session.execute(
+            postgresql.insert(UserModel)
+            .values(
+                [
+                    {"id": OWN_USER_ID, "first_name": "Bench"},
+                    {"id": OTHER_USER_ID, "first_name": "Bench"},
+                ]
+            )
+            .on_conflict_do_nothing()
+        )
+        existing = await session.scalar(
+            select(func.count())
+            .select_from(PostModel)
+            .where(PostModel.owner_user_id.in_([OWN_USER_ID, OTHER_USER_ID]))
+        )
+        await session.commit()
+
+    for start in range(existing or 0, posts, SEED_CHUNK):
+        stop = min(start + SEED_CHUNK, posts)
+        async with session_maker() as session:
+            # The correlated `i` keeps the word subquery from running only once
+            await session.execute(
+                text(
+                    "INSERT INTO posts (id, owner_user_id, unique_key, content_type,"
+                    " text_md, buttons, status)"
+                    " SELECT gen_random_uuid(),"
+                    " CASE WHEN i % 100 = 0 THEN :own ELSE :other END,"
+                    " left(md5('text' || i), 8), 'text',"
+                    " (SELECT string_agg("
+                    "   w[1 + floor(random() * array_length(w, 1))::int], ' ')"
+                    "  FROM generate_series(1, 12) WHERE i IS NOT NULL),"
+                    " '[]', 'active'"
+                    " FROM generate_series(:start, :stop - 1) AS i,"
+                    " (SELECT CAST(:words AS text[]) AS w) AS vocabulary"
+                    " ON CONFLICT (unique_key) DO NOTHING"
+                ),
+                {
+                    "own": OWN_USER_ID,
+                    "other": OTHER_USER_ID,
+                    "words": list(WORDS),
+                    "start": start,
+                    "stop": stop,
+                },
+            )
+            await session.commit()
+        print(f"seeded {stop}/{posts}")
+
+    async with session_maker() as session:
+        await session.execute(text("ANALYZE posts"))
+        await session.commit()
+
+
+async def _cleanup(session_maker: async_sessionmaker[AsyncSession]) -> None:
+    owners = [OWN_USER_ID, OTHER_USER_ID]
+    async with session_maker() as session:
+        await session.execute(
+            delete(PostModel).where(PostModel.owner_user_id.in_(owners))
+        )
+        await session.execute(delete(UserModel).where(UserModel.id.in_(owners)))
+        await session.commit()
+
+
+async def _explain(session_maker: async_sessionmaker[AsyncSession]) -> str:
+    async with session_maker() as session:
+        rows = await session.execute(
+            text(
+                "EXPLAIN (ANALYZE, BUFFERS) SELECT id FROM posts"
+                " WHERE status = 'active'"
+                " AND text_tsv @@ to_tsquery('simple', 'summer:* & sale:*')"
+                " AND owner_user_id = :own"
+                " ORDER BY ts_rank(text_tsv, to_tsquery('simple', 'summer:* & sale:*'))"
+                " DESC LIMIT 10"
+            ),
+            {"own": OWN_USER_ID},
+        )
+        return "\n".join(row[0] for row in rows)
+
+
+def _bind(
+    session_maker: async_sessionmaker[AsyncSession], query: str
+) -> Callable[[int], Awaitable[None]]:
+    async def run(_: int) -> None:
+        async with session_maker() as session:
+            await PostRepositoryImpl(session).search_posts_by_text(
+                query, UserId(OWN_USER_ID), limit=10
+            )
+
+    return run
+
+
+async def main() -> None:
+    parser = make_parser(__doc__)
+    parser.add_argument("--posts", type=int, default=2_000_000)
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--keep", action="store_true", help="keep seeded posts")
+    args = parser.parse_args()
+
+    engine = engine_from_args(args)
+    session_maker = create_session_maker(engine)
+    results: list[Timings] = []
+
+    try:
+        await _seed(session_maker, args.posts)
+        print(await _explain(session_maker))
+
+        for name, query in QUERIES.items():
+            run = _bind(session_maker, query)
+            results.append(await measure(name, args.iterations, run))
+    finally:
+        if not args.keep:
+            await _cleanup(session_maker)
+        await engine.dispose()
+
+    for timings in results:
+        print(timings.report())
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,106 @@
+"""Per-update latency of the user write path: read-then-write vs. upsert.
+
+`before` replays the old UserService flow (get_user, then create_user or
+update_user, then commit); `after` runs the single-statement upsert_user.
+Each variant is measured for brand-new users and for returning users.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.domain.user import User
+from src.domain.user.vo import FirstName, UserId, Username
+from src.infrastructure.db.factory import create_session_maker
+from src.infrastructure.db.models import UserModel
+from src.infrastructure.db.repos import UserRepositoryImpl
+
+from ._common import Timings, engine_from_args, make_parser, measure
+
+# Far above real Telegram ids so the benchmark never touches real rows
+BASE_USER_ID = 9_000_000_000_000
+
+
+def _user(user_id: int) -> User:
+    now = datetime.now(UTC)
+    return User(
+        id=UserId(user_id),
+        first_name=FirstName("Bench"),
+        last_name=None,
+        username=Username(f"bench{user_id % 100_000}"),
+        bio=None,
+        created_at=now,
+        updated_at=now,
+        last_login_at=now,
+    )
+
+
+async def _read_then_write(
+    session_maker: async_sessionmaker[AsyncSession], user_id: int
+) -> None:
+    async with session_maker() as session:
+        repository = UserRepositoryImpl(session)
+        user = _user(user_id)
+        if await repository.get_user(user.id) is None:
+            await repository.create_user(user)
+        else:
+            await repository.update_user(user)
+        await session.commit()
+
+
+async def _upsert(
+    session_maker: async_sessionmaker[AsyncSession], user_id: int
+) -> None:
+    async with session_maker() as session:
+        await UserRepositoryImpl(session).upsert_user(_user(user_id))
+        await session.commit()
+
+
+async def _cleanup(session_maker: async_sessionmaker[AsyncSession]) -> None:
+    async with session_maker() as session:
+        await session.execute(delete(UserModel).where(UserModel.id >= BASE_USER_ID))
+        await session.commit()
+
+
+WriteFunc = Callable[[async_sessionmaker[AsyncSession], int], Awaitable[None]]
+
+
+def _bind(
+    write: WriteFunc, session_maker: async_sessionmaker[AsyncSession], offset: int
+) -> Callable[[int], Awaitable[None]]:
+    async def run(i: int) -> None:
+        await write(session_maker, offset + i)
+
+    return run
+
+
+async def main() -> None:
+    parser = make_parser(__doc__)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    engine = engine_from_args(args)
+    session_maker = create_session_maker(engine)
+    n = args.iterations
+    results: list[Timings] = []
+
+    try:
+        await _cleanup(session_maker)
+        for name, write in (("before", _read_then_write), ("after", _upsert)):
+            offset = BASE_USER_ID + (0 if name == "before" else n)
+            run = _bind(write, session_maker, offset)
+            results.append(await measure(f"{name}: new user", n, run))
+            results.append(await measure(f"{name}: returning user", n, run))
+    finally:
+        await _cleanup(session_maker)
+        await engine.dispose()
+
+    for timings in results:
+        print(timings.report())
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
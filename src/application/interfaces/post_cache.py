@@ -0,0 +1,20 @@
+from abc import abstractmethod
+from typing import Protocol
+
+from src.application.post.dtos import PostDetailDTO
+
+
+class PostLookupCache(Protocol):
+    """Process-local index of active posts by their unique key."""
+
+    @abstractmethod
+    def get(self, key: str) -> PostDetailDTO | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, value: PostDetailDTO) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def invalidate(self, key: str) -> None:
+        raise NotImplementedError
@@ -0,0 +1,19 @@
+from abc import abstractmethod
+from typing import Protocol
+
+
+class PostKeyAllocator(Protocol):
+    @abstractmethod
+    async def allocate(self) -> str:
+        """Hand out a key that has not been handed out before."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def mark_used(self, key: str) -> None:
+        """Report that `key` belongs to a post now, or turned out to be taken."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def release(self, key: str) -> None:
+        """Give back a key allocated for a post that was never created."""
+        raise NotImplementedError
@@ -0,0 +1,18 @@
+from abc import abstractmethod
+from typing import Protocol
+
+
+class PostKeyFilter(Protocol):
+    """Probabilistic set of every unique key ever allocated to a post.
+
+    False positives are possible, false negatives are not: a key reported
+    as absent is guaranteed to match no post.
+    """
+
+    @abstractmethod
+    def might_contain(self, key: str) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def add(self, key: str) -> None:
+        raise NotImplementedError
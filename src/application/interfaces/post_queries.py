@@ -0,0 +1,55 @@
+import uuid
+from abc import abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Protocol
+
+from src.application.post.dtos import PostDetailDTO, PostListItemDTO
+
+
+@dataclass(frozen=True)
+class PostCursor:
+    """Position of a post in a user's list, ordered by (created_at, id)."""
+
+    created_at: datetime
+    id: uuid.UUID
+
+
+class PostQueryService(Protocol):
+    """Read side of posts: answers with DTOs built from the selected columns."""
+
+    @abstractmethod
+    async def get_post_detail(self, post_id: uuid.UUID) -> PostDetailDTO | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def search_posts_by_key(
+        self,
+        prefix: str,
+        limit: int = 10,
+        after: str | None = None,
+        *,
+        owner_user_id: int | None = None,
+    ) -> list[PostDetailDTO]:
+        """Find active posts whose key starts with `prefix`, ordered by key.
+
+        With `after`, only keys sorting after it are returned (keyset paging).
+        With `owner_user_id`, only that user's posts are matched.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_user_posts(
+        self,
+        user_id: int,
+        limit: int = 10,
+        cursor: PostCursor | None = None,
+        *,
+        backward: bool = False,
+    ) -> tuple[list[PostListItemDTO], int]:
+        """Active posts of the user, newest first, and how many they have.
+
+        With `cursor`, only posts older than it are returned, or with
+        `backward` the `limit` posts right before it, still newest first.
+        """
+        raise NotImplementedError
@@ -0,0 +1,10 @@
+import uuid
+from abc import abstractmethod
+from typing import Protocol
+
+
+class PostShareRecorder(Protocol):
+    @abstractmethod
+    def record(self, post_id: uuid.UUID) -> None:
+        """Count one share of a post; persisted later in a batch."""
+        raise NotImplementedError
@@ -0,0 +1,11 @@
+from abc import abstractmethod
+from typing import Protocol
+
+from src.domain.user.repository import UserActivity
+
+
+class UserActivityRecorder(Protocol):
+    @abstractmethod
+    def record(self, activity: UserActivity) -> None:
+        """Remember that a user was seen; persisted later in a batch."""
+        raise NotImplementedError
@@ -1,24 +1,36 @@
 import re
+import unicodedata
 from dataclasses import dataclass
-from urllib.parse import urlparse
+from functools import lru_cache
 
 from src.domain.post.vo import ButtonStyle
 
 
+@dataclass(frozen=True)
+class ButtonDslIssue:
+    """A problem in the DSL text; line and column are 1-based."""
+
+    line: int
+    column: int
+    message: str
+
+    def __str__(self) -> str:
+        return f"Line {self.line}, column {self.column}: {self.message}"
+
+
 class ButtonDslError(Exception):
-    pass
+    def __init__(self, issues: list[ButtonDslIssue]) -> None:
+        self.issues = issues
+        super().__init__("\n".join(str(issue) for issue in issues))
 
 
-@dataclass
+@dataclass(frozen=True)
 class ParsedButton:
     text: str
     url: str
     style: ButtonStyle
 
 
-BUTTON_PATTERN = re.compile(r"\[([^\]]+)\]")
-VALID_STYLES = {s.value for s in ButtonStyle}
-
 # Russian → English color aliases for i18n support
 COLOR_ALIASES: dict[str, str] = {
     "красный": "red",
@@ -28,6 +40,24 @@ COLOR_ALIASES: dict[str, str] = {
     "обычный": "default",
 }
 
+# Lower-cased color name or alias → style, looked up once per button
+_STYLES: dict[str, ButtonStyle] = {s.value: s for s in ButtonStyle} | {
+    alias: ButtonStyle(value) for alias, value in COLOR_ALIASES.items()
+}
+
+# Distinct DSL texts kept parsed; a wizard session reuses a handful at most
+PARSE_CACHE_SIZE = 256
+
+# The host part of a URL, matched right after "://"
+_HOST = re.compile(r"[^/?#]*")
+
+_NO_BUTTONS = "Could not parse buttons. Example: [Text + https://url + green]"
+_MISSING_URL = (
+    "Each button must have at least text and URL. Example: [Text + https://url]"
+)
+_EMPTY_TEXT = "Button text cannot be empty."
+_UNCLOSED = 'Unclosed "[": end the button with "]".'
+
 
 def parse_buttons_dsl(raw: str) -> list[list[ParsedButton]]:
     """Parse DSL string into rows of buttons.
@@ -36,58 +66,104 @@ def parse_buttons_dsl(raw: str) -> list[list[ParsedButton]]:
     Each line is a new row.
     Color is optional, defaults to 'default'.
 
-    Raises ButtonDslError on invalid input.
+    Raises ButtonDslError listing every problem found, with its position.
+    Results are memoized by the raw text, so parsing the same DSL again only
+    copies the cached rows.
     """
-    rows: list[list[ParsedButton]] = []
-
-    for raw_line in raw.strip().splitlines():
-        line = raw_line.strip()
-        if not line:
-            continue
-
-        matches = BUTTON_PATTERN.findall(line)
-        if not matches:
-            msg = "Could not parse buttons. Example: [Text + https://url + green]"
-            raise ButtonDslError(msg)
-
-        row: list[ParsedButton] = []
-        for match in matches:
-            parts = [p.strip() for p in match.split("+")]
-
-            if len(parts) < 2:
-                msg = (
-                    "Each button must have at least text and URL. "
-                    "Example: [Text + https://url]"
-                )
-                raise ButtonDslError(msg)
-
-            text = parts[0]
-            url = parts[1]
-            style_str = parts[2] if len(parts) >= 3 else "default"
-
-            if not text:
-                msg = "Button text cannot be empty."
-                raise ButtonDslError(msg)
-
-            url = _validate_url(url, text)
-
-            style_str = style_str.lower()
-            style_str = COLOR_ALIASES.get(style_str, style_str)
-            if style_str not in VALID_STYLES:
-                msg = f'Unknown color "{style_str}". Use: default, green, blue, red.'
-                raise ButtonDslError(msg)
-
-            row.append(
-                ParsedButton(
-                    text=text,
-                    url=url,
-                    style=ButtonStyle(style_str),
-                )
-            )
-
-        rows.append(row)
-
-    return rows
+    return [list(row) for row in _parse_cached(raw)]
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_cached(raw: str) -> tuple[tuple[ParsedButton, ...], ...]:
+    # Errors are raised, not returned, so invalid input is never cached
+    rows: list[tuple[ParsedButton, ...]] = []
+    issues: list[ButtonDslIssue] = []
+
+    for lineno, line in enumerate(raw.splitlines(), start=1):
+        row = _parse_line(line, lineno, issues)
+        if row:
+            rows.append(row)
+
+    if issues:
+        raise ButtonDslError(issues)
+    return tuple(rows)
+
+
+def _parse_line(
+    line: str, lineno: int, issues: list[ButtonDslIssue]
+) -> tuple[ParsedButton, ...]:
+    """Scan one line left to right for `[...]` groups, ignoring text between."""
+    buttons: list[ParsedButton] = []
+    found = False
+
+    start = line.find("[")
+    while start != -1:
+        end = line.find("]", start + 1)
+        if end == -1:
+            found = True
+            issues.append(ButtonDslIssue(lineno, start + 1, _UNCLOSED))
+            break
+        # "[]" holds no button; scanning resumes right after its "["
+        if end > start + 1:
+            found = True
+            button = _parse_button(line, start + 1, end, lineno, issues)
+            if button is not None:
+                buttons.append(button)
+            start = line.find("[", end + 1)
+        else:
+            start = line.find("[", start + 1)
+
+    if not found and line.strip():
+        issues.append(ButtonDslIssue(lineno, _column(line, 0), _NO_BUTTONS))
+    return tuple(buttons)
+
+
+def _parse_button(
+    line: str, lo: int, hi: int, lineno: int, issues: list[ButtonDslIssue]
+) -> ParsedButton | None:
+    # Anything after a third "+" belongs to the color field and is ignored
+    fields = line[lo:hi].split("+", 3)
+
+    # Problems with the button as a whole point at its "["
+    if len(fields) < 2:
+        issues.append(ButtonDslIssue(lineno, lo, _MISSING_URL))
+        return None
+
+    valid = True
+    text = fields[0].strip()
+    if not text:
+        issues.append(ButtonDslIssue(lineno, lo, _EMPTY_TEXT))
+        valid = False
+
+    url = _normalize_url(fields[1].strip())
+    if not _is_valid_url(url):
+        column = _column(line, lo + len(fields[0]) + 1)
+        message = f'Invalid URL for button "{text}"'
+        issues.append(ButtonDslIssue(lineno, column, message))
+        valid = False
+
+    style = ButtonStyle.DEFAULT
+    if len(fields) > 2:
+        name = fields[2].strip().lower()
+        name = COLOR_ALIASES.get(name, name)
+        style = _STYLES.get(name)
+        if style is None:
+            column = _column(line, lo + len(fields[0]) + len(fields[1]) + 2)
+            message = f'Unknown color "{name}". Use: default, green, blue, red.'
+            issues.append(ButtonDslIssue(lineno, column, message))
+            valid = False
+
+    if not valid:
+        return None
+    return ParsedButton(text=text, url=url, style=style)
+
+
+def _column(line: str, offset: int) -> int:
+    """1-based column of the first non-blank character at or after offset."""
+    index = offset
+    while index < len(line) and line[index].isspace():
+        index += 1
+    return index + 1
 
 
 def _normalize_url(url: str) -> str:
@@ -96,13 +172,23 @@ def _normalize_url(url: str) -> str:
     return url
 
 
-def _validate_url(url: str, button_text: str) -> str:
-    url = _normalize_url(url)
-    try:
-        result = urlparse(url)
-        if not result.scheme or not result.netloc:
-            raise ValueError
-    except (ValueError, AttributeError):
-        msg = f'Invalid URL for button "{button_text}"'
-        raise ButtonDslError(msg) from None
-    return url
+def _is_valid_url(url: str) -> bool:
+    """Same verdict as urlparse yielding a scheme and a host, without parsing.
+
+    The URL is already normalized, so the scheme is always there and the host
+    runs from "://" to the first "/", "?" or "#". urlparse drops tabs, rejects
+    a "[" with no closing "]" (which can never occur inside a button) and
+    rejects hosts whose NFKC form gains URL delimiters.
+    """
+    host = _HOST.match(url, url.find("://") + 3).group()
+    if "\t" in host:
+        host = host.replace("\t", "")
+    if not host or "[" in host:
+        return False
+    return host.isascii() or _is_nfkc_safe(host)
+
+
+def _is_nfkc_safe(host: str) -> bool:
+    stripped = host.replace("@", "").replace(":", "")
+    normalized = unicodedata.normalize("NFKC", stripped)
+    return stripped == normalized or not any(c in normalized for c in "/?#@:")
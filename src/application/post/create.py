@@ -1,11 +1,13 @@
-import uuid
 from datetime import UTC, datetime
 
 from src.application.common.interactor import Interactor
 from src.application.common.transaction import TransactionManager
+from src.application.interfaces.post_key_allocator import PostKeyAllocator
+from src.application.interfaces.post_key_filter import PostKeyFilter
 from src.domain.post.entity import Post, PostButton
 from src.domain.post.repository import PostRepository
 from src.domain.post.vo import (
+    ButtonStyle,
     ContentType,
     PostStatus,
     TelegramFileId,
@@ -16,7 +18,7 @@ from src.domain.user.vo import UserId
 
 from .button_dsl import parse_buttons_dsl
 from .dtos import CreatePostInputDTO, CreatePostOutputDTO
-from .keygen import generate_unique_key
+from .ids import uuid7
 
 
 class CreatePostInteractor(Interactor[CreatePostInputDTO, CreatePostOutputDTO]):
@@ -24,9 +26,13 @@ class CreatePostInteractor(Interactor[CreatePostInputDTO, CreatePostOutputDTO]):
         self,
         post_repository: PostRepository,
         transaction_manager: TransactionManager,
+        key_filter: PostKeyFilter,
+        key_allocator: PostKeyAllocator,
     ) -> None:
         self.post_repository = post_repository
         self.transaction_manager = transaction_manager
+        self.key_filter = key_filter
+        self.key_allocator = key_allocator
 
     async def __call__(self, data: CreatePostInputDTO) -> CreatePostOutputDTO:
         content_type = ContentType(data.content_type)
@@ -51,23 +57,28 @@ class CreatePostInteractor(Interactor[CreatePostInputDTO, CreatePostOutputDTO]):
             msg = f"File is required for {content_type.value} posts"
             raise ValueError(msg)
 
-        # Parse buttons DSL
+        # Use pre-parsed buttons when given, parse the DSL otherwise
         buttons: list[list[PostButton]] = []
-        if data.buttons_dsl:
+        if data.buttons is not None:
+            buttons = [
+                [
+                    PostButton(text=btn.text, url=btn.url, style=ButtonStyle(btn.style))
+                    for btn in row
+                ]
+                for row in data.buttons
+            ]
+        elif data.buttons_dsl:
             parsed_rows = parse_buttons_dsl(data.buttons_dsl)
             buttons = [
                 [PostButton(text=btn.text, url=btn.url, style=btn.style) for btn in row]
                 for row in parsed_rows
             ]
 
-        # Generate unique key with retry
-        unique_key = await self._generate_unique_key()
-
         now = datetime.now(UTC)
         post = Post(
-            id=uuid.uuid4(),
+            id=uuid7(),
             owner_user_id=UserId(data.owner_user_id),
-            unique_key=UniqueKey(unique_key),
+            unique_key=UniqueKey(await self.key_allocator.allocate()),
             content_type=content_type,
             status=PostStatus.ACTIVE,
             created_at=now,
@@ -77,18 +88,29 @@ class CreatePostInteractor(Interactor[CreatePostInputDTO, CreatePostOutputDTO]):
             buttons=buttons,
         )
 
-        created_post = await self.post_repository.create_post(post)
-        await self.transaction_manager.commit()
+        try:
+            created_post = await self._insert(post)
+            await self.transaction_manager.commit()
+        except BaseException:
+            # Rolled back, so the key still belongs to no post
+            self.key_allocator.release(post.unique_key.value)
+            raise
+        self.key_allocator.mark_used(created_post.unique_key.value)
+        self.key_filter.add(created_post.unique_key.value)
 
         return CreatePostOutputDTO(
             unique_key=created_post.unique_key.value,
             post_id=created_post.id,
         )
 
-    async def _generate_unique_key(self, max_attempts: int = 10) -> str:
+    async def _insert(self, post: Post, max_attempts: int = 10) -> Post:
+        # Allocated keys never repeat, but may hit a key that was generated
+        # randomly before the sequence existed; such a key is just skipped
         for _ in range(max_attempts):
-            key = generate_unique_key()
-            if not await self.post_repository.key_exists(key):
-                return key
+            created_post = await self.post_repository.create_post(post)
+            if created_post is not None:
+                return created_post
+            self.key_allocator.mark_used(post.unique_key.value)
+            post.unique_key = UniqueKey(await self.key_allocator.allocate())
         msg = "Failed to generate unique key after multiple attempts"
         raise RuntimeError(msg)
@@ -3,7 +3,9 @@ from dataclasses import dataclass
 
 from src.application.common.interactor import Interactor
 from src.application.common.transaction import TransactionManager
+from src.application.interfaces.post_cache import PostLookupCache
 from src.domain.post.repository import PostRepository
+from src.domain.user.vo import UserId
 
 
 @dataclass
@@ -17,19 +19,56 @@ class DeletePostInteractor(Interactor[DeletePostInputDTO, bool]):
         self,
         post_repository: PostRepository,
         transaction_manager: TransactionManager,
+        post_cache: PostLookupCache,
     ) -> None:
         self.post_repository = post_repository
         self.transaction_manager = transaction_manager
+        self.post_cache = post_cache
 
     async def __call__(self, data: DeletePostInputDTO) -> bool:
-        post = await self.post_repository.get_post_by_id(data.post_id)
-        if post is None:
+        # Missing, foreign and already deleted posts all come back empty
+        keys = await self.post_repository.soft_delete_posts(
+            UserId(data.user_id), [data.post_id]
+        )
+        if not keys:
             return False
 
-        # Ownership check
-        if post.owner_user_id.value != data.user_id:
-            return False
-
-        await self.post_repository.soft_delete_post(data.post_id)
         await self.transaction_manager.commit()
+        self.post_cache.invalidate(keys[0])
         return True
+
+
+@dataclass
+class DeletePostsInputDTO:
+    user_id: int
+    # None deletes every active post of the user
+    post_ids: list[uuid.UUID] | None = None
+
+
+class DeletePostsInteractor(Interactor[DeletePostsInputDTO, int]):
+    """Delete several posts of a user, or all of them, in one statement."""
+
+    def __init__(
+        self,
+        post_repository: PostRepository,
+        transaction_manager: TransactionManager,
+        post_cache: PostLookupCache,
+    ) -> None:
+        self.post_repository = post_repository
+        self.transaction_manager = transaction_manager
+        self.post_cache = post_cache
+
+    async def __call__(self, data: DeletePostsInputDTO) -> int:
+        if data.post_ids is not None and not data.post_ids:
+            return 0
+
+        keys = await self.post_repository.soft_delete_posts(
+            UserId(data.user_id), data.post_ids
+        )
+        if not keys:
+            return 0
+
+        await self.transaction_manager.commit()
+        for key in keys:
+            self.post_cache.invalidate(key)
+        return len(keys)
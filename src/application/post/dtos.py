@@ -5,21 +5,6 @@ from datetime import datetime
 from src.domain.post.entity import Post
 
 
-@dataclass
-class CreatePostInputDTO:
-    owner_user_id: int
-    content_type: str
-    text_md: str | None = None
-    telegram_file_id: str | None = None
-    buttons_dsl: str | None = None
-
-
-@dataclass
-class CreatePostOutputDTO:
-    unique_key: str
-    post_id: uuid.UUID
-
-
 @dataclass
 class PostButtonDTO:
     text: str
@@ -38,6 +23,23 @@ class PostButtonDTO:
             return "danger"
 
 
+@dataclass
+class CreatePostInputDTO:
+    owner_user_id: int
+    content_type: str
+    text_md: str | None = None
+    telegram_file_id: str | None = None
+    buttons_dsl: str | None = None
+    # Rows already parsed from `buttons_dsl`; take precedence over the text
+    buttons: list[list[PostButtonDTO]] | None = None
+
+
+@dataclass
+class CreatePostOutputDTO:
+    unique_key: str
+    post_id: uuid.UUID
+
+
 @dataclass
 class PostListItemDTO:
     id: uuid.UUID
@@ -56,26 +58,24 @@ class PostDetailDTO:
     telegram_file_id: str | None
     buttons: list[list[PostButtonDTO]]
     created_at: datetime
+    updated_at: datetime
+    shares: int = 0
 
 
 @dataclass
 class PostListOutputDTO:
     items: list[PostListItemDTO]
     total: int
-    page: int
+    # Opaque cursors of the neighbouring pages, empty when there is none
+    prev_cursor: str = ""
+    next_cursor: str = ""
 
 
-def post_to_list_item(post: Post) -> PostListItemDTO:
-    text_preview = None
-    if post.text_md:
-        text_preview = post.text_md.value[:50]
-    return PostListItemDTO(
-        id=post.id,
-        unique_key=post.unique_key.value,
-        content_type=post.content_type.value,
-        text_preview=text_preview,
-        created_at=post.created_at,
-    )
+@dataclass
+class PostSearchPageDTO:
+    items: list[PostDetailDTO]
+    # Opaque cursor of the next page, empty when there is none
+    next_offset: str = ""
 
 
 def post_to_detail(post: Post) -> PostDetailDTO:
@@ -92,4 +92,6 @@ def post_to_detail(post: Post) -> PostDetailDTO:
         telegram_file_id=post.telegram_file_id.value if post.telegram_file_id else None,
         buttons=button_rows,
         created_at=post.created_at,
+        updated_at=post.updated_at,
+        shares=post.shares,
     )
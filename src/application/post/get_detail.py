@@ -2,9 +2,9 @@ import uuid
 from dataclasses import dataclass
 
 from src.application.common.interactor import Interactor
-from src.domain.post.repository import PostRepository
+from src.application.interfaces.post_queries import PostQueryService
 
-from .dtos import PostDetailDTO, post_to_detail
+from .dtos import PostDetailDTO
 
 
 @dataclass
@@ -13,11 +13,8 @@ class GetPostDetailInputDTO:
 
 
 class GetPostDetailInteractor(Interactor[GetPostDetailInputDTO, PostDetailDTO | None]):
-    def __init__(self, post_repository: PostRepository) -> None:
-        self.post_repository = post_repository
+    def __init__(self, post_queries: PostQueryService) -> None:
+        self.post_queries = post_queries
 
     async def __call__(self, data: GetPostDetailInputDTO) -> PostDetailDTO | None:
-        post = await self.post_repository.get_post_by_id(data.post_id)
-        if post is None:
-            return None
-        return post_to_detail(post)
+        return await self.post_queries.get_post_detail(data.post_id)
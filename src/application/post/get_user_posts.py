@@ -1,35 +1,83 @@
+import base64
+import binascii
+import struct
+import uuid
 from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
 
 from src.application.common.interactor import Interactor
-from src.domain.post.repository import PostRepository
-from src.domain.user.vo import UserId
+from src.application.interfaces.post_queries import PostCursor, PostQueryService
 
-from .dtos import PostListOutputDTO, post_to_list_item
+from .dtos import PostListItemDTO, PostListOutputDTO
 
 POSTS_PER_PAGE = 10
 
+# Direction marker, then created_at in microseconds and the id, base64url:
+# 33 characters, small enough for Telegram's 64-byte callback data
+_NEXT = "n"
+_PREV = "p"
+_CURSOR = struct.Struct(">q16s")
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+def encode_cursor(post: PostListItemDTO, *, backward: bool = False) -> str:
+    micros = (post.created_at - _EPOCH) // timedelta(microseconds=1)
+    packed = _CURSOR.pack(micros, post.id.bytes)
+    encoded = base64.urlsafe_b64encode(packed).decode().rstrip("=")
+    return (_PREV if backward else _NEXT) + encoded
+
+
+def decode_cursor(raw: str) -> tuple[PostCursor, bool] | None:
+    """Cursor and whether it pages backward; None for anything malformed."""
+    if len(raw) < 2 or raw[0] not in (_NEXT, _PREV):
+        return None
+    try:
+        packed = base64.urlsafe_b64decode(raw[1:] + "=" * (-len(raw[1:]) % 4))
+        micros, id_bytes = _CURSOR.unpack(packed)
+        created_at = _EPOCH + timedelta(microseconds=micros)
+    except (binascii.Error, struct.error, ValueError, OverflowError):
+        return None
+    return PostCursor(created_at=created_at, id=uuid.UUID(bytes=id_bytes)), (
+        raw[0] == _PREV
+    )
+
 
 @dataclass
 class GetUserPostsInputDTO:
     user_id: int
-    page: int = 1
+    cursor: str = ""
 
 
 class GetUserPostsInteractor(Interactor[GetUserPostsInputDTO, PostListOutputDTO]):
-    def __init__(self, post_repository: PostRepository) -> None:
-        self.post_repository = post_repository
+    def __init__(self, post_queries: PostQueryService) -> None:
+        self.post_queries = post_queries
 
     async def __call__(self, data: GetUserPostsInputDTO) -> PostListOutputDTO:
-        user_id = UserId(data.user_id)
-        offset = (data.page - 1) * POSTS_PER_PAGE
+        decoded = decode_cursor(data.cursor) if data.cursor else None
+        cursor, backward = decoded if decoded is not None else (None, False)
 
-        posts = await self.post_repository.get_user_posts(
-            user_id=user_id, offset=offset, limit=POSTS_PER_PAGE
+        # One extra row tells whether there is a page beyond this one
+        posts, total = await self.post_queries.get_user_posts(
+            user_id=data.user_id,
+            limit=POSTS_PER_PAGE + 1,
+            cursor=cursor,
+            backward=backward,
         )
-        total = await self.post_repository.count_user_posts(user_id)
+        has_more = len(posts) > POSTS_PER_PAGE
+        if backward:
+            posts = posts[-POSTS_PER_PAGE:]
+            has_prev, has_next = has_more, bool(posts)
+        else:
+            posts = posts[:POSTS_PER_PAGE]
+            has_prev, has_next = cursor is not None and bool(posts), has_more
+
+        # The posts around a cursor may have been deleted meanwhile
+        if not posts and cursor is not None:
+            return await self(GetUserPostsInputDTO(user_id=data.user_id))
 
         return PostListOutputDTO(
-            items=[post_to_list_item(p) for p in posts],
+            items=posts,
             total=total,
-            page=data.page,
+            prev_cursor=encode_cursor(posts[0], backward=True) if has_prev else "",
+            next_cursor=encode_cursor(posts[-1]) if has_next else "",
         )
@@ -0,0 +1,57 @@
+"""Time-ordered post ids (UUID version 7, RFC 9562)."""
+
+import os
+import time
+import uuid
+
+# 42-bit counter split over rand_a (top 12 bits) and rand_b (low 30 bits)
+_COUNTER_BITS = 42
+_COUNTER_MAX = (1 << _COUNTER_BITS) - 1
+# A fresh millisecond seeds the counter with its top bit clear, leaving at
+# least 2**41 increments before it overflows into the next millisecond
+_COUNTER_SEED_MASK = _COUNTER_MAX >> 1
+_VERSION_7_FLAGS = (7 << 76) | (0b10 << 62)
+
+_last_timestamp_ms = -1
+_last_counter = 0
+
+
+def uuid7() -> uuid.UUID:
+    """A UUIDv7: 48-bit Unix milliseconds, a counter and 32 random bits.
+
+    Ids made by one process are strictly increasing, even within a
+    millisecond or when the wall clock steps back, so consecutive inserts
+    land on the rightmost page of the primary key index instead of a random
+    one. Same layout as `uuid.uuid7` from Python 3.14.
+    """
+    global _last_timestamp_ms, _last_counter
+
+    timestamp_ms = time.time_ns() // 1_000_000
+    if timestamp_ms > _last_timestamp_ms:
+        counter, tail = _random_counter_and_tail()
+    else:
+        timestamp_ms = _last_timestamp_ms
+        counter = _last_counter + 1
+        tail = int.from_bytes(os.urandom(4))
+        if counter > _COUNTER_MAX:
+            timestamp_ms += 1
+            counter, tail = _random_counter_and_tail()
+
+    _last_timestamp_ms, _last_counter = timestamp_ms, counter
+    return uuid.UUID(
+        int=(timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+        | (counter >> 30) << 64
+        | (counter & 0x3FFF_FFFF) << 32
+        | tail
+        | _VERSION_7_FLAGS
+    )
+
+
+def uuid7_timestamp_ms(value: uuid.UUID) -> int:
+    """Unix milliseconds a UUIDv7 was made at."""
+    return value.int >> 80
+
+
+def _random_counter_and_tail() -> tuple[int, int]:
+    rand = int.from_bytes(os.urandom(10))
+    return (rand >> 32) & _COUNTER_SEED_MASK, rand & 0xFFFF_FFFF
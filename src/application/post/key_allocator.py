@@ -0,0 +1,25 @@
+from src.application.interfaces.post_key_allocator import PostKeyAllocator
+from src.domain.post.repository import PostRepository
+
+from .keygen import KeyPermutation
+
+
+class SequenceKeyAllocator(PostKeyAllocator):
+    """Permutes the next number of the key sequence; one query per key."""
+
+    def __init__(
+        self, post_repository: PostRepository, key_permutation: KeyPermutation
+    ) -> None:
+        self.post_repository = post_repository
+        self.key_permutation = key_permutation
+
+    async def allocate(self) -> str:
+        number = await self.post_repository.next_key_number()
+        return self.key_permutation.key_for(number)
+
+    def mark_used(self, key: str) -> None:
+        pass
+
+    def release(self, key: str) -> None:
+        # A skipped sequence number costs nothing
+        pass
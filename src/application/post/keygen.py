@@ -1,10 +1,69 @@
+import hashlib
 import secrets
 import string
 
 ALPHABET = string.ascii_lowercase + string.digits
 KEY_LENGTH = 8
+KEY_SPACE = len(ALPHABET) ** KEY_LENGTH
+
+# Smallest even bit width covering KEY_SPACE, split into two Feistel halves
+_HALF_BITS = 21
+_HALF_MASK = (1 << _HALF_BITS) - 1
+_FEISTEL_ROUNDS = 4
+
+
+class KeyPermutation:
+    """Keyed bijection from sequence numbers onto 8-char keys.
+
+    A Feistel network permutes 42-bit integers; results outside the key
+    space are fed through it again (cycle walking) until they land inside,
+    which keeps the mapping one-to-one on [0, KEY_SPACE). Consecutive
+    numbers thus give distinct keys that look random without the secret.
+    """
+
+    def __init__(self, secret: bytes) -> None:
+        self._secret = hashlib.blake2b(secret, person=b"post-keys").digest()
+
+    def key_for(self, number: int) -> str:
+        if not 0 <= number < KEY_SPACE:
+            msg = f"Key number {number} is outside the key space"
+            raise ValueError(msg)
+
+        value = self._encrypt(number)
+        while value >= KEY_SPACE:
+            value = self._encrypt(value)
+
+        chars = []
+        for _ in range(KEY_LENGTH):
+            value, index = divmod(value, len(ALPHABET))
+            chars.append(ALPHABET[index])
+        return "".join(chars)
+
+    def _encrypt(self, value: int) -> int:
+        left, right = value >> _HALF_BITS, value & _HALF_MASK
+        for round_index in range(_FEISTEL_ROUNDS):
+            left, right = right, left ^ self._round(round_index, right)
+        return (left << _HALF_BITS) | right
+
+    def _round(self, round_index: int, half: int) -> int:
+        digest = hashlib.blake2b(
+            half.to_bytes(3, "big") + bytes([round_index]),
+            key=self._secret,
+            digest_size=4,
+        ).digest()
+        return int.from_bytes(digest, "big") & _HALF_MASK
 
 
 def generate_unique_key() -> str:
     """Generate a cryptographically random 8-char key from [a-z0-9]."""
     return "".join(secrets.choice(ALPHABET) for _ in range(KEY_LENGTH))
+
+
+def is_valid_key(key: str) -> bool:
+    """Check that `key` could have been produced by `generate_unique_key`."""
+    return len(key) == KEY_LENGTH and is_valid_key_prefix(key)
+
+
+def is_valid_key_prefix(prefix: str) -> bool:
+    """Check that some generated key could start with `prefix`."""
+    return 0 < len(prefix) <= KEY_LENGTH and all(char in ALPHABET for char in prefix)
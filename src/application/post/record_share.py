@@ -0,0 +1,19 @@
+import uuid
+from dataclasses import dataclass
+
+from src.application.common.interactor import Interactor
+from src.application.interfaces.post_shares import PostShareRecorder
+
+
+@dataclass
+class RecordPostShareInputDTO:
+    post_id: uuid.UUID
+
+
+class RecordPostShareInteractor(Interactor[RecordPostShareInputDTO, None]):
+    def __init__(self, share_recorder: PostShareRecorder) -> None:
+        self.share_recorder = share_recorder
+
+    async def __call__(self, data: RecordPostShareInputDTO) -> None:
+        # Buffered: a burst of shares of one post becomes a single row update
+        self.share_recorder.record(data.post_id)
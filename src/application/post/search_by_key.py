@@ -1,28 +1,77 @@
 from dataclasses import dataclass
 
 from src.application.common.interactor import Interactor
-from src.domain.post.repository import PostRepository
+from src.application.interfaces.post_cache import PostLookupCache
+from src.application.interfaces.post_key_filter import PostKeyFilter
+from src.application.interfaces.post_queries import PostQueryService
 
-from .dtos import PostDetailDTO, post_to_detail
+from .dtos import PostSearchPageDTO
+from .keygen import KEY_LENGTH, is_valid_key, is_valid_key_prefix
+
+# Shorter prefixes match too much of the keyspace to be a useful share lookup
+MIN_PREFIX_LENGTH = 3
+SEARCH_LIMIT = 10
 
 
 @dataclass
 class SearchPostsByKeyInputDTO:
     query: str
+    # Who is searching: a partial key only matches their own posts
+    user_id: int
+    # next_offset of the previous page, as echoed back by Telegram
+    offset: str = ""
 
 
 class SearchPostsByKeyInteractor(
-    Interactor[SearchPostsByKeyInputDTO, list[PostDetailDTO]]
+    Interactor[SearchPostsByKeyInputDTO, PostSearchPageDTO]
 ):
-    def __init__(self, post_repository: PostRepository) -> None:
-        self.post_repository = post_repository
+    def __init__(
+        self,
+        post_queries: PostQueryService,
+        post_cache: PostLookupCache,
+        key_filter: PostKeyFilter,
+    ) -> None:
+        self.post_queries = post_queries
+        self.post_cache = post_cache
+        self.key_filter = key_filter
 
-    async def __call__(self, data: SearchPostsByKeyInputDTO) -> list[PostDetailDTO]:
+    async def __call__(self, data: SearchPostsByKeyInputDTO) -> PostSearchPageDTO:
         query = data.query.strip().lower()
-        if not query:
-            return []
+        if len(query) < MIN_PREFIX_LENGTH or not is_valid_key_prefix(query):
+            return PostSearchPageDTO(items=[])
+
+        if len(query) < KEY_LENGTH:
+            return await self._search_prefix(query, data.user_id, data.offset)
+
+        cached = self.post_cache.get(query)
+        if cached is not None:
+            return PostSearchPageDTO(items=[cached])
+
+        if not self.key_filter.might_contain(query):
+            return PostSearchPageDTO(items=[])
+
+        details = await self.post_queries.search_posts_by_key(prefix=query, limit=1)
+        # A full-length prefix is an exact key, so at most one post matches
+        if details:
+            self.post_cache.set(query, details[0])
+        return PostSearchPageDTO(items=details)
+
+    async def _search_prefix(
+        self, prefix: str, user_id: int, offset: str
+    ) -> PostSearchPageDTO:
+        # The cursor is the last key of the previous page
+        after = None
+        if offset:
+            if not (is_valid_key(offset) and offset.startswith(prefix)):
+                return PostSearchPageDTO(items=[])
+            after = offset
 
-        posts = await self.post_repository.search_posts_by_key(
-            unique_key=query, limit=10
+        # Only a full key is a capability to read someone else's post; paging
+        # through prefixes would otherwise enumerate every post. One extra
+        # row tells whether another page exists.
+        posts = await self.post_queries.search_posts_by_key(
+            prefix=prefix, limit=SEARCH_LIMIT + 1, after=after, owner_user_id=user_id
         )
-        return [post_to_detail(p) for p in posts]
+        page = posts[:SEARCH_LIMIT]
+        next_offset = page[-1].unique_key if len(posts) > SEARCH_LIMIT else ""
+        return PostSearchPageDTO(items=page, next_offset=next_offset)
@@ -0,0 +1,35 @@
+from dataclasses import dataclass
+
+from src.application.common.interactor import Interactor
+from src.domain.post.repository import PostRepository
+from src.domain.user.vo import UserId
+
+from .dtos import PostSearchPageDTO, post_to_detail
+
+# Trigram matching needs at least three characters to use its index
+MIN_QUERY_LENGTH = 3
+SEARCH_LIMIT = 10
+
+
+@dataclass
+class SearchPostsByTextInputDTO:
+    query: str
+    user_id: int
+
+
+class SearchPostsByTextInteractor(
+    Interactor[SearchPostsByTextInputDTO, PostSearchPageDTO]
+):
+    def __init__(self, post_repository: PostRepository) -> None:
+        self.post_repository = post_repository
+
+    async def __call__(self, data: SearchPostsByTextInputDTO) -> PostSearchPageDTO:
+        query = " ".join(data.query.split())
+        if len(query) < MIN_QUERY_LENGTH:
+            return PostSearchPageDTO(items=[])
+
+        # Ranked results have no stable keyset, so a single page
+        posts = await self.post_repository.search_posts_by_text(
+            query=query, user_id=UserId(data.user_id), limit=SEARCH_LIMIT
+        )
+        return PostSearchPageDTO(items=[post_to_detail(p) for p in posts])
@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+
+from src.application.common.interactor import Interactor
+from src.domain.post.repository import PostRepository
+
+
+@dataclass
+class TopSharedPostDTO:
+    unique_key: str
+    content_type: str
+    text_preview: str | None
+    shares: int
+
+
+class GetTopSharedPostsInteractor(Interactor[int, list[TopSharedPostDTO]]):
+    def __init__(self, post_repository: PostRepository) -> None:
+        self.post_repository = post_repository
+
+    async def __call__(self, data: int = 10) -> list[TopSharedPostDTO]:
+        posts = await self.post_repository.get_top_shared_posts(limit=data)
+
+        return [
+            TopSharedPostDTO(
+                unique_key=p.unique_key.value,
+                content_type=p.content_type.value,
+                text_preview=p.text_md.value[:50] if p.text_md else None,
+                shares=p.shares,
+            )
+            for p in posts
+        ]
@@ -1,3 +1,9 @@
+from .get_language import GetUserLanguageDTO, GetUserLanguageInteractor
 from .update_language import UpdateLanguageDTO, UpdateLanguageInteractor
 
-__all__ = ["UpdateLanguageDTO", "UpdateLanguageInteractor"]
+__all__ = [
+    "GetUserLanguageDTO",
+    "GetUserLanguageInteractor",
+    "UpdateLanguageDTO",
+    "UpdateLanguageInteractor",
+]
@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+
+from src.application.common.interactor import Interactor
+from src.domain.user import UserRepository
+from src.domain.user.vo import UserId
+
+
+@dataclass(frozen=True)
+class GetUserLanguageDTO:
+    user_id: UserId
+
+
+class GetUserLanguageInteractor(Interactor[GetUserLanguageDTO, str | None]):
+    def __init__(self, user_repository: UserRepository) -> None:
+        self._user_repository = user_repository
+
+    async def __call__(self, data: GetUserLanguageDTO) -> str | None:
+        language_code = await self._user_repository.get_language(data.user_id)
+        return language_code.value if language_code else None
@@ -27,3 +27,4 @@ class Post:
     telegram_file_id: TelegramFileId | None = None
     buttons: list[list[PostButton]] = field(default_factory=list)
     deleted_at: datetime | None = None
+    shares: int = 0
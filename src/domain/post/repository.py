@@ -1,5 +1,6 @@
 import uuid
 from abc import abstractmethod
+from collections.abc import AsyncIterator, Mapping
 from typing import Protocol
 
 from src.domain.user.vo import UserId
@@ -9,7 +10,13 @@ from .entity import Post
 
 class PostRepository(Protocol):
     @abstractmethod
-    async def create_post(self, post: Post) -> Post:
+    async def create_post(self, post: Post) -> Post | None:
+        """Insert `post`; returns None when its unique key is already taken."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def next_key_number(self) -> int:
+        """Draw the next never-used number for key allocation."""
         raise NotImplementedError
 
     @abstractmethod
@@ -21,23 +28,38 @@ class PostRepository(Protocol):
         raise NotImplementedError
 
     @abstractmethod
-    async def search_posts_by_key(self, unique_key: str, limit: int = 10) -> list[Post]:
+    async def search_posts_by_text(
+        self, query: str, user_id: UserId, limit: int = 10
+    ) -> list[Post]:
+        """Search the text of the user's own active posts, best match first."""
         raise NotImplementedError
 
     @abstractmethod
-    async def get_user_posts(
-        self, user_id: UserId, offset: int = 0, limit: int = 10
-    ) -> list[Post]:
+    async def soft_delete_posts(
+        self, owner_user_id: UserId, post_ids: list[uuid.UUID] | None = None
+    ) -> list[str]:
+        """Mark the owner's active posts deleted, all of them when no ids given.
+
+        Posts of other users and posts already deleted are left alone. The
+        owner's counter drops by the number deleted. Returns their keys.
+        """
         raise NotImplementedError
 
     @abstractmethod
-    async def count_user_posts(self, user_id: UserId) -> int:
+    async def key_exists(self, key: str) -> bool:
         raise NotImplementedError
 
     @abstractmethod
-    async def soft_delete_post(self, post_id: uuid.UUID) -> None:
+    def iter_unique_keys(self, batch_size: int = 10_000) -> AsyncIterator[str]:
+        """Stream every allocated key, deleted posts included."""
         raise NotImplementedError
 
     @abstractmethod
-    async def key_exists(self, key: str) -> bool:
+    async def add_shares(self, shares: Mapping[uuid.UUID, int]) -> int:
+        """Add share counts per post id in one statement; returns rows updated."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_top_shared_posts(self, limit: int = 10) -> list[Post]:
+        """Active posts with at least one share, most shared first."""
         raise NotImplementedError
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 
 from .vo import Bio, FirstName, LanguageCode, LastName, ReferralCount, UserId, Username
@@ -17,9 +17,13 @@ class User:
     referred_by: UserId | None = None
     referral_count: ReferralCount | None = None
     language_code: LanguageCode | None = None
+    # Set by upserts that can tell an INSERT from an UPDATE in one statement
+    inserted: bool | None = field(default=None, compare=False, repr=False)
 
     @property
     def is_new(self) -> bool:
+        if self.inserted is not None:
+            return self.inserted
         return self.created_at == self.last_login_at
 
     def __str__(self) -> str:
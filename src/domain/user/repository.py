@@ -1,5 +1,7 @@
 from abc import abstractmethod
+from collections.abc import Sequence
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Protocol, overload
 
 from src.domain.user.entity import User
@@ -21,6 +23,17 @@ class TopReferrer:
     referral_count: int
 
 
+@dataclass(frozen=True)
+class UserActivity:
+    """Snapshot of a user's Telegram profile at the moment they were seen."""
+
+    user_id: int
+    username: str | None
+    first_name: str
+    last_name: str | None
+    seen_at: datetime
+
+
 class UserRepository(Protocol):
     @overload
     async def get_user(self, identifier: UserId) -> User | None: ...
@@ -32,6 +45,14 @@ class UserRepository(Protocol):
     async def get_user(self, identifier: UserId | Username) -> User | None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_language(self, user_id: UserId) -> LanguageCode | None:
+        """Get the saved language without loading the whole user.
+
+        Returns None for unknown users and users who never picked one.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def create_user(self, user: User) -> User:
         raise NotImplementedError
@@ -40,6 +61,23 @@ class UserRepository(Protocol):
     async def update_user(self, user: User) -> User:
         raise NotImplementedError
 
+    @abstractmethod
+    async def upsert_user(self, user: User) -> User:
+        """Insert or update the user's profile in one atomic statement.
+
+        The returned entity has `inserted` set, so `is_new` is known without
+        reading the row first.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def bulk_upsert_activity(self, activities: Sequence[UserActivity]) -> int:
+        """Persist buffered activity for many users in a single statement.
+
+        Returns the number of rows actually written; unchanged rows are skipped.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def delete_user(self, user_id: UserId) -> None: ...
 
@@ -0,0 +1,16 @@
+from .bloom import BloomFilter, BloomFilterStats, PostKeyBloomFilter
+from .lru import CacheStats, LRUCache
+from .post import PostDetailCache
+from .user import CachedUserRepository, UserCache, UserLanguageCache
+
+__all__ = [
+    "BloomFilter",
+    "BloomFilterStats",
+    "CacheStats",
+    "CachedUserRepository",
+    "LRUCache",
+    "PostDetailCache",
+    "PostKeyBloomFilter",
+    "UserCache",
+    "UserLanguageCache",
+]
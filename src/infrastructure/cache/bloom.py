@@ -0,0 +1,69 @@
+import hashlib
+import math
+from dataclasses import dataclass
+
+from src.application.interfaces.post_key_filter import PostKeyFilter
+
+
+@dataclass
+class BloomFilterStats:
+    checks: int = 0
+    negatives: int = 0
+
+    @property
+    def negative_rate(self) -> float:
+        return self.negatives / self.checks if self.checks else 0.0
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings.
+
+    Sized for `capacity` items at the given false-positive rate; adding more
+    items keeps it correct but raises the false-positive rate. Positions come
+    from double hashing of a single blake2b digest.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+
+        self.capacity = capacity
+        self._size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self._hash_count = max(1, round(self._size / capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+        self._count = 0
+        self.stats = BloomFilterStats()
+
+    def __len__(self) -> int:
+        """Number of items added, duplicates included."""
+        return self._count
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self._count += 1
+
+    def might_contain(self, item: str) -> bool:
+        self.stats.checks += 1
+        for position in self._positions(item):
+            if not self._bits[position >> 3] & (1 << (position & 7)):
+                self.stats.negatives += 1
+                return False
+        return True
+
+    def _positions(self, item: str) -> list[int]:
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return [(first + i * second) % self._size for i in range(self._hash_count)]
+
+
+class PostKeyBloomFilter(BloomFilter, PostKeyFilter):
+    """Bloom filter of post keys, a negative cache for exact-key inline lookups.
+
+    Filled with every stored key on startup and fed each newly created one.
+    Keys of deleted posts stay in: a Bloom filter cannot remove entries, and
+    a stale key only costs one lookup that finds nothing.
+    """
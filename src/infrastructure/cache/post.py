@@ -0,0 +1,12 @@
+from src.application.interfaces.post_cache import PostLookupCache
+from src.application.post.dtos import PostDetailDTO
+
+from .lru import LRUCache
+
+
+class PostDetailCache(LRUCache[str, PostDetailDTO], PostLookupCache):
+    """Process-wide cache of ready inline results keyed by unique_key.
+
+    Active posts never change, so entries only go away when the post is
+    deleted, evicted, or (for deletions made by another process) expire.
+    """
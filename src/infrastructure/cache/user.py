@@ -0,0 +1,173 @@
+from collections.abc import Sequence
+from dataclasses import replace
+
+from src.application.interfaces.user_activity import UserActivityRecorder
+from src.domain.user.entity import User
+from src.domain.user.repository import (
+    ReferralStats,
+    TopReferrer,
+    UserActivity,
+    UserRepository,
+)
+from src.domain.user.vo import LanguageCode, UserId, Username
+from src.infrastructure.db.transaction import CommitHooks
+
+from .lru import LRUCache
+
+
+class UserCache(LRUCache[int, User]):
+    """Process-wide cache of user entities keyed by Telegram user id."""
+
+
+class UserLanguageCache(LRUCache[int, LanguageCode | None]):
+    """Process-wide map of Telegram user id to the saved language.
+
+    A cached None means the user has no saved language (or no row at all),
+    so unknown users are not looked up again until the entry expires.
+    """
+
+
+class CachedUserRepository(UserRepository):
+    """Read-through cache in front of another UserRepository.
+
+    Lookups by UserId are served from the shared cache. Writes only take
+    effect on the cache once their transaction commits, through the
+    session's commit hooks: a rolled-back write leaves the cache alone, and
+    an entry dropped before commit cannot be filled again with the old row.
+    Until then, users written in this transaction are read past the cache.
+
+    The cache holds its own copies, never the entities handed to callers or
+    kept in the identity map, so in-place changes to those stay within the
+    request that made them.
+
+    Upserts of cached users are write-behind: the profile snapshot goes to
+    the activity recorder and is persisted by its next batched flush.
+
+    Saved languages are kept in a separate, much cheaper map that is filled
+    from every user read, so locale lookups rarely reach the database.
+    """
+
+    def __init__(
+        self,
+        repository: UserRepository,
+        cache: UserCache,
+        activity_recorder: UserActivityRecorder,
+        language_cache: UserLanguageCache,
+        commit_hooks: CommitHooks,
+    ) -> None:
+        self._repository = repository
+        self._cache = cache
+        self._activity_recorder = activity_recorder
+        self._language_cache = language_cache
+        self._commit_hooks = commit_hooks
+        # Users written in the current transaction
+        self._written: set[int] = set()
+
+    async def get_user(self, identifier: UserId | Username) -> User | None:
+        if not isinstance(identifier, UserId) or identifier.value in self._written:
+            return await self._repository.get_user(identifier)
+
+        user = self._cache.get(identifier.value)
+        if user is not None:
+            return replace(user)
+
+        user = await self._repository.get_user(identifier)
+        if user is not None:
+            self._remember(user)
+        return user
+
+    async def get_language(self, user_id: UserId) -> LanguageCode | None:
+        if user_id.value in self._written:
+            return await self._repository.get_language(user_id)
+        if user_id.value in self._language_cache:
+            return self._language_cache.get(user_id.value)
+
+        language_code = await self._repository.get_language(user_id)
+        self._language_cache.set(user_id.value, language_code)
+        return language_code
+
+    async def create_user(self, user: User) -> User:
+        created = await self._repository.create_user(user)
+        self._after_commit(user.id, remember=created)
+        return created
+
+    async def update_user(self, user: User) -> User:
+        updated = await self._repository.update_user(user)
+        self._after_commit(user.id)
+        return updated
+
+    async def upsert_user(self, user: User) -> User:
+        cached = self._cache.get(user.id.value)
+        if cached is None or user.id.value in self._written:
+            upserted = await self._repository.upsert_user(user)
+            self._after_commit(user.id, remember=replace(upserted, inserted=None))
+            return upserted
+
+        self._activity_recorder.record(
+            UserActivity(
+                user_id=user.id.value,
+                username=user.username.value if user.username else None,
+                first_name=user.first_name.value,
+                last_name=user.last_name.value if user.last_name else None,
+                seen_at=user.last_login_at,
+            )
+        )
+        updated = replace(
+            cached,
+            first_name=user.first_name,
+            last_name=user.last_name,
+            username=user.username,
+            updated_at=user.updated_at,
+            last_login_at=user.last_login_at,
+            inserted=None,
+        )
+        # Later reads see the snapshot the buffer is about to write
+        self._remember(updated)
+        return replace(updated, inserted=False)
+
+    async def bulk_upsert_activity(self, activities: Sequence[UserActivity]) -> int:
+        return await self._repository.bulk_upsert_activity(activities)
+
+    async def delete_user(self, user_id: UserId) -> None:
+        await self._repository.delete_user(user_id)
+        self._after_commit(user_id)
+
+    async def set_referred_by(self, user_id: UserId, referrer_id: UserId) -> None:
+        await self._repository.set_referred_by(user_id, referrer_id)
+        self._after_commit(user_id)
+
+    async def increment_referral_count(self, user_id: UserId) -> None:
+        await self._repository.increment_referral_count(user_id)
+        self._after_commit(user_id)
+
+    async def get_referral_stats(self) -> ReferralStats:
+        return await self._repository.get_referral_stats()
+
+    async def get_top_referrers(self, limit: int = 10) -> list[TopReferrer]:
+        return await self._repository.get_top_referrers(limit)
+
+    async def update_language(
+        self, user_id: UserId, language_code: LanguageCode
+    ) -> None:
+        await self._repository.update_language(user_id, language_code)
+        self._after_commit(user_id)
+
+    def _after_commit(self, user_id: UserId, remember: User | None = None) -> None:
+        """Drop the user's entries, or replace them, once the write commits."""
+        self._written.add(user_id.value)
+        # Copied now: the caller may change its entity before the commit
+        snapshot = replace(remember) if remember is not None else None
+
+        def apply() -> None:
+            self._written.discard(user_id.value)
+            if snapshot is not None:
+                self._remember(snapshot)
+            else:
+                self._cache.invalidate(user_id.value)
+                self._language_cache.invalidate(user_id.value)
+
+        self._commit_hooks.after_commit(apply)
+
+    def _remember(self, user: User) -> None:
+        self._cache.set(user.id.value, replace(user))
+        self._language_cache.set(user.id.value, user.language_code)
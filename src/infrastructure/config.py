@@ -1,7 +1,9 @@
+from datetime import timedelta
 from pathlib import Path
+from typing import Literal
 
 import yaml
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, Field, field_validator
 
 
 class PostgresConfig(BaseModel):
@@ -37,10 +39,169 @@ class TelegramConfig(BaseModel):
     tg_init_data: str = "for-auth-endpoint-tests"
 
 
+class UserActivityConfig(BaseModel):
+    flush_interval_ms: int = 1000
+    max_batch_size: int = 500
+    last_login_granularity_seconds: int = 60
+
+    @field_validator("flush_interval_ms", "max_batch_size")
+    @classmethod
+    def positive_validator(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("Value must be positive")
+        return v
+
+    @field_validator("last_login_granularity_seconds")
+    @classmethod
+    def granularity_validator(cls, v: int) -> int:
+        if v < 0:
+            raise ValueError("Granularity cannot be negative")
+        return v
+
+    @property
+    def last_login_granularity(self) -> timedelta:
+        return timedelta(seconds=self.last_login_granularity_seconds)
+
+
+class PostKeysConfig(BaseModel):
+    # Keys the sequence numbers are permuted with; auth.secret_key if unset.
+    # Changing it only risks collisions with old keys, which are retried.
+    secret: str | None = None
+    # "sequence" draws each key on creation, "pool" serves pre-reserved keys
+    mode: Literal["sequence", "pool"] = "sequence"
+    pool_low_water: int = 500
+    pool_batch_size: int = 1000
+    pool_lease_ttl_seconds: int = 600
+    pool_check_interval_ms: int = 1000
+    # How long post creation waits for a key before failing
+    pool_allocate_timeout_ms: int = 5000
+
+    @field_validator(
+        "pool_low_water",
+        "pool_batch_size",
+        "pool_lease_ttl_seconds",
+        "pool_check_interval_ms",
+        "pool_allocate_timeout_ms",
+    )
+    @classmethod
+    def positive_validator(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("Value must be positive")
+        return v
+
+    @property
+    def pool_lease_ttl(self) -> timedelta:
+        return timedelta(seconds=self.pool_lease_ttl_seconds)
+
+
+class PostSharesConfig(BaseModel):
+    flush_interval_ms: int = 5000
+    max_batch_size: int = 500
+
+    @field_validator("flush_interval_ms", "max_batch_size")
+    @classmethod
+    def positive_validator(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("Value must be positive")
+        return v
+
+
+class PostCountsConfig(BaseModel):
+    # How often users' active post counters are recounted to repair drift
+    reconcile_interval_seconds: int = 3600
+    reconcile_batch_size: int = 1000
+
+    @field_validator("reconcile_interval_seconds", "reconcile_batch_size")
+    @classmethod
+    def positive_validator(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("Value must be positive")
+        return v
+
+
+class CacheConfig(BaseModel):
+    user_max_size: int = 10_000
+    user_ttl_seconds: float = 60.0
+    language_max_size: int = 100_000
+    language_ttl_seconds: float = 600.0
+    post_max_size: int = 5_000
+    post_ttl_seconds: float = 300.0
+    post_key_filter_capacity: int = 1_000_000
+    post_key_filter_error_rate: float = 0.01
+    inline_result_max_size: int = 5_000
+
+
+class InlineConfig(BaseModel):
+    """How long Telegram may answer inline queries from its own cache.
+
+    The per-type times only apply to answers to an exact key.
+    """
+
+    text_cache_seconds: int = 600
+    photo_cache_seconds: int = 3600
+    video_cache_seconds: int = 3600
+    gif_cache_seconds: int = 3600
+    # Partial key, text and empty answers, which should reflect changes quickly
+    short_cache_seconds: int = 5
+
+    @field_validator(
+        "text_cache_seconds",
+        "photo_cache_seconds",
+        "video_cache_seconds",
+        "gif_cache_seconds",
+        "short_cache_seconds",
+    )
+    @classmethod
+    def cache_seconds_validator(cls, v: int) -> int:
+        if v < 0:
+            raise ValueError("Cache time cannot be negative")
+        return v
+
+    @property
+    def content_cache_seconds(self) -> dict[str, int]:
+        return {
+            "text": self.text_cache_seconds,
+            "photo": self.photo_cache_seconds,
+            "video": self.video_cache_seconds,
+            "gif": self.gif_cache_seconds,
+        }
+
+
+class PostArchiveConfig(BaseModel):
+    # Soft-deleted posts older than this move to posts_archive
+    retention_days: int = 30
+    interval_seconds: int = 3600
+    batch_size: int = 500
+    # Ceiling on posts moved per second, so archival never competes with users
+    max_rows_per_second: int = 2000
+    # Only count and log the posts due for archival, move nothing
+    dry_run: bool = False
+
+    @field_validator(
+        "retention_days", "interval_seconds", "batch_size", "max_rows_per_second"
+    )
+    @classmethod
+    def positive_validator(cls, v: int) -> int:
+        if v <= 0:
+            raise ValueError("Value must be positive")
+        return v
+
+    @property
+    def retention(self) -> timedelta:
+        return timedelta(days=self.retention_days)
+
+
 class Config(BaseModel):
     postgres: PostgresConfig
     auth: AuthConfig
     telegram: TelegramConfig
+    user_activity: UserActivityConfig = Field(default_factory=UserActivityConfig)
+    post_shares: PostSharesConfig = Field(default_factory=PostSharesConfig)
+    post_keys: PostKeysConfig = Field(default_factory=PostKeysConfig)
+    post_counts: PostCountsConfig = Field(default_factory=PostCountsConfig)
+    post_archive: PostArchiveConfig = Field(default_factory=PostArchiveConfig)
+    cache: CacheConfig = Field(default_factory=CacheConfig)
+    inline: InlineConfig = Field(default_factory=InlineConfig)
 
 
 def load_config(file_name: str = "config.yaml") -> Config:
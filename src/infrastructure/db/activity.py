@@ -0,0 +1,54 @@
+"""Write-behind buffer for per-update user activity."""
+
+from datetime import timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.application.interfaces.user_activity import UserActivityRecorder
+from src.domain.user.repository import UserActivity
+from src.infrastructure.db.repos.user import (
+    DEFAULT_LAST_LOGIN_GRANULARITY,
+    UserRepositoryImpl,
+    UserWriteStats,
+)
+from src.infrastructure.db.write_behind import WriteBehindBuffer
+
+
+class UserActivityBuffer(WriteBehindBuffer[int, UserActivity], UserActivityRecorder):
+    """Coalesces last-seen updates in memory and flushes them in batches.
+
+    Only the latest snapshot per user is kept, so a user sending many updates
+    between two flushes costs a single row in the next batched upsert.
+    """
+
+    subject = "user activity"
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        flush_interval: float = 1.0,
+        max_batch_size: int = 500,
+        last_login_granularity: timedelta = DEFAULT_LAST_LOGIN_GRANULARITY,
+        write_stats: UserWriteStats | None = None,
+    ) -> None:
+        super().__init__(
+            session_maker, flush_interval=flush_interval, max_batch_size=max_batch_size
+        )
+        self._last_login_granularity = last_login_granularity
+        self._write_stats = write_stats if write_stats is not None else UserWriteStats()
+
+    def record(self, activity: UserActivity) -> None:
+        self._add(activity.user_id, activity)
+
+    def _merge(self, older: UserActivity, newer: UserActivity) -> UserActivity:
+        return newer
+
+    async def _write(
+        self, session: AsyncSession, chunk: dict[int, UserActivity]
+    ) -> int:
+        repository = UserRepositoryImpl(
+            session,
+            last_login_granularity=self._last_login_granularity,
+            stats=self._write_stats,
+        )
+        return await repository.bulk_upsert_activity(list(chunk.values()))
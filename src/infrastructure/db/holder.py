@@ -1,12 +1,32 @@
+from datetime import timedelta
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.infrastructure.db.identity_map import IdentityMap
 from src.infrastructure.db.repos import AdminRepositoryImpl, UserRepositoryImpl
 from src.infrastructure.db.repos.post import PostRepositoryImpl
+from src.infrastructure.db.repos.user import (
+    DEFAULT_LAST_LOGIN_GRANULARITY,
+    UserWriteStats,
+)
+from src.infrastructure.db.transaction import CommitHooks
 
 
 class HolderDao:
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        last_login_granularity: timedelta = DEFAULT_LAST_LOGIN_GRANULARITY,
+        user_write_stats: UserWriteStats | None = None,
+    ) -> None:
         self.session = session
-        self.user_repo = UserRepositoryImpl(session)
+        self.identity_map = IdentityMap()
+        self.commit_hooks = CommitHooks()
+        self.user_repo = UserRepositoryImpl(
+            session,
+            last_login_granularity=last_login_granularity,
+            stats=user_write_stats,
+            identity_map=self.identity_map,
+        )
         self.admin_repo = AdminRepositoryImpl(session)
-        self.post_repo = PostRepositoryImpl(session)
+        self.post_repo = PostRepositoryImpl(session, self.identity_map)
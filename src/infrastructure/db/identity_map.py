@@ -0,0 +1,53 @@
+"""Request-scoped registry of already hydrated entities."""
+
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class IdentityMapStats:
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def avoided_queries(self) -> int:
+        return self.hits
+
+
+class IdentityMap:
+    """Maps (entity type, id) to the single entity instance loaded for it.
+
+    Lives as long as one session, so repositories sharing it return the same
+    object for repeated lookups instead of querying and hydrating it again.
+    Repositories keep entries current on writes; a rollback clears the map.
+    """
+
+    def __init__(self) -> None:
+        self._entities: dict[tuple[type, Hashable], Any] = {}
+        self.stats = IdentityMapStats()
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    def get[T](self, entity_type: type[T], key: Hashable) -> T | None:
+        entity = self._entities.get((entity_type, key))
+        if entity is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return entity
+
+    def peek[T](self, entity_type: type[T], key: Hashable) -> T | None:
+        """Like `get`, but for write paths: does not touch the counters."""
+        return self._entities.get((entity_type, key))
+
+    def add[T](self, entity: T, key: Hashable) -> T:
+        self._entities[type(entity), key] = entity
+        return entity
+
+    def remove(self, entity_type: type, key: Hashable) -> None:
+        self._entities.pop((entity_type, key), None)
+
+    def clear(self) -> None:
+        self._entities.clear()
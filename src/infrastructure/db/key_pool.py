@@ -0,0 +1,200 @@
+"""Pool of unique keys reserved ahead of post creation."""
+
+import asyncio
+import contextlib
+import logging
+import os
+import socket
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.application.interfaces.post_key_allocator import PostKeyAllocator
+from src.application.post.keygen import KeyPermutation
+from src.infrastructure.db.repos.post_key_pool import PostKeyPoolRepositoryImpl
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PostKeyPoolStats:
+    allocated: int = 0
+    # Allocations that found the queue empty and had to wait for a refill
+    starved: int = 0
+    # Allocations that gave up waiting
+    timed_out: int = 0
+    released: int = 0
+    refills: int = 0
+    reserved: int = 0
+    reclaimed: int = 0
+    failed_refills: int = 0
+    last_refill_seconds: float = 0.0
+
+
+class PostKeyPool(PostKeyAllocator):
+    """Keys leased from the `post_key_pool` table, served from memory.
+
+    A background task tops the in-memory queue up by `batch_size` keys
+    whenever it drops to `low_water`, first reclaiming keys no live process
+    holds and then reserving fresh ones from the key sequence. Leases are
+    renewed while the process runs and released on close; keys of a process
+    that died are reclaimed once their lease is older than `lease_ttl`.
+    Used keys are deleted from the table in batches on the next refill;
+    keys of posts that were never created go back to the queue. An
+    allocation waits at most `allocate_timeout` seconds for a refill.
+
+    A key can rarely be handed out twice, e.g. when a process dies after
+    creating a post but before deleting its key. The unique constraint on
+    posts catches that and creation retries with another key.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        key_permutation: KeyPermutation,
+        *,
+        low_water: int = 500,
+        batch_size: int = 1000,
+        lease_ttl: timedelta = timedelta(minutes=10),
+        check_interval: float = 1.0,
+        allocate_timeout: float = 5.0,
+    ) -> None:
+        self._session_maker = session_maker
+        self._key_permutation = key_permutation
+        self._low_water = low_water
+        self._batch_size = batch_size
+        self._lease_ttl = lease_ttl
+        self._check_interval = check_interval
+        self._allocate_timeout = allocate_timeout
+        self.owner = f"{socket.gethostname()[:40]}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._queue: asyncio.Queue[str] = asyncio.Queue()
+        self._used: list[str] = []
+        self._renewed_at = 0.0
+        self._wakeup = asyncio.Event()
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+        self.stats = PostKeyPoolStats()
+
+    @property
+    def depth(self) -> int:
+        return self._queue.qsize()
+
+    async def allocate(self) -> str:
+        if self._queue.qsize() <= self._low_water:
+            self._wakeup.set()
+        if self._queue.empty():
+            self.stats.starved += 1
+        try:
+            key = await asyncio.wait_for(self._queue.get(), self._allocate_timeout)
+        except TimeoutError:
+            self.stats.timed_out += 1
+            msg = (
+                f"No post key available after {self._allocate_timeout}s;"
+                " the key pool is not started or fails to refill"
+            )
+            raise RuntimeError(msg) from None
+        self.stats.allocated += 1
+        return key
+
+    def mark_used(self, key: str) -> None:
+        self._used.append(key)
+
+    def release(self, key: str) -> None:
+        # Still leased to this process, so it can be handed out again
+        self._queue.put_nowait(key)
+        self.stats.released += 1
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop refilling and hand unused keys back to the pool."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        # Nothing was ever leased before the first refill renewed the leases
+        if not self._renewed_at:
+            return
+
+        used, self._used = self._used, []
+        async with self._session_maker() as session:
+            repository = PostKeyPoolRepositoryImpl(session)
+            await repository.delete_keys(used)
+            await repository.release(self.owner)
+            await session.commit()
+
+    async def refill(self) -> int:
+        async with self._lock:
+            used, self._used = self._used, []
+            missing = self._low_water + self._batch_size - self._queue.qsize()
+            needs_keys = self._queue.qsize() <= self._low_water
+            needs_renewal = (
+                time.monotonic() - self._renewed_at
+                > self._lease_ttl.total_seconds() / 3
+            )
+            if not (used or needs_keys or needs_renewal):
+                return 0
+
+            started = time.perf_counter()
+            try:
+                keys = await self._write(
+                    used, missing if needs_keys else 0, renew=needs_renewal
+                )
+            except Exception:
+                self.stats.failed_refills += 1
+                self._used.extend(used)
+                raise
+
+            for key in keys:
+                self._queue.put_nowait(key)
+            if needs_renewal:
+                self._renewed_at = time.monotonic()
+            if keys:
+                self.stats.refills += 1
+                self.stats.last_refill_seconds = time.perf_counter() - started
+                logger.info(
+                    "Post key pool refilled with %d keys in %.3fs, depth %d",
+                    len(keys),
+                    self.stats.last_refill_seconds,
+                    self.depth,
+                )
+            return len(keys)
+
+    async def _write(self, used: list[str], missing: int, *, renew: bool) -> list[str]:
+        async with self._session_maker() as session:
+            repository = PostKeyPoolRepositoryImpl(session)
+            await repository.delete_keys(used)
+            if renew:
+                await repository.renew(self.owner)
+
+            keys: list[str] = []
+            if missing > 0:
+                keys = await repository.reclaim(self.owner, missing, self._lease_ttl)
+                self.stats.reclaimed += len(keys)
+            if missing > len(keys):
+                numbers = await repository.next_key_numbers(missing - len(keys))
+                reserved = await repository.reserve(
+                    [self._key_permutation.key_for(n) for n in numbers], self.owner
+                )
+                self.stats.reserved += len(reserved)
+                keys.extend(reserved)
+
+            await session.commit()
+            return keys
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refill()
+            except Exception:
+                logger.exception("Failed to refill the post key pool")
+
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), self._check_interval)
+            self._wakeup.clear()
@@ -1,3 +1,5 @@
+from typing import Any
+
 from src.domain.post.entity import Post, PostButton
 from src.domain.post.vo import (
     ButtonStyle,
@@ -48,10 +50,15 @@ class PostMapper:
             ),
             buttons=buttons,
             deleted_at=model.deleted_at,
+            shares=model.shares or 0,
         )
 
     @staticmethod
     def to_model(post: Post) -> PostModel:
+        return PostModel(**PostMapper.to_values(post))
+
+    @staticmethod
+    def to_values(post: Post) -> dict[str, Any]:
         buttons_json: list[list[dict]] = [
             [
                 {"text": btn.text, "url": btn.url, "style": btn.style.value}
@@ -60,18 +67,19 @@ class PostMapper:
             for row in post.buttons
         ]
 
-        return PostModel(
-            id=post.id,
-            owner_user_id=post.owner_user_id.value,
-            unique_key=post.unique_key.value,
-            content_type=post.content_type.value,
-            text_md=post.text_md.value if post.text_md else None,
-            telegram_file_id=(
+        return {
+            "id": post.id,
+            "owner_user_id": post.owner_user_id.value,
+            "unique_key": post.unique_key.value,
+            "content_type": post.content_type.value,
+            "text_md": post.text_md.value if post.text_md else None,
+            "telegram_file_id": (
                 post.telegram_file_id.value if post.telegram_file_id else None
             ),
-            buttons=buttons_json,
-            status=post.status.value,
-            created_at=post.created_at,
-            updated_at=post.updated_at,
-            deleted_at=post.deleted_at,
-        )
+            "buttons": buttons_json,
+            "status": post.status.value,
+            "created_at": post.created_at,
+            "updated_at": post.updated_at,
+            "deleted_at": post.deleted_at,
+            "shares": post.shares,
+        }
@@ -0,0 +1,43 @@
+"""add_posts_key_prefix_index
+
+Revision ID: 5b8e2f4c9d17
+Revises: 3f9c1d2e7a40
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5b8e2f4c9d17"
+down_revision: str | Sequence[str] | None = "3f9c1d2e7a40"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Index active keys for prefix matching, without locking out writes."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_posts_active_unique_key_pattern",
+            "posts",
+            ["unique_key"],
+            postgresql_ops={"unique_key": "text_pattern_ops"},
+            postgresql_where=sa.text("status = 'active'"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop the key prefix index."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_posts_active_unique_key_pattern",
+            table_name="posts",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
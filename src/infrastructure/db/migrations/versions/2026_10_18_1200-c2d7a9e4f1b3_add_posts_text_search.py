@@ -0,0 +1,75 @@
+"""add_posts_text_search
+
+Revision ID: c2d7a9e4f1b3
+Revises: 5b8e2f4c9d17
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+# revision identifiers, used by Alembic.
+revision: str = "c2d7a9e4f1b3"
+down_revision: str | Sequence[str] | None = "5b8e2f4c9d17"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add a generated tsvector over text_md plus GIN and trigram indexes.
+
+    Adding a stored generated column rewrites posts once; the indexes are
+    then built concurrently so inline search can be deployed under load.
+    """
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column(
+        "posts",
+        sa.Column(
+            "text_tsv",
+            TSVECTOR(),
+            sa.Computed("to_tsvector('simple', coalesce(text_md, ''))", persisted=True),
+        ),
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_posts_active_text_tsv",
+            "posts",
+            ["text_tsv"],
+            postgresql_using="gin",
+            postgresql_where=sa.text("status = 'active'"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_posts_active_text_trgm",
+            "posts",
+            ["text_md"],
+            postgresql_using="gin",
+            postgresql_ops={"text_md": "gin_trgm_ops"},
+            postgresql_where=sa.text("status = 'active'"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop text search indexes and the generated column."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_posts_active_text_trgm",
+            table_name="posts",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_posts_active_text_tsv",
+            table_name="posts",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column("posts", "text_tsv")
@@ -0,0 +1,36 @@
+"""add_posts_shares
+
+Revision ID: 8d4b6e1f2a95
+Revises: c2d7a9e4f1b3
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8d4b6e1f2a95"
+down_revision: str | Sequence[str] | None = "c2d7a9e4f1b3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add the per-post share counter.
+
+    A constant default makes this a metadata-only change, so the table is
+    not rewritten. The column is not indexed, which keeps the batched share
+    updates eligible for HOT.
+    """
+    op.add_column(
+        "posts",
+        sa.Column("shares", sa.BigInteger(), server_default="0", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Drop the per-post share counter."""
+    op.drop_column("posts", "shares")
@@ -0,0 +1,35 @@
+"""add_post_key_sequence
+
+Revision ID: e7a3c5b9d2f6
+Revises: 8d4b6e1f2a95
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e7a3c5b9d2f6"
+down_revision: str | Sequence[str] | None = "8d4b6e1f2a95"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add the sequence unique keys are allocated from.
+
+    Its range is the 36^8 key space: every number maps to a distinct key,
+    so allocation needs no existence check and never slows down as the
+    space fills up.
+    """
+    op.execute(
+        "CREATE SEQUENCE IF NOT EXISTS post_key_seq"
+        " AS bigint MINVALUE 0 MAXVALUE 2821109907455 START 0 NO CYCLE"
+    )
+
+
+def downgrade() -> None:
+    """Drop the key allocation sequence."""
+    op.execute("DROP SEQUENCE IF EXISTS post_key_seq")
@@ -0,0 +1,33 @@
+"""add_post_key_pool
+
+Revision ID: 4c1f8a2e6b07
+Revises: e7a3c5b9d2f6
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4c1f8a2e6b07"
+down_revision: str | Sequence[str] | None = "e7a3c5b9d2f6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add the table of keys reserved ahead of post creation."""
+    op.create_table(
+        "post_key_pool",
+        sa.Column("key", sa.String(8), primary_key=True),
+        sa.Column("leased_by", sa.String(64), nullable=True),
+        sa.Column("leased_at", sa.TIMESTAMP(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Drop the key pool table."""
+    op.drop_table("post_key_pool")
@@ -0,0 +1,51 @@
+"""add_users_active_post_count
+
+Revision ID: 9a2e5d7c3f18
+Revises: 4c1f8a2e6b07
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9a2e5d7c3f18"
+down_revision: str | Sequence[str] | None = "4c1f8a2e6b07"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add the denormalized active post counter and backfill it.
+
+    The constant default keeps adding the column metadata-only; only users
+    with active posts are then rewritten by the backfill. Counters that
+    drift from posts written meanwhile are repaired by the reconciler.
+    """
+    op.add_column(
+        "users",
+        sa.Column(
+            "active_post_count", sa.Integer(), server_default="0", nullable=False
+        ),
+    )
+    op.execute(
+        """
+        UPDATE users
+        SET active_post_count = counts.n
+        FROM (
+            SELECT owner_user_id, count(*) AS n
+            FROM posts
+            WHERE status = 'active'
+            GROUP BY owner_user_id
+        ) AS counts
+        WHERE users.id = counts.owner_user_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop the active post counter."""
+    op.drop_column("users", "active_post_count")
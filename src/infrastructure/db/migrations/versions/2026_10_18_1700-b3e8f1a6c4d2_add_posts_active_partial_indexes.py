@@ -0,0 +1,75 @@
+"""add_posts_active_partial_indexes
+
+Revision ID: b3e8f1a6c4d2
+Revises: 9a2e5d7c3f18
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b3e8f1a6c4d2"
+down_revision: str | Sequence[str] | None = "9a2e5d7c3f18"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Index only active posts for the owner listing, without locking writes.
+
+    The new index replaces one that kept deleted posts and had status in its
+    key. ix_posts_unique_key duplicated the unique constraint on the column,
+    which still guarantees keys are never reused; active key lookups go
+    through ix_posts_active_unique_key_pattern.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_posts_active_owner_created",
+            "posts",
+            ["owner_user_id", sa.text("created_at DESC"), sa.text("id DESC")],
+            postgresql_where=sa.text("status = 'active'"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_posts_owner_status_created",
+            table_name="posts",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_posts_unique_key",
+            table_name="posts",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Restore the full indexes and drop the partial owner index."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_posts_unique_key",
+            "posts",
+            ["unique_key"],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_posts_owner_status_created",
+            "posts",
+            ["owner_user_id", "status", sa.text("created_at DESC")],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_posts_active_owner_created",
+            table_name="posts",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,68 @@
+"""add_posts_archive
+
+Revision ID: 6d2a9c4e8f51
+Revises: b3e8f1a6c4d2
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "6d2a9c4e8f51"
+down_revision: str | Sequence[str] | None = "b3e8f1a6c4d2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add the archive of deleted posts and index posts due for archival."""
+    op.create_table(
+        "posts_archive",
+        sa.Column("id", sa.dialects.postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("owner_user_id", sa.BigInteger(), nullable=False),
+        sa.Column("unique_key", sa.String(8), nullable=False, unique=True),
+        sa.Column("content_type", sa.String(10), nullable=False),
+        sa.Column("text_md", sa.Text(), nullable=True),
+        sa.Column("telegram_file_id", sa.Text(), nullable=True),
+        sa.Column("buttons", sa.JSON(), nullable=False),
+        sa.Column("status", sa.String(10), nullable=False),
+        sa.Column("created_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("updated_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("deleted_at", sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column("shares", sa.BigInteger(), nullable=False),
+        sa.Column(
+            "archived_at",
+            sa.TIMESTAMP(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_posts_deleted_at",
+            "posts",
+            ["deleted_at"],
+            postgresql_where=sa.text("status = 'deleted'"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop the archival index and the archive.
+
+    Archived posts are not moved back; take a copy of posts_archive first
+    if they are still needed.
+    """
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_posts_deleted_at",
+            table_name="posts",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_table("posts_archive")
@@ -1,7 +1,11 @@
 from .post import PostModel
+from .post_archive import PostArchiveModel
+from .post_key_pool import PostKeyPoolModel
 from .user import UserModel
 
 __all__ = [
+    "PostArchiveModel",
+    "PostKeyPoolModel",
     "PostModel",
     "UserModel",
 ]
@@ -1,25 +1,60 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import JSON, TIMESTAMP, ForeignKey, Index, String, Text, func
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import (
+    DDL,
+    JSON,
+    TIMESTAMP,
+    BigInteger,
+    ColumnElement,
+    Computed,
+    ForeignKey,
+    Index,
+    Sequence,
+    String,
+    Text,
+    event,
+    func,
+    literal,
+    text,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
+from src.application.post.ids import uuid7
+from src.application.post.keygen import KEY_SPACE
+from src.domain.post.vo import PostStatus
+
 from .base import BaseORMModel
 
+# Numbers fed through KeyPermutation; one per allocated unique key
+post_key_seq = Sequence(
+    "post_key_seq",
+    start=0,
+    minvalue=0,
+    maxvalue=KEY_SPACE - 1,
+    metadata=BaseORMModel.metadata,
+)
+
 
 class PostModel(BaseORMModel):
     __tablename__ = "posts"
 
     id: Mapped[uuid.UUID] = mapped_column(
-        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+        UUID(as_uuid=True), primary_key=True, default=uuid7
     )
     owner_user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
-    unique_key: Mapped[str] = mapped_column(
-        String(8), unique=True, nullable=False, index=True
-    )
+    # Unique across deleted posts too, and checked against posts_archive on
+    # insert: a key is never handed out twice
+    unique_key: Mapped[str] = mapped_column(String(8), unique=True, nullable=False)
     content_type: Mapped[str] = mapped_column(String(10), nullable=False)
     text_md: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # 'simple' config: posts mix languages, so no stemming or stop words
+    text_tsv: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed("to_tsvector('simple', coalesce(text_md, ''))", persisted=True),
+        deferred=True,
+    )
     telegram_file_id: Mapped[str | None] = mapped_column(Text, nullable=True)
     buttons: Mapped[list] = mapped_column(JSON, nullable=False, server_default="[]")
     status: Mapped[str] = mapped_column(
@@ -34,12 +69,61 @@ class PostModel(BaseORMModel):
     deleted_at: Mapped[datetime | None] = mapped_column(
         TIMESTAMP(timezone=True), nullable=True
     )
+    shares: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default="0")
 
     __table_args__ = (
+        # My Posts keyset pages in index order; deleted posts are not indexed
         Index(
-            "ix_posts_owner_status_created",
+            "ix_posts_active_owner_created",
             "owner_user_id",
-            "status",
             created_at.desc(),
+            id.desc(),
+            postgresql_where=text("status = 'active'"),
+        ),
+        # Prefix search over active keys: LIKE 'ab3%' / ~>=~ ... ~<~ ranges,
+        # and equality lookups of active keys
+        Index(
+            "ix_posts_active_unique_key_pattern",
+            "unique_key",
+            postgresql_ops={"unique_key": "text_pattern_ops"},
+            postgresql_where=text("status = 'active'"),
+        ),
+        # Soft-deleted posts in the order they become due for archival
+        Index(
+            "ix_posts_deleted_at",
+            "deleted_at",
+            postgresql_where=text("status = 'deleted'"),
+        ),
+        Index(
+            "ix_posts_active_text_tsv",
+            "text_tsv",
+            postgresql_using="gin",
+            postgresql_where=text("status = 'active'"),
+        ),
+        Index(
+            "ix_posts_active_text_trgm",
+            "text_md",
+            postgresql_using="gin",
+            postgresql_ops={"text_md": "gin_trgm_ops"},
+            postgresql_where=text("status = 'active'"),
         ),
     )
+
+
+# gin_trgm_ops needs the extension before create_all builds the indexes
+event.listen(
+    BaseORMModel.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"),
+)
+
+
+def active_post_filter() -> ColumnElement[bool]:
+    # Inlined rather than bound, so partial indexes on "status = 'active'"
+    # still match under generic prepared-statement plans
+    return PostModel.status == literal(PostStatus.ACTIVE.value, literal_execute=True)
+
+
+def deleted_post_filter() -> ColumnElement[bool]:
+    # Inlined for the same reason, for ix_posts_deleted_at
+    return PostModel.status == literal(PostStatus.DELETED.value, literal_execute=True)
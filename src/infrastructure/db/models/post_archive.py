@@ -0,0 +1,58 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import (
+    JSON,
+    TIMESTAMP,
+    BigInteger,
+    ColumnElement,
+    String,
+    Text,
+    func,
+    select,
+)
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import BaseORMModel
+
+
+class PostArchiveModel(BaseORMModel):
+    """Soft-deleted posts moved out of `posts` once past their retention.
+
+    The columns mirror `posts`, without the search vector. Keys stay unique
+    here, and post creation checks this table too, so an archived post's
+    key is never handed out again. Nothing else reads the archive on a hot
+    path, and no foreign key holds users back from being removed.
+    """
+
+    __tablename__ = "posts_archive"
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    owner_user_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    unique_key: Mapped[str] = mapped_column(String(8), unique=True, nullable=False)
+    content_type: Mapped[str] = mapped_column(String(10), nullable=False)
+    text_md: Mapped[str | None] = mapped_column(Text, nullable=True)
+    telegram_file_id: Mapped[str | None] = mapped_column(Text, nullable=True)
+    buttons: Mapped[list] = mapped_column(JSON, nullable=False)
+    status: Mapped[str] = mapped_column(String(10), nullable=False)
+    created_at: Mapped[datetime | None] = mapped_column(
+        TIMESTAMP(timezone=True), nullable=True
+    )
+    updated_at: Mapped[datetime | None] = mapped_column(
+        TIMESTAMP(timezone=True), nullable=True
+    )
+    deleted_at: Mapped[datetime | None] = mapped_column(
+        TIMESTAMP(timezone=True), nullable=True
+    )
+    shares: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    archived_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), nullable=False, server_default=func.now()
+    )
+
+
+def key_archived(key: ColumnElement[str] | str) -> ColumnElement[bool]:
+    # The unique constraint on posts no longer sees keys moved here
+    return (
+        select(PostArchiveModel.id).where(PostArchiveModel.unique_key == key).exists()
+    )
@@ -0,0 +1,19 @@
+from datetime import datetime
+
+from sqlalchemy import TIMESTAMP, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import BaseORMModel
+
+
+class PostKeyPoolModel(BaseORMModel):
+    """Keys reserved ahead of post creation and leased to one process."""
+
+    __tablename__ = "post_key_pool"
+
+    key: Mapped[str] = mapped_column(String(8), primary_key=True)
+    # Process holding the key; NULL once released on a clean shutdown
+    leased_by: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    leased_at: Mapped[datetime | None] = mapped_column(
+        TIMESTAMP(timezone=True), nullable=True
+    )
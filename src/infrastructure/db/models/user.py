@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import TIMESTAMP, ForeignKey, func
+from sqlalchemy import TIMESTAMP, ForeignKey, Integer, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.domain.user.vo import (
@@ -53,3 +53,7 @@ class UserModel(BaseORMModel):
     language_code: Mapped[LanguageCode | None] = mapped_column(
         LanguageCodeType, server_default="en", nullable=True
     )
+    # Denormalized count of the user's active posts, kept by the post repository
+    active_post_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default="0"
+    )
@@ -0,0 +1,143 @@
+"""Background archival of long soft-deleted posts."""
+
+import asyncio
+import contextlib
+import logging
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.infrastructure.db.repos.post_archive import PostArchiveRepositoryImpl
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PostArchiveStats:
+    runs: int = 0
+    batches: int = 0
+    archived: int = 0
+    # Posts the last dry run found due for archival
+    archivable: int = 0
+    failed_runs: int = 0
+    # Time spent waiting to stay under the throughput ceiling
+    throttled_seconds: float = 0.0
+    last_run_seconds: float = 0.0
+
+
+class PostArchiver:
+    """Moves posts deleted more than `retention` ago into `posts_archive`.
+
+    Keeps the hot table and the indexes inline search depends on free of
+    rows nobody reads again. Every `interval` seconds posts are moved
+    `batch_size` per short transaction, skipping rows other transactions
+    have locked, and the run pauses between batches so it moves at most
+    `max_rows_per_second`. In `dry_run` mode a run only counts the posts
+    it would move.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        *,
+        retention: timedelta = timedelta(days=30),
+        interval: float = 3600.0,
+        batch_size: int = 500,
+        max_rows_per_second: float = 2000.0,
+        dry_run: bool = False,
+    ) -> None:
+        self._session_maker = session_maker
+        self._retention = retention
+        self._interval = interval
+        self._batch_size = batch_size
+        self._max_rows_per_second = max_rows_per_second
+        self._dry_run = dry_run
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+        self.stats = PostArchiveStats()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop archiving; a batch in flight is rolled back."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def archive(self) -> int:
+        """Archive every due post; returns how many, or would be in a dry run."""
+        async with self._lock:
+            started = time.perf_counter()
+            deleted_before = datetime.now(UTC) - self._retention
+            try:
+                if self._dry_run:
+                    count = await self._count(deleted_before)
+                else:
+                    count = await self._move(deleted_before)
+            except Exception:
+                self.stats.failed_runs += 1
+                raise
+
+            self.stats.runs += 1
+            self.stats.last_run_seconds = time.perf_counter() - started
+            if self._dry_run:
+                logger.info(
+                    "Dry run: %d posts deleted before %s would be archived",
+                    count,
+                    deleted_before.isoformat(),
+                )
+            elif count:
+                logger.info(
+                    "Archived %d deleted posts in %.1fs",
+                    count,
+                    self.stats.last_run_seconds,
+                )
+            return count
+
+    async def _count(self, deleted_before: datetime) -> int:
+        async with self._session_maker() as session:
+            count = await PostArchiveRepositoryImpl(session).count_archivable(
+                deleted_before
+            )
+        self.stats.archivable = count
+        return count
+
+    async def _move(self, deleted_before: datetime) -> int:
+        archived = 0
+        try:
+            while True:
+                started = time.perf_counter()
+                async with self._session_maker() as session:
+                    moved = await PostArchiveRepositoryImpl(session).archive_deleted(
+                        deleted_before, self._batch_size
+                    )
+                    await session.commit()
+                archived += moved
+                self.stats.batches += 1
+                # A short batch means nothing due is left, apart from rows
+                # locked right now; the next run picks those up
+                if moved < self._batch_size:
+                    return archived
+                await self._throttle(moved, time.perf_counter() - started)
+        finally:
+            self.stats.archived += archived
+
+    async def _throttle(self, moved: int, elapsed: float) -> None:
+        delay = moved / self._max_rows_per_second - elapsed
+        if delay > 0:
+            self.stats.throttled_seconds += delay
+            await asyncio.sleep(delay)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                await self.archive()
+            except Exception:
+                logger.exception("Failed to archive deleted posts")
@@ -0,0 +1,87 @@
+"""Periodic repair of the denormalized active post counters."""
+
+import asyncio
+import contextlib
+import logging
+from dataclasses import dataclass
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.infrastructure.db.repos.post import PostRepositoryImpl
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PostCountStats:
+    runs: int = 0
+    repaired: int = 0
+    failed_runs: int = 0
+
+
+class ActivePostCountReconciler:
+    """Recounts `users.active_post_count` from the posts now and then.
+
+    The post repository keeps the counters exact, so drift only comes from
+    writes that bypass it, such as manual SQL or a restored backup. Every
+    `interval` seconds all users are walked in id order, `batch_size` per
+    short transaction, so a run never locks many users at once.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        *,
+        interval: float = 3600.0,
+        batch_size: int = 1000,
+    ) -> None:
+        self._session_maker = session_maker
+        self._interval = interval
+        self._batch_size = batch_size
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+        self.stats = PostCountStats()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def reconcile(self) -> int:
+        """Run over all users once; returns how many counters were repaired."""
+        async with self._lock:
+            repaired = 0
+            after: int | None = 0
+            try:
+                while after is not None:
+                    async with self._session_maker() as session:
+                        repository = PostRepositoryImpl(session)
+                        after, fixed = await repository.reconcile_active_post_counts(
+                            after, self._batch_size
+                        )
+                        await session.commit()
+                    repaired += fixed
+            except Exception:
+                self.stats.failed_runs += 1
+                raise
+            finally:
+                self.stats.repaired += repaired
+
+            self.stats.runs += 1
+            if repaired:
+                logger.warning("Repaired %d drifted active post counters", repaired)
+            return repaired
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                await self.reconcile()
+            except Exception:
+                logger.exception("Failed to reconcile active post counters")
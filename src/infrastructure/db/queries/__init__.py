@@ -0,0 +1,5 @@
+from .post import PostQueryServiceImpl
+
+__all__ = [
+    "PostQueryServiceImpl",
+]
@@ -0,0 +1,157 @@
+import uuid
+from typing import Any
+
+from sqlalchemy import Row, Select, func, or_, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.interfaces.post_queries import PostCursor, PostQueryService
+from src.application.post.dtos import PostButtonDTO, PostDetailDTO, PostListItemDTO
+from src.infrastructure.db.models.post import PostModel, active_post_filter
+from src.infrastructure.db.models.user import UserModel
+
+# Characters of text_md shown in list views, cut by the database
+PREVIEW_LENGTH = 50
+
+_DETAIL_COLUMNS = (
+    PostModel.id,
+    PostModel.unique_key,
+    PostModel.content_type,
+    PostModel.text_md,
+    PostModel.telegram_file_id,
+    PostModel.buttons,
+    PostModel.created_at,
+    PostModel.updated_at,
+    PostModel.shares,
+)
+
+
+def _to_detail(row: Row[Any]) -> PostDetailDTO:
+    return PostDetailDTO(
+        id=row.id,
+        unique_key=row.unique_key,
+        content_type=row.content_type,
+        text_md=row.text_md or None,
+        telegram_file_id=row.telegram_file_id or None,
+        # The JSON is decoded by the driver once and read into DTOs directly
+        buttons=[
+            [PostButtonDTO(text=b["text"], url=b["url"], style=b["style"]) for b in r]
+            for r in row.buttons or ()
+        ],
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+        shares=row.shares or 0,
+    )
+
+
+class PostQueryServiceImpl(PostQueryService):
+    """Column selects mapped straight to DTOs.
+
+    No ORM entities are hydrated and no domain objects built, so nothing
+    lands in the session's identity map either.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get_post_detail(self, post_id: uuid.UUID) -> PostDetailDTO | None:
+        stmt = select(*_DETAIL_COLUMNS).where(PostModel.id == post_id)
+        row = (await self._session.execute(stmt)).first()
+        return _to_detail(row) if row is not None else None
+
+    async def search_posts_by_key(
+        self,
+        prefix: str,
+        limit: int = 10,
+        after: str | None = None,
+        *,
+        owner_user_id: int | None = None,
+    ) -> list[PostDetailDTO]:
+        # A byte-wise range instead of LIKE: unlike a LIKE with a bound
+        # pattern it stays sargable for ix_posts_active_unique_key_pattern
+        # under generic prepared-statement plans.
+        upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        stmt = (
+            select(*_DETAIL_COLUMNS)
+            .where(
+                PostModel.unique_key.op("~>=~")(prefix),
+                PostModel.unique_key.op("~<~")(upper),
+                active_post_filter(),
+            )
+            .order_by(text("posts.unique_key USING ~<~"))
+            .limit(limit)
+        )
+        if after is not None:
+            stmt = stmt.where(PostModel.unique_key.op("~>~")(after))
+        if owner_user_id is not None:
+            stmt = stmt.where(PostModel.owner_user_id == owner_user_id)
+        result = await self._session.execute(stmt)
+        return [_to_detail(row) for row in result]
+
+    async def get_user_posts(
+        self,
+        user_id: int,
+        limit: int = 10,
+        cursor: PostCursor | None = None,
+        *,
+        backward: bool = False,
+    ) -> tuple[list[PostListItemDTO], int]:
+        stmt = _user_posts_page(user_id, cursor, backward=backward).limit(limit)
+        rows = (await self._session.execute(stmt)).all()
+        items = [
+            PostListItemDTO(
+                id=row.id,
+                unique_key=row.unique_key,
+                content_type=row.content_type,
+                text_preview=row.text_preview or None,
+                created_at=row.created_at,
+            )
+            for row in rows
+        ]
+        if backward:
+            items.reverse()
+        return items, rows[0].total if rows else 0
+
+
+def _user_posts_page(
+    user_id: int, cursor: PostCursor | None, *, backward: bool
+) -> Select[Any]:
+    # The owner's counter rides along with every row, saving a COUNT(*)
+    total = (
+        select(UserModel.active_post_count)
+        .where(UserModel.id == user_id)
+        .scalar_subquery()
+    )
+    stmt = select(
+        PostModel.id,
+        PostModel.unique_key,
+        PostModel.content_type,
+        func.left(PostModel.text_md, PREVIEW_LENGTH).label("text_preview"),
+        PostModel.created_at,
+        total.label("total"),
+    ).where(
+        PostModel.owner_user_id == user_id,
+        active_post_filter(),
+    )
+    if cursor is not None:
+        # The bare created_at bound is what ix_posts_active_owner_created
+        # can seek on; the id only breaks ties within one timestamp
+        if backward:
+            stmt = stmt.where(
+                PostModel.created_at >= cursor.created_at,
+                or_(
+                    PostModel.created_at > cursor.created_at,
+                    PostModel.id > cursor.id,
+                ),
+            )
+        else:
+            stmt = stmt.where(
+                PostModel.created_at <= cursor.created_at,
+                or_(
+                    PostModel.created_at < cursor.created_at,
+                    PostModel.id < cursor.id,
+                ),
+            )
+
+    if backward:
+        return stmt.order_by(PostModel.created_at.asc(), PostModel.id.asc())
+    return stmt.order_by(PostModel.created_at.desc(), PostModel.id.desc())
@@ -1,6 +1,11 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.infrastructure.db.identity_map import IdentityMap
+
 
 class BaseSQLAlchemyRepo:
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self, session: AsyncSession, identity_map: IdentityMap | None = None
+    ) -> None:
         self._session = session
+        self._identity_map = identity_map if identity_map is not None else IdentityMap()
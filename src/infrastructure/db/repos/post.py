@@ -1,26 +1,93 @@
+import re
 import uuid
+from collections.abc import AsyncIterator, Mapping
 from datetime import UTC, datetime
 
-from sqlalchemy import func, select, update
+from sqlalchemy import (
+    BigInteger,
+    ColumnElement,
+    any_,
+    bindparam,
+    column,
+    exists,
+    func,
+    literal,
+    select,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, UUID, insert
 
 from src.domain.post.entity import Post
 from src.domain.post.repository import PostRepository
 from src.domain.post.vo import PostStatus
 from src.domain.user.vo import UserId
 from src.infrastructure.db.mappers.post import PostMapper
-from src.infrastructure.db.models.post import PostModel
+from src.infrastructure.db.models.post import (
+    PostModel,
+    active_post_filter,
+    post_key_seq,
+)
+from src.infrastructure.db.models.post_archive import key_archived
+from src.infrastructure.db.models.user import UserModel
 from src.infrastructure.db.repos.base import BaseSQLAlchemyRepo
 
+_UUID_ARRAY = ARRAY(UUID(as_uuid=True))
+
+_TERM_RE = re.compile(r"[^\W_]+")
+_LIKE_SPECIAL_RE = re.compile(r"([/%_])")
+
+
+def _escape_like(value: str) -> str:
+    return _LIKE_SPECIAL_RE.sub(r"/\1", value)
+
 
 class PostRepositoryImpl(PostRepository, BaseSQLAlchemyRepo):
-    async def create_post(self, post: Post) -> Post:
-        post_model = PostMapper.to_model(post)
-        self._session.add(post_model)
-        await self._session.flush()
+    async def create_post(self, post: Post) -> Post | None:
+        # DO NOTHING instead of an IntegrityError keeps the transaction usable
+        # for a retry with another key. A key of an archived post is taken the
+        # same way; only an archival committing while this statement runs
+        # could slip past the check.
+        values = PostMapper.to_values(post)
+        columns = PostModel.__table__.c
+        row = select(
+            *(literal(v, columns[name].type).label(name) for name, v in values.items())
+        ).where(~key_archived(post.unique_key.value))
+        stmt = (
+            insert(PostModel)
+            .from_select(list(values), row)
+            .on_conflict_do_nothing(index_elements=[PostModel.unique_key])
+            .returning(PostModel)
+        )
+        created = await self._session.scalar(stmt)
+        if created is None:
+            return None
 
-        return PostMapper.to_domain(post_model)
+        if created.status == PostStatus.ACTIVE.value:
+            await self._add_active_posts(created.owner_user_id, 1)
+        return self._identity_map.add(PostMapper.to_domain(created), created.id)
+
+    async def _add_active_posts(self, user_id: int, delta: int) -> None:
+        # Relative, in the caller's transaction: the counter moves together
+        # with the posts and concurrent changes never overwrite each other
+        await self._session.execute(
+            update(UserModel)
+            .where(UserModel.id == user_id)
+            .values(
+                active_post_count=UserModel.active_post_count + delta,
+                updated_at=UserModel.updated_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    async def next_key_number(self) -> int:
+        return await self._session.scalar(select(post_key_seq.next_value()))
 
     async def get_post_by_id(self, post_id: uuid.UUID) -> Post | None:
+        known = self._identity_map.get(Post, post_id)
+        if known is not None:
+            return known
+
         stmt = select(PostModel).where(PostModel.id == post_id)
         result = await self._session.execute(stmt)
         post_model = result.scalars().first()
@@ -28,12 +95,12 @@ class PostRepositoryImpl(PostRepository, BaseSQLAlchemyRepo):
         if post_model is None:
             return None
 
-        return PostMapper.to_domain(post_model)
+        return self._identity_map.add(PostMapper.to_domain(post_model), post_id)
 
     async def get_post_by_key(self, key: str) -> Post | None:
         stmt = select(PostModel).where(
             PostModel.unique_key == key,
-            PostModel.status == PostStatus.ACTIVE.value,
+            active_post_filter(),
         )
         result = await self._session.execute(stmt)
         post_model = result.scalars().first()
@@ -43,58 +110,190 @@ class PostRepositoryImpl(PostRepository, BaseSQLAlchemyRepo):
 
         return PostMapper.to_domain(post_model)
 
-    async def search_posts_by_key(self, unique_key: str, limit: int = 10) -> list[Post]:
-        stmt = (
-            select(PostModel)
-            .where(
-                PostModel.unique_key == unique_key,
-                PostModel.status == PostStatus.ACTIVE.value,
+    async def search_posts_by_text(
+        self, query: str, user_id: UserId, limit: int = 10
+    ) -> list[Post]:
+        posts: list[Post] = []
+
+        terms = _TERM_RE.findall(query.lower())
+        if terms:
+            # Every term as a prefix, so the word being typed already matches
+            tsquery = func.to_tsquery("simple", " & ".join(f"{t}:*" for t in terms))
+            posts = await self._search_own(
+                PostModel.text_tsv.op("@@")(tsquery),
+                func.ts_rank(PostModel.text_tsv, tsquery),
+                user_id,
+                limit,
             )
-            .limit(limit)
-        )
-        result = await self._session.execute(stmt)
-        return [PostMapper.to_domain(pm) for pm in result.scalars().all()]
 
-    async def get_user_posts(
-        self, user_id: UserId, offset: int = 0, limit: int = 10
+        if not posts:
+            # Fragments inside words never match a lexeme; trigrams catch them
+            pattern = f"%{_escape_like(query)}%"
+            posts = await self._search_own(
+                PostModel.text_md.ilike(pattern, escape="/"),
+                func.similarity(PostModel.text_md, query),
+                user_id,
+                limit,
+            )
+
+        return posts
+
+    async def _search_own(
+        self,
+        condition: ColumnElement[bool],
+        rank: ColumnElement[float],
+        user_id: UserId,
+        limit: int,
     ) -> list[Post]:
+        # Posts carry no visibility flag, so only their key shares them with
+        # others; text search never reaches past the user's own posts. One
+        # user's matches are few enough to rank them all.
         stmt = (
             select(PostModel)
             .where(
+                active_post_filter(),
+                condition,
                 PostModel.owner_user_id == user_id.value,
-                PostModel.status == PostStatus.ACTIVE.value,
             )
-            .order_by(PostModel.created_at.desc())
-            .offset(offset)
+            .order_by(rank.desc())
             .limit(limit)
         )
         result = await self._session.execute(stmt)
         return [PostMapper.to_domain(pm) for pm in result.scalars().all()]
 
-    async def count_user_posts(self, user_id: UserId) -> int:
-        stmt = (
+    async def soft_delete_posts(
+        self, owner_user_id: UserId, post_ids: list[uuid.UUID] | None = None
+    ) -> list[str]:
+        deleted_at = datetime.now(UTC)
+        stmt = update(PostModel).where(
+            # Ownership is part of the statement, so there is no window
+            # between checking the owner and deleting
+            PostModel.owner_user_id == owner_user_id.value,
+            # Only an active post changes the owner's counter
+            active_post_filter(),
+        )
+        if post_ids is not None:
+            # One array parameter keeps the statement text the same for any
+            # number of ids, unlike an expanded IN list
+            stmt = stmt.where(
+                PostModel.id == any_(bindparam("post_ids", post_ids, _UUID_ARRAY))
+            )
+        deleted = (
+            stmt.values(status=PostStatus.DELETED.value, deleted_at=deleted_at)
+            .returning(PostModel.id, PostModel.unique_key)
+            .cte("deleted")
+        )
+        # The counter moves in the same statement, by however many rows the
+        # update above actually changed
+        counted = (
+            update(UserModel)
+            .where(UserModel.id == owner_user_id.value, exists(deleted.select()))
+            .values(
+                active_post_count=UserModel.active_post_count
+                - select(func.count()).select_from(deleted).scalar_subquery(),
+                updated_at=UserModel.updated_at,
+            )
+            .cte("counted")
+        )
+        result = await self._session.execute(
+            select(deleted.c.id, deleted.c.unique_key).add_cte(counted)
+        )
+
+        keys: list[str] = []
+        for post_id, unique_key in result:
+            keys.append(unique_key)
+            known = self._identity_map.peek(Post, post_id)
+            if known is not None:
+                known.status = PostStatus.DELETED
+                known.deleted_at = deleted_at
+        return keys
+
+    async def reconcile_active_post_counts(
+        self, after_user_id: int, limit: int
+    ) -> tuple[int | None, int]:
+        """Recount active posts of the `limit` users following `after_user_id`.
+
+        Returns the last user id of the batch, None past the last user, and
+        how many counters were wrong.
+        """
+        # Locking the batch first waits out transactions that already moved a
+        # counter, so the recount sees their posts; later ones apply their
+        # relative change on top of the repaired value
+        locked = await self._session.scalars(
+            select(UserModel.id)
+            .where(UserModel.id > after_user_id)
+            .order_by(UserModel.id)
+            .limit(limit)
+            .with_for_update()
+        )
+        user_ids = [user_id.value for user_id in locked]
+        if not user_ids:
+            return None, 0
+
+        actual = (
             select(func.count())
             .select_from(PostModel)
-            .where(
-                PostModel.owner_user_id == user_id.value,
-                PostModel.status == PostStatus.ACTIVE.value,
-            )
+            .where(PostModel.owner_user_id == UserModel.id, active_post_filter())
+            .correlate(UserModel)
+            .scalar_subquery()
+        )
+        stmt = (
+            update(UserModel)
+            .where(UserModel.id.in_(user_ids), UserModel.active_post_count != actual)
+            .values(active_post_count=actual, updated_at=UserModel.updated_at)
+            .execution_options(synchronize_session=False)
         )
         result = await self._session.execute(stmt)
-        return result.scalar() or 0
+        return user_ids[-1], result.rowcount
 
-    async def soft_delete_post(self, post_id: uuid.UUID) -> None:
+    async def key_exists(self, key: str) -> bool:
+        stmt = select(
+            select(PostModel).where(PostModel.unique_key == key).exists()
+            | key_archived(key)
+        )
+        result = await self._session.execute(stmt)
+        return result.scalar() or False
+
+    async def iter_unique_keys(self, batch_size: int = 10_000) -> AsyncIterator[str]:
+        stmt = select(PostModel.unique_key).execution_options(yield_per=batch_size)
+        async for key in await self._session.stream_scalars(stmt):
+            yield key
+
+    async def add_shares(self, shares: Mapping[uuid.UUID, int]) -> int:
+        if not shares:
+            return 0
+
+        # Sorted, so concurrent flushes lock rows in the same order
+        deltas = values(
+            column("id", UUID(as_uuid=True)),
+            column("delta", BigInteger),
+            name="deltas",
+        ).data(sorted(shares.items()))
         stmt = (
             update(PostModel)
-            .where(PostModel.id == post_id)
+            .where(PostModel.id == deltas.c.id)
+            # A share is not an edit: keep updated_at, and with it the
+            # versioned inline result ids, as they are
             .values(
-                status=PostStatus.DELETED.value,
-                deleted_at=datetime.now(UTC),
+                shares=PostModel.shares + deltas.c.delta,
+                updated_at=PostModel.updated_at,
             )
+            .execution_options(synchronize_session=False)
         )
-        await self._session.execute(stmt)
+        result = await self._session.execute(stmt)
 
-    async def key_exists(self, key: str) -> bool:
-        stmt = select(select(PostModel).where(PostModel.unique_key == key).exists())
+        for post_id, delta in shares.items():
+            known = self._identity_map.peek(Post, post_id)
+            if known is not None:
+                known.shares += delta
+        return result.rowcount
+
+    async def get_top_shared_posts(self, limit: int = 10) -> list[Post]:
+        stmt = (
+            select(PostModel)
+            .where(active_post_filter(), PostModel.shares > 0)
+            .order_by(PostModel.shares.desc(), PostModel.id)
+            .limit(limit)
+        )
         result = await self._session.execute(stmt)
-        return result.scalar() or False
+        return [PostMapper.to_domain(m) for m in result.scalars().all()]
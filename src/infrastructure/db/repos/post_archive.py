@@ -0,0 +1,61 @@
+from datetime import datetime
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+
+from src.infrastructure.db.models.post import PostModel, deleted_post_filter
+from src.infrastructure.db.models.post_archive import PostArchiveModel
+from src.infrastructure.db.repos.base import BaseSQLAlchemyRepo
+
+# Copied as they are; archived_at is filled in by the archive's default
+_ARCHIVED_COLUMNS = (
+    "id",
+    "owner_user_id",
+    "unique_key",
+    "content_type",
+    "text_md",
+    "telegram_file_id",
+    "buttons",
+    "status",
+    "created_at",
+    "updated_at",
+    "deleted_at",
+    "shares",
+)
+
+
+class PostArchiveRepositoryImpl(BaseSQLAlchemyRepo):
+    async def archive_deleted(self, deleted_before: datetime, limit: int) -> int:
+        """Move up to `limit` posts deleted before `deleted_before`, oldest first.
+
+        Runs as one statement. Rows another transaction holds are skipped
+        rather than waited for, so archival never blocks user writes.
+        Returns how many posts were moved.
+        """
+        batch = (
+            select(PostModel.id)
+            .where(deleted_post_filter(), PostModel.deleted_at < deleted_before)
+            .order_by(PostModel.deleted_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .cte("batch")
+        )
+        moved = (
+            delete(PostModel)
+            .where(PostModel.id == batch.c.id)
+            .returning(*(PostModel.__table__.c[name] for name in _ARCHIVED_COLUMNS))
+            .cte("moved")
+        )
+        stmt = insert(PostArchiveModel).from_select(
+            _ARCHIVED_COLUMNS, select(*(moved.c[name] for name in _ARCHIVED_COLUMNS))
+        )
+        result = await self._session.execute(stmt)
+        return result.rowcount
+
+    async def count_archivable(self, deleted_before: datetime) -> int:
+        stmt = (
+            select(func.count())
+            .select_from(PostModel)
+            .where(deleted_post_filter(), PostModel.deleted_at < deleted_before)
+        )
+        return await self._session.scalar(stmt) or 0
@@ -0,0 +1,90 @@
+from collections.abc import Sequence
+from datetime import timedelta
+
+from sqlalchemy import String, bindparam, delete, func, literal, or_, select, update
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+
+from src.infrastructure.db.models.post import PostModel, post_key_seq
+from src.infrastructure.db.models.post_archive import key_archived
+from src.infrastructure.db.models.post_key_pool import PostKeyPoolModel
+from src.infrastructure.db.repos.base import BaseSQLAlchemyRepo
+
+
+class PostKeyPoolRepositoryImpl(BaseSQLAlchemyRepo):
+    async def next_key_numbers(self, count: int) -> list[int]:
+        stmt = select(post_key_seq.next_value()).select_from(
+            func.generate_series(1, count)
+        )
+        return list(await self._session.scalars(stmt))
+
+    async def reserve(self, keys: Sequence[str], owner: str) -> list[str]:
+        """Lease fresh keys to `owner`, skipping any already used by a post.
+
+        Posts moved to the archive count as using their keys too.
+        """
+        if not keys:
+            return []
+
+        candidates = (
+            func.unnest(bindparam("keys", list(keys), type_=ARRAY(String)))
+            .table_valued("key")
+            .render_derived(name="candidates")
+        )
+        stmt = (
+            insert(PostKeyPoolModel)
+            .from_select(
+                ["key", "leased_by", "leased_at"],
+                select(candidates.c.key, literal(owner), func.now()).where(
+                    ~select(PostModel.id)
+                    .where(PostModel.unique_key == candidates.c.key)
+                    .exists(),
+                    ~key_archived(candidates.c.key),
+                ),
+            )
+            .on_conflict_do_nothing(index_elements=[PostKeyPoolModel.key])
+            .returning(PostKeyPoolModel.key)
+        )
+        return list(await self._session.scalars(stmt))
+
+    async def reclaim(self, owner: str, limit: int, lease_ttl: timedelta) -> list[str]:
+        """Lease released keys and keys whose holder stopped renewing."""
+        expired = (
+            select(PostKeyPoolModel.key)
+            .where(
+                or_(
+                    PostKeyPoolModel.leased_by.is_(None),
+                    PostKeyPoolModel.leased_at < func.now() - lease_ttl,
+                )
+            )
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(PostKeyPoolModel)
+            .where(PostKeyPoolModel.key.in_(expired.scalar_subquery()))
+            .values(leased_by=owner, leased_at=func.now())
+            .returning(PostKeyPoolModel.key)
+        )
+        return list(await self._session.scalars(stmt))
+
+    async def renew(self, owner: str) -> None:
+        stmt = (
+            update(PostKeyPoolModel)
+            .where(PostKeyPoolModel.leased_by == owner)
+            .values(leased_at=func.now())
+        )
+        await self._session.execute(stmt)
+
+    async def release(self, owner: str) -> None:
+        stmt = (
+            update(PostKeyPoolModel)
+            .where(PostKeyPoolModel.leased_by == owner)
+            .values(leased_by=None, leased_at=None)
+        )
+        await self._session.execute(stmt)
+
+    async def delete_keys(self, keys: Sequence[str]) -> None:
+        if not keys:
+            return
+        stmt = delete(PostKeyPoolModel).where(PostKeyPoolModel.key.in_(keys))
+        await self._session.execute(stmt)
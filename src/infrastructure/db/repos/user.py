@@ -1,17 +1,66 @@
-from sqlalchemy import func, select, update
-from sqlalchemy.dialects.postgresql import insert
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any
+
+from sqlalchemy import (
+    Boolean,
+    and_,
+    case,
+    false,
+    func,
+    literal_column,
+    or_,
+    select,
+    true,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import Insert, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from src.domain.user.entity import User
-from src.domain.user.repository import ReferralStats, TopReferrer, UserRepository
-from src.domain.user.vo import LanguageCode, UserId, Username
+from src.domain.user.repository import (
+    ReferralStats,
+    TopReferrer,
+    UserActivity,
+    UserRepository,
+)
+from src.domain.user.vo import LanguageCode, ReferralCount, UserId, Username
+from src.infrastructure.db.identity_map import IdentityMap
 from src.infrastructure.db.mappers import UserMapper
 from src.infrastructure.db.models.user import UserModel
 from src.infrastructure.db.repos.base import BaseSQLAlchemyRepo
 
+DEFAULT_LAST_LOGIN_GRANULARITY = timedelta(minutes=1)
+
+
+@dataclass
+class UserWriteStats:
+    """Process-wide counters of user upserts that did or did not hit disk."""
+
+    written: int = 0
+    suppressed: int = 0
+
 
 class UserRepositoryImpl(UserRepository, BaseSQLAlchemyRepo):
+    def __init__(
+        self,
+        session: AsyncSession,
+        last_login_granularity: timedelta = DEFAULT_LAST_LOGIN_GRANULARITY,
+        stats: UserWriteStats | None = None,
+        identity_map: IdentityMap | None = None,
+    ) -> None:
+        BaseSQLAlchemyRepo.__init__(self, session, identity_map)
+        self._last_login_granularity = last_login_granularity
+        self._stats = stats if stats is not None else UserWriteStats()
+
     async def get_user(self, identifier: UserId | Username) -> User | None:
         if isinstance(identifier, UserId):
+            known = self._identity_map.get(User, identifier.value)
+            if known is not None:
+                return known
             stmt = select(UserModel).where(UserModel.id == identifier)
         else:  # by == "username"
             stmt = select(UserModel).where(UserModel.username == identifier)
@@ -20,7 +69,11 @@ class UserRepositoryImpl(UserRepository, BaseSQLAlchemyRepo):
 
         user_model = result.scalars().first()
 
-        return UserMapper.to_domain(user_model) if user_model else None
+        return self._remember(UserMapper.to_domain(user_model)) if user_model else None
+
+    async def get_language(self, user_id: UserId) -> LanguageCode | None:
+        stmt = select(UserModel.language_code).where(UserModel.id == user_id)
+        return await self._session.scalar(stmt)
 
     async def create_user(self, user: User) -> User:
         stmt = (
@@ -39,7 +92,7 @@ class UserRepositoryImpl(UserRepository, BaseSQLAlchemyRepo):
 
         result = await self._session.execute(stmt)
         orm_model = result.scalar_one()
-        return UserMapper.to_domain(orm_model)
+        return self._remember(UserMapper.to_domain(orm_model))
 
     async def update_user(self, user: User) -> User:
         stmt = (
@@ -56,7 +109,147 @@ class UserRepositoryImpl(UserRepository, BaseSQLAlchemyRepo):
         )
         result = await self._session.execute(stmt)
         orm_model = result.scalar_one()
-        return UserMapper.to_domain(orm_model)
+        return self._remember(UserMapper.to_domain(orm_model))
+
+    async def upsert_user(self, user: User) -> User:
+        upsert = (
+            self._guarded_upsert(
+                [
+                    {
+                        "id": user.id.value,
+                        "username": user.username.value if user.username else None,
+                        "first_name": user.first_name.value,
+                        "last_name": user.last_name.value if user.last_name else None,
+                        "created_at": user.created_at,
+                        "updated_at": user.updated_at,
+                        "last_login_at": user.last_login_at,
+                    }
+                ]
+            )
+            .returning(
+                *UserModel.__table__.c,
+                # xmax is 0 only for a freshly inserted tuple
+                literal_column("xmax = 0", Boolean).label("inserted"),
+                true().label("written"),
+            )
+            .cte("upserted")
+        )
+        # When the guard skips the UPDATE nothing is returned; the row is
+        # unchanged, so the statement's snapshot still has it as is
+        unchanged = select(
+            *UserModel.__table__.c,
+            false().label("inserted"),
+            false().label("written"),
+        ).where(UserModel.id == user.id, ~select(upsert.c.id).exists())
+        rows = union_all(select(upsert), unchanged).subquery("upsert_result")
+        stmt = select(aliased(UserModel, rows), rows.c.inserted, rows.c.written)
+
+        result = await self._session.execute(
+            stmt, execution_options={"populate_existing": True}
+        )
+        row = result.one_or_none()
+
+        if row is None:
+            # The conflicting row was committed after the statement's
+            # snapshot was taken, so the fallback could not see it yet
+            self._stats.suppressed += 1
+            existing = await self.get_user(user.id)
+            if existing is None:
+                msg = f"User {user.id.value} vanished during upsert"
+                raise RuntimeError(msg)
+            existing.inserted = False
+            return existing
+
+        orm_model, inserted, written = row
+        if written:
+            self._stats.written += 1
+        else:
+            self._stats.suppressed += 1
+        upserted = UserMapper.to_domain(orm_model)
+        upserted.inserted = bool(inserted)
+        return self._remember(upserted)
+
+    async def bulk_upsert_activity(self, activities: Sequence[UserActivity]) -> int:
+        if not activities:
+            return 0
+
+        stmt = self._guarded_upsert(
+            [
+                {
+                    "id": activity.user_id,
+                    "username": activity.username,
+                    "first_name": activity.first_name,
+                    "last_name": activity.last_name,
+                    "created_at": activity.seen_at,
+                    "updated_at": activity.seen_at,
+                    "last_login_at": activity.seen_at,
+                }
+                for activity in activities
+            ]
+        ).returning(UserModel.id)
+
+        result = await self._session.execute(stmt)
+        for activity in activities:
+            self._identity_map.remove(User, activity.user_id)
+        written = len(result.all())
+        self._stats.written += written
+        self._stats.suppressed += len(activities) - written
+        return written
+
+    def _remember(self, user: User) -> User:
+        return self._identity_map.add(user, user.id.value)
+
+    def _guarded_upsert(self, rows: list[dict[str, Any]]) -> Insert:
+        """INSERT ... ON CONFLICT DO UPDATE that never rewrites an unchanged row.
+
+        Profile columns are only taken from a row whose updated_at is newer
+        than the stored one, so a buffered activity flushed late cannot undo
+        a profile change written since. updated_at moves with those changes
+        only, and last_login_at moves forward at most once per granularity
+        step. Rows skipped by the guard are not returned.
+        """
+        stmt = insert(UserModel).values(rows)
+        excluded = stmt.excluded
+
+        profile_changed = and_(
+            excluded.updated_at > UserModel.updated_at,
+            or_(
+                UserModel.username.is_distinct_from(excluded.username),
+                UserModel.first_name.is_distinct_from(excluded.first_name),
+                UserModel.last_name.is_distinct_from(excluded.last_name),
+            ),
+        )
+        login_stale = (
+            UserModel.last_login_at
+            < excluded.last_login_at - self._last_login_granularity
+        )
+
+        return stmt.on_conflict_do_update(
+            index_elements=[UserModel.id],
+            set_={
+                "username": case(
+                    (profile_changed, excluded.username),
+                    else_=UserModel.username,
+                ),
+                "first_name": case(
+                    (profile_changed, excluded.first_name),
+                    else_=UserModel.first_name,
+                ),
+                "last_name": case(
+                    (profile_changed, excluded.last_name),
+                    else_=UserModel.last_name,
+                ),
+                "updated_at": case(
+                    (profile_changed, excluded.updated_at),
+                    else_=UserModel.updated_at,
+                ),
+                "last_login_at": case(
+                    (login_stale, excluded.last_login_at),
+                    else_=UserModel.last_login_at,
+                ),
+            },
+            where=or_(profile_changed, login_stale),
+        )
 
     async def delete_user(self, user_id: UserId) -> None:
         raise NotImplementedError
@@ -69,6 +262,10 @@ class UserRepositoryImpl(UserRepository, BaseSQLAlchemyRepo):
         )
         await self._session.execute(stmt)
 
+        known = self._identity_map.peek(User, user_id.value)
+        if known is not None:
+            known.referred_by = referrer_id
+
     async def increment_referral_count(self, user_id: UserId) -> None:
         stmt = (
             update(UserModel)
@@ -77,6 +274,11 @@ class UserRepositoryImpl(UserRepository, BaseSQLAlchemyRepo):
         )
         await self._session.execute(stmt)
 
+        known = self._identity_map.peek(User, user_id.value)
+        if known is not None:
+            current = known.referral_count.value if known.referral_count else 0
+            known.referral_count = ReferralCount(current + 1)
+
     async def get_referral_stats(self) -> ReferralStats:
         total_query = select(func.count()).select_from(UserModel)
         referred_query = (
@@ -123,3 +325,7 @@ class UserRepositoryImpl(UserRepository, BaseSQLAlchemyRepo):
             .values(language_code=language_code)
         )
         await self._session.execute(stmt)
+
+        known = self._identity_map.peek(User, user_id.value)
+        if known is not None:
+            known.language_code = language_code
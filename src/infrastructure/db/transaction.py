@@ -1,17 +1,58 @@
+from collections.abc import Callable
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.common.transaction import TransactionManager
+from src.infrastructure.db.identity_map import IdentityMap
+
+
+class CommitHooks:
+    """Callbacks to run once the session's transaction has committed.
+
+    Lets process-wide caches follow only what was actually written: a
+    rollback drops the pending callbacks without running them.
+    """
+
+    def __init__(self) -> None:
+        self._callbacks: list[Callable[[], None]] = []
+
+    def __len__(self) -> int:
+        return len(self._callbacks)
+
+    def after_commit(self, callback: Callable[[], None]) -> None:
+        self._callbacks.append(callback)
+
+    def run(self) -> None:
+        callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def clear(self) -> None:
+        self._callbacks.clear()
 
 
 class TransactionManagerImpl(TransactionManager):
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self,
+        session: AsyncSession,
+        identity_map: IdentityMap | None = None,
+        commit_hooks: CommitHooks | None = None,
+    ) -> None:
         self.session = session
+        self.identity_map = identity_map
+        self.commit_hooks = commit_hooks
 
     async def commit(self) -> None:
         await self.session.commit()
+        if self.commit_hooks is not None:
+            self.commit_hooks.run()
 
     async def flush(self) -> None:
         await self.session.flush()
 
     async def rollback(self) -> None:
         await self.session.rollback()
+        if self.identity_map is not None:
+            self.identity_map.clear()
+        if self.commit_hooks is not None:
+            self.commit_hooks.clear()
@@ -0,0 +1,135 @@
+"""Base for in-memory buffers written to the database in batches."""
+
+import asyncio
+import contextlib
+import logging
+from abc import ABC, abstractmethod
+from collections.abc import Hashable
+from dataclasses import dataclass
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WriteBehindStats:
+    recorded: int = 0
+    # Records merged into one already pending for the same key
+    coalesced: int = 0
+    flushes: int = 0
+    flushed: int = 0
+    failed_flushes: int = 0
+
+
+class WriteBehindBuffer[K: Hashable, V](ABC):
+    """Merges records per key in memory and writes them out in batches.
+
+    A flush happens every `flush_interval` seconds or as soon as
+    `max_batch_size` keys are pending, and once more on close, so records
+    are lost only if the process dies without shutting down. Subclasses
+    define how two records of one key merge and how a chunk is written.
+    """
+
+    # What is buffered, for log messages
+    subject = "records"
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        *,
+        flush_interval: float,
+        max_batch_size: int,
+    ) -> None:
+        self._session_maker = session_maker
+        self._flush_interval = flush_interval
+        self._max_batch_size = max_batch_size
+        self._pending: dict[K, V] = {}
+        self._wakeup = asyncio.Event()
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+        self.stats = WriteBehindStats()
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    @abstractmethod
+    def _merge(self, older: V, newer: V) -> V:
+        """The pending record of a key once `newer` arrives after `older`."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def _write(self, session: AsyncSession, chunk: dict[K, V]) -> int:
+        """Write one chunk in `session`; returns how many rows changed."""
+        raise NotImplementedError
+
+    def _add(self, key: K, value: V) -> None:
+        self.stats.recorded += 1
+        older = self._pending.get(key)
+        if older is not None:
+            self.stats.coalesced += 1
+            value = self._merge(older, value)
+        self._pending[key] = value
+
+        if len(self._pending) >= self._max_batch_size:
+            self._wakeup.set()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop the background loop and flush whatever is still pending."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self.flush()
+
+    async def flush(self) -> int:
+        async with self._lock:
+            if not self._pending:
+                return 0
+
+            batch = list(self._pending.items())
+            self._pending = {}
+
+            flushed = 0
+            written = 0
+            try:
+                for i in range(0, len(batch), self._max_batch_size):
+                    chunk = batch[i : i + self._max_batch_size]
+                    async with self._session_maker() as session:
+                        written += await self._write(session, dict(chunk))
+                        await session.commit()
+                    flushed += len(chunk)
+            except Exception:
+                self.stats.failed_flushes += 1
+                # Put back what was not written, merged with records that
+                # arrived during the flush
+                for key, value in batch[flushed:]:
+                    newer = self._pending.get(key)
+                    self._pending[key] = (
+                        value if newer is None else self._merge(value, newer)
+                    )
+                raise
+
+            self.stats.flushes += 1
+            self.stats.flushed += flushed
+            logger.debug(
+                "Flushed %s of %d keys, %d rows written", self.subject, flushed, written
+            )
+            return flushed
+
+    async def _run(self) -> None:
+        while True:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), self._flush_interval)
+            self._wakeup.clear()
+
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Failed to flush %s", self.subject)
@@ -1,17 +1,41 @@
-from collections.abc import AsyncIterable
+import logging
+from collections.abc import AsyncIterable, Iterable
 
 from dishka import Provider, Scope, from_context, provide
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
 from src.application.common.transaction import TransactionManager
+from src.application.interfaces.post_cache import PostLookupCache
+from src.application.interfaces.post_key_filter import PostKeyFilter
+from src.application.interfaces.post_queries import PostQueryService
+from src.application.interfaces.post_shares import PostShareRecorder
+from src.application.interfaces.user_activity import UserActivityRecorder
+from src.application.post.keygen import KeyPermutation
 from src.domain.admin import AdminRepository
 from src.domain.post.repository import PostRepository
 from src.domain.user import UserRepository
+from src.infrastructure.cache import (
+    CachedUserRepository,
+    PostDetailCache,
+    PostKeyBloomFilter,
+    UserCache,
+    UserLanguageCache,
+)
 from src.infrastructure.config import Config
+from src.infrastructure.db.activity import UserActivityBuffer
 from src.infrastructure.db.factory import create_engine, create_session_maker
 from src.infrastructure.db.holder import HolderDao
+from src.infrastructure.db.key_pool import PostKeyPool
+from src.infrastructure.db.post_archive import PostArchiver
+from src.infrastructure.db.post_counts import ActivePostCountReconciler
+from src.infrastructure.db.queries import PostQueryServiceImpl
+from src.infrastructure.db.repos.post import PostRepositoryImpl
+from src.infrastructure.db.repos.user import UserWriteStats
+from src.infrastructure.db.shares import PostShareBuffer
 from src.infrastructure.db.transaction import TransactionManagerImpl
 
+logger = logging.getLogger(__name__)
+
 
 class DBProvider(Provider):
     scope = Scope.APP
@@ -31,6 +55,181 @@ class DBProvider(Provider):
     ) -> async_sessionmaker[AsyncSession]:
         return create_session_maker(engine)
 
+    @provide(scope=Scope.APP)
+    def get_user_write_stats(self) -> UserWriteStats:
+        return UserWriteStats()
+
+    @provide(scope=Scope.APP)
+    async def get_user_activity_recorder(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        config: Config,
+        write_stats: UserWriteStats,
+    ) -> AsyncIterable[UserActivityRecorder]:
+        buffer = UserActivityBuffer(
+            session_maker,
+            flush_interval=config.user_activity.flush_interval_ms / 1000,
+            max_batch_size=config.user_activity.max_batch_size,
+            last_login_granularity=config.user_activity.last_login_granularity,
+            write_stats=write_stats,
+        )
+        buffer.start()
+        yield buffer
+        await buffer.close()
+
+    @provide(scope=Scope.APP)
+    async def get_post_share_recorder(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        config: Config,
+    ) -> AsyncIterable[PostShareRecorder]:
+        buffer = PostShareBuffer(
+            session_maker,
+            flush_interval=config.post_shares.flush_interval_ms / 1000,
+            max_batch_size=config.post_shares.max_batch_size,
+        )
+        buffer.start()
+        yield buffer
+        await buffer.close()
+        logger.info(
+            "Post shares: %d recorded, %d flushes, %d failed",
+            buffer.stats.recorded,
+            buffer.stats.flushes,
+            buffer.stats.failed_flushes,
+        )
+
+    @provide(scope=Scope.APP)
+    async def get_active_post_count_reconciler(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        config: Config,
+    ) -> AsyncIterable[ActivePostCountReconciler]:
+        reconciler = ActivePostCountReconciler(
+            session_maker,
+            interval=config.post_counts.reconcile_interval_seconds,
+            batch_size=config.post_counts.reconcile_batch_size,
+        )
+        reconciler.start()
+        yield reconciler
+        await reconciler.close()
+        if reconciler.stats.runs:
+            logger.info(
+                "Active post counters: %d runs, %d repaired, %d failed runs",
+                reconciler.stats.runs,
+                reconciler.stats.repaired,
+                reconciler.stats.failed_runs,
+            )
+
+    @provide(scope=Scope.APP)
+    async def get_post_archiver(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        config: Config,
+    ) -> AsyncIterable[PostArchiver]:
+        archive_config = config.post_archive
+        archiver = PostArchiver(
+            session_maker,
+            retention=archive_config.retention,
+            interval=archive_config.interval_seconds,
+            batch_size=archive_config.batch_size,
+            max_rows_per_second=archive_config.max_rows_per_second,
+            dry_run=archive_config.dry_run,
+        )
+        archiver.start()
+        yield archiver
+        await archiver.close()
+        if archiver.stats.runs:
+            logger.info(
+                "Post archive: %d runs, %d posts in %d batches, "
+                "%.1fs throttled, %d failed runs",
+                archiver.stats.runs,
+                archiver.stats.archived,
+                archiver.stats.batches,
+                archiver.stats.throttled_seconds,
+                archiver.stats.failed_runs,
+            )
+
+    @provide(scope=Scope.APP)
+    def get_user_cache(self, config: Config) -> UserCache:
+        return UserCache(
+            max_size=config.cache.user_max_size,
+            ttl=config.cache.user_ttl_seconds,
+        )
+
+    @provide(scope=Scope.APP)
+    def get_user_language_cache(self, config: Config) -> UserLanguageCache:
+        return UserLanguageCache(
+            max_size=config.cache.language_max_size,
+            ttl=config.cache.language_ttl_seconds,
+        )
+
+    @provide(scope=Scope.APP)
+    def get_post_lookup_cache(self, config: Config) -> Iterable[PostLookupCache]:
+        cache = PostDetailCache(
+            max_size=config.cache.post_max_size,
+            ttl=config.cache.post_ttl_seconds,
+        )
+        yield cache
+        logger.info(
+            "Post lookup cache: %d entries, hit rate %.2f, %d evictions",
+            len(cache),
+            cache.stats.hit_rate,
+            cache.stats.evictions,
+        )
+
+    @provide(scope=Scope.APP)
+    async def get_post_key_filter(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        config: Config,
+    ) -> PostKeyFilter:
+        key_filter = PostKeyBloomFilter(
+            capacity=config.cache.post_key_filter_capacity,
+            error_rate=config.cache.post_key_filter_error_rate,
+        )
+        async with session_maker() as session:
+            async for key in PostRepositoryImpl(session).iter_unique_keys():
+                key_filter.add(key)
+
+        if len(key_filter) > key_filter.capacity:
+            logger.warning(
+                "Post key filter holds %d keys, above its capacity of %d",
+                len(key_filter),
+                key_filter.capacity,
+            )
+        logger.info("Loaded %d post keys into the key filter", len(key_filter))
+        return key_filter
+
+    @provide(scope=Scope.APP)
+    async def get_post_key_pool(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        config: Config,
+        key_permutation: KeyPermutation,
+    ) -> AsyncIterable[PostKeyPool]:
+        pool = PostKeyPool(
+            session_maker,
+            key_permutation,
+            low_water=config.post_keys.pool_low_water,
+            batch_size=config.post_keys.pool_batch_size,
+            lease_ttl=config.post_keys.pool_lease_ttl,
+            check_interval=config.post_keys.pool_check_interval_ms / 1000,
+            allocate_timeout=config.post_keys.pool_allocate_timeout_ms / 1000,
+        )
+        # Only the pool mode leases keys; otherwise the pool stays idle
+        if config.post_keys.mode == "pool":
+            pool.start()
+        yield pool
+        await pool.close()
+        if pool.stats.allocated:
+            logger.info(
+                "Post key pool: %d allocated, %d starved, %d reserved, %d reclaimed",
+                pool.stats.allocated,
+                pool.stats.starved,
+                pool.stats.reserved,
+                pool.stats.reclaimed,
+            )
+
     @provide(scope=Scope.REQUEST)
     async def get_session(
         self,
@@ -43,22 +242,47 @@ class DBProvider(Provider):
     async def get_holder_dao(
         self,
         session: AsyncSession,
-    ) -> HolderDao:
-        return HolderDao(session)
+        config: Config,
+        user_write_stats: UserWriteStats,
+    ) -> AsyncIterable[HolderDao]:
+        holder_dao = HolderDao(
+            session,
+            last_login_granularity=config.user_activity.last_login_granularity,
+            user_write_stats=user_write_stats,
+        )
+        yield holder_dao
+        stats = holder_dao.identity_map.stats
+        if stats.hits:
+            logger.debug(
+                "Identity map avoided %d of %d entity queries",
+                stats.avoided_queries,
+                stats.hits + stats.misses,
+            )
 
     @provide(scope=Scope.REQUEST)
     async def get_transaction_manager(
         self,
-        session: AsyncSession,
+        holder_dao: HolderDao,
     ) -> TransactionManager:
-        return TransactionManagerImpl(session)
+        return TransactionManagerImpl(
+            holder_dao.session, holder_dao.identity_map, holder_dao.commit_hooks
+        )
 
     @provide(scope=Scope.REQUEST)
     async def get_user_repository(
         self,
         holder_dao: HolderDao,
+        user_cache: UserCache,
+        activity_recorder: UserActivityRecorder,
+        language_cache: UserLanguageCache,
     ) -> UserRepository:
-        return holder_dao.user_repo
+        return CachedUserRepository(
+            holder_dao.user_repo,
+            user_cache,
+            activity_recorder,
+            language_cache,
+            holder_dao.commit_hooks,
+        )
 
     @provide(scope=Scope.REQUEST)
     async def get_admin_repository(
@@ -73,3 +297,10 @@ class DBProvider(Provider):
         holder_dao: HolderDao,
     ) -> PostRepository:
         return holder_dao.post_repo
+
+    @provide(scope=Scope.REQUEST)
+    async def get_post_query_service(
+        self,
+        session: AsyncSession,
+    ) -> PostQueryService:
+        return PostQueryServiceImpl(session)
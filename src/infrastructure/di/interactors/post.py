@@ -1,56 +1,133 @@
 from dishka import Provider, Scope, provide
 
 from src.application.common.transaction import TransactionManager
+from src.application.interfaces.post_cache import PostLookupCache
+from src.application.interfaces.post_key_allocator import PostKeyAllocator
+from src.application.interfaces.post_key_filter import PostKeyFilter
+from src.application.interfaces.post_queries import PostQueryService
+from src.application.interfaces.post_shares import PostShareRecorder
 from src.application.post.create import CreatePostInteractor
-from src.application.post.delete import DeletePostInteractor
+from src.application.post.delete import DeletePostInteractor, DeletePostsInteractor
 from src.application.post.get_detail import GetPostDetailInteractor
 from src.application.post.get_user_posts import GetUserPostsInteractor
+from src.application.post.key_allocator import SequenceKeyAllocator
+from src.application.post.keygen import KeyPermutation
+from src.application.post.record_share import RecordPostShareInteractor
 from src.application.post.search_by_key import SearchPostsByKeyInteractor
+from src.application.post.search_by_text import SearchPostsByTextInteractor
+from src.application.post.top_shared import GetTopSharedPostsInteractor
 from src.domain.post.repository import PostRepository
+from src.infrastructure.config import Config
+from src.infrastructure.db.key_pool import PostKeyPool
 
 
 class PostInteractorProvider(Provider):
     scope = Scope.REQUEST
 
+    @provide(scope=Scope.APP)
+    def provide_key_permutation(self, config: Config) -> KeyPermutation:
+        secret = config.post_keys.secret or config.auth.secret_key
+        return KeyPermutation(secret.encode())
+
+    @provide
+    def provide_post_key_allocator(
+        self,
+        config: Config,
+        post_repository: PostRepository,
+        key_permutation: KeyPermutation,
+        key_pool: PostKeyPool,
+    ) -> PostKeyAllocator:
+        if config.post_keys.mode == "pool":
+            return key_pool
+        return SequenceKeyAllocator(
+            post_repository=post_repository, key_permutation=key_permutation
+        )
+
     @provide
     def provide_create_post_interactor(
         self,
         post_repository: PostRepository,
         transaction_manager: TransactionManager,
+        key_filter: PostKeyFilter,
+        key_allocator: PostKeyAllocator,
     ) -> CreatePostInteractor:
         return CreatePostInteractor(
             post_repository=post_repository,
             transaction_manager=transaction_manager,
+            key_filter=key_filter,
+            key_allocator=key_allocator,
         )
 
     @provide
     def provide_get_user_posts_interactor(
         self,
-        post_repository: PostRepository,
+        post_queries: PostQueryService,
     ) -> GetUserPostsInteractor:
-        return GetUserPostsInteractor(post_repository=post_repository)
+        return GetUserPostsInteractor(post_queries=post_queries)
 
     @provide
     def provide_get_post_detail_interactor(
         self,
-        post_repository: PostRepository,
+        post_queries: PostQueryService,
     ) -> GetPostDetailInteractor:
-        return GetPostDetailInteractor(post_repository=post_repository)
+        return GetPostDetailInteractor(post_queries=post_queries)
 
     @provide
     def provide_delete_post_interactor(
         self,
         post_repository: PostRepository,
         transaction_manager: TransactionManager,
+        post_cache: PostLookupCache,
     ) -> DeletePostInteractor:
         return DeletePostInteractor(
             post_repository=post_repository,
             transaction_manager=transaction_manager,
+            post_cache=post_cache,
         )
 
     @provide
-    def provide_search_posts_by_key_interactor(
+    def provide_delete_posts_interactor(
         self,
         post_repository: PostRepository,
+        transaction_manager: TransactionManager,
+        post_cache: PostLookupCache,
+    ) -> DeletePostsInteractor:
+        return DeletePostsInteractor(
+            post_repository=post_repository,
+            transaction_manager=transaction_manager,
+            post_cache=post_cache,
+        )
+
+    @provide
+    def provide_search_posts_by_key_interactor(
+        self,
+        post_queries: PostQueryService,
+        post_cache: PostLookupCache,
+        key_filter: PostKeyFilter,
     ) -> SearchPostsByKeyInteractor:
-        return SearchPostsByKeyInteractor(post_repository=post_repository)
+        return SearchPostsByKeyInteractor(
+            post_queries=post_queries,
+            post_cache=post_cache,
+            key_filter=key_filter,
+        )
+
+    @provide
+    def provide_search_posts_by_text_interactor(
+        self,
+        post_repository: PostRepository,
+    ) -> SearchPostsByTextInteractor:
+        return SearchPostsByTextInteractor(post_repository=post_repository)
+
+    @provide
+    def provide_record_post_share_interactor(
+        self,
+        share_recorder: PostShareRecorder,
+    ) -> RecordPostShareInteractor:
+        return RecordPostShareInteractor(share_recorder=share_recorder)
+
+    @provide
+    def provide_get_top_shared_posts_interactor(
+        self,
+        post_repository: PostRepository,
+    ) -> GetTopSharedPostsInteractor:
+        return GetTopSharedPostsInteractor(post_repository=post_repository)
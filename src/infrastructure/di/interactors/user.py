@@ -3,6 +3,7 @@ from dishka import Provider, Scope, provide
 from src.application.common.transaction import TransactionManager
 from src.application.user.create import CreateUserInteractor
 from src.application.user.get_me import GetUserProfileInteractor
+from src.application.user.interactors.get_language import GetUserLanguageInteractor
 from src.application.user.interactors.update_language import UpdateLanguageInteractor
 from src.application.user.service import UserService
 from src.domain.user import UserRepository
@@ -48,3 +49,10 @@ class UserInteractorProvider(Provider):
             user_repository=user_repository,
             transaction_manager=transaction_manager,
         )
+
+    @provide
+    def provide_get_user_language_interactor(
+        self,
+        user_repository: UserRepository,
+    ) -> GetUserLanguageInteractor:
+        return GetUserLanguageInteractor(user_repository)
@@ -8,5 +8,79 @@ class TranslatorRunner:
     """Type stubs for FluentTranslator with all available translation keys."""
 
     def bot_started(self) -> str: ...
+    def btn_back(self) -> str: ...
+    def btn_back_to_list(self) -> str: ...
+    def btn_back_to_menu(self) -> str: ...
+    def btn_cancel(self) -> str: ...
+    def btn_confirm(self) -> str: ...
+    def btn_create_post(self) -> str: ...
+    def btn_delete(self) -> str: ...
+    def btn_delete_all(self) -> str: ...
+    def btn_delete_selected(self, *, count: str | int) -> str: ...
+    def btn_delete_yes(self) -> str: ...
+    def btn_edit(self) -> str: ...
+    def btn_gif(self) -> str: ...
+    def btn_language(self) -> str: ...
+    def btn_my_posts(self) -> str: ...
+    def btn_next_page(self) -> str: ...
+    def btn_photo(self) -> str: ...
+    def btn_prev_page(self) -> str: ...
+    def btn_preview(self) -> str: ...
+    def btn_select(self) -> str: ...
+    def btn_settings(self) -> str: ...
+    def btn_share(self) -> str: ...
+    def btn_skip(self) -> str: ...
+    def btn_text(self) -> str: ...
+    def btn_video(self) -> str: ...
+    def choose_post_type(self) -> str: ...
+    def delete_all_confirm(self) -> str: ...
+    def delete_confirm(self) -> str: ...
+    def delete_selected_confirm(self, *, count: str | int) -> str: ...
     def example_executed(self) -> str: ...
-    def welcome(self, *, name: str | int) -> str: ...
+    def help_text(self, *, bot_username: str | int) -> str: ...
+    def inline_not_found(self) -> str: ...
+    def internal_error(self) -> str: ...
+    def invalid_dsl(self) -> str: ...
+    def lang_en(self) -> str: ...
+    def lang_ru(self) -> str: ...
+    def main_menu(self) -> str: ...
+    def my_posts_empty(self) -> str: ...
+    def my_posts_select_title(self, *, count: str | int) -> str: ...
+    def my_posts_title(self, *, count: str | int) -> str: ...
+    def onboarding_language(self) -> str: ...
+    def open_bot_to_create_post(self) -> str: ...
+    def post_actions_hint(self) -> str: ...
+    def post_deleted(self) -> str: ...
+    def post_saved_header(self) -> str: ...
+    def post_shares(self, *, count: str | int) -> str: ...
+    def posts_deleted(self, *, count: str | int) -> str: ...
+    def preview_title(self) -> str: ...
+    def referral_info(self, *, link: str | int, count: str | int) -> str: ...
+    def referral_user_not_found(self) -> str: ...
+    def send_buttons_dsl(self) -> str: ...
+    def send_gif_content(self) -> str: ...
+    def send_photo_content(self) -> str: ...
+    def send_text_content(self) -> str: ...
+    def send_video_content(self) -> str: ...
+    def settings_language_changed(self) -> str: ...
+    def settings_language_title(self) -> str: ...
+    def settings_title(self) -> str: ...
+    def stats_no_inviters(self) -> str: ...
+    def stats_no_shared_posts(self) -> str: ...
+    def stats_overview(
+        self,
+        *,
+        total: str | int,
+        referred: str | int,
+        referred_pct: str | int,
+        organic: str | int,
+        organic_pct: str | int,
+    ) -> str: ...
+    def stats_top_inviters_btn(self) -> str: ...
+    def stats_top_inviters_header(self, *, limit: str | int) -> str: ...
+    def stats_top_posts_btn(self) -> str: ...
+    def stats_top_posts_header(self, *, limit: str | int) -> str: ...
+    def text_too_long(self) -> str: ...
+    def welcome(self) -> str: ...
+    def wizard_cancelled(self) -> str: ...
+    def wrong_content_type(self, *, expected_type: str | int) -> str: ...
@@ -69,4 +69,5 @@ def create_app() -> Litestar:
     )
 
     setup_dishka(container=container, app=app)
+    app.on_shutdown.append(container.close)
     return app
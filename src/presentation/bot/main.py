@@ -11,7 +11,11 @@ from dishka import make_async_container
 from dishka.integrations.aiogram import setup_dishka
 from fluentogram import TranslatorHub
 
+from src.application.interfaces.post_key_filter import PostKeyFilter
 from src.infrastructure.config import Config, load_config
+from src.infrastructure.db.key_pool import PostKeyPool
+from src.infrastructure.db.post_archive import PostArchiver
+from src.infrastructure.db.post_counts import ActivePostCountReconciler
 from src.infrastructure.di import (
     AuthProvider,
     DBProvider,
@@ -20,6 +24,7 @@ from src.infrastructure.di import (
 )
 from src.infrastructure.i18n import DEFAULT_LANGUAGE
 from src.presentation.bot.middleware.user_and_locale import UserAndLocaleMiddleware
+from src.presentation.bot.providers import BotProvider
 from src.presentation.bot.routers import setup_routers
 
 
@@ -64,10 +69,22 @@ async def main() -> None:
         AuthProvider(),
         DBProvider(),
         I18nProvider(),
+        BotProvider(),
         *interactor_provider_instances,
         context={Config: config},
     )
     setup_dishka(container=container, router=dp)
+    # Closing the container flushes write-behind buffers before exit
+    dp.shutdown.register(container.close)
+
+    # Build the post key filter before the first inline query needs it
+    await container.get(PostKeyFilter)
+    # Start filling the key pool (in pool mode) before the first post
+    await container.get(PostKeyPool)
+    # Schedule the periodic repair of the active post counters
+    await container.get(ActivePostCountReconciler)
+    # Schedule moving long-deleted posts out of the posts table
+    await container.get(PostArchiver)
 
     async with container() as request_container:
         # Get TranslatorHub and admin notification
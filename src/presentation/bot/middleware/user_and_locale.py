@@ -4,6 +4,7 @@ from collections.abc import Awaitable, Callable
 from typing import Any
 
 from aiogram import BaseMiddleware
+from aiogram.dispatcher.event.handler import HandlerObject
 from aiogram.types import TelegramObject
 from aiogram.types import User as AiogramUser
 from dishka import AsyncContainer
@@ -15,13 +16,20 @@ from src.application.user.dtos import (
     CreateUserInputDTO,
     CreateUserOutputDTO,
 )
+from src.application.user.interactors import (
+    GetUserLanguageDTO,
+    GetUserLanguageInteractor,
+)
+from src.domain.user.vo import UserId
 from src.presentation.bot.utils.i18n import extract_language_code
 
 
 class UserAndLocaleMiddleware(BaseMiddleware):
     """Middleware that loads and injects user and i18n.
 
-    Adds `user` (or None) and `i18n` to handler data dict.
+    Adds `i18n` to handler data dict, and `user` only for handlers that
+    declare it. Other handlers (inline queries, static commands) skip the
+    upsert and take the locale from the cached user language map instead.
     """
 
     async def __call__(
@@ -35,26 +43,36 @@ class UserAndLocaleMiddleware(BaseMiddleware):
             return await handler(event, data)
 
         container: AsyncContainer = data[CONTAINER_NAME]
-        upsert_interactor = await container.get(CreateUserInteractor)
         hub = await container.get(TranslatorHub)
 
-        # Create or update user
-        user_dto: CreateUserOutputDTO = await upsert_interactor(
-            data=CreateUserInputDTO(
-                id=from_user.id,
-                username=from_user.username,
-                first_name=from_user.first_name,
-                last_name=from_user.last_name,
+        language_code: str | None
+        if self._needs_user(data):
+            upsert_interactor = await container.get(CreateUserInteractor)
+            # Create or update user
+            user_dto: CreateUserOutputDTO = await upsert_interactor(
+                data=CreateUserInputDTO(
+                    id=from_user.id,
+                    username=from_user.username,
+                    first_name=from_user.first_name,
+                    last_name=from_user.last_name,
+                )
+            )
+            data["user"] = user_dto
+            language_code = user_dto.language_code
+        else:
+            language_interactor = await container.get(GetUserLanguageInteractor)
+            language_code = await language_interactor(
+                GetUserLanguageDTO(user_id=UserId(from_user.id))
             )
-        )
 
         # Get locale: prefer saved language, fallback to Telegram language
-        if user_dto.language_code:
-            locale = user_dto.language_code
-        else:
-            locale = extract_language_code(from_user.language_code)
+        locale = language_code or extract_language_code(from_user.language_code)
 
-        data["user"] = user_dto
         data["i18n"] = hub.get_translator_by_locale(locale)
 
         return await handler(event, data)
+
+    @staticmethod
+    def _needs_user(data: dict[str, Any]) -> bool:
+        handler_object: HandlerObject | None = data.get("handler")
+        return handler_object is None or "user" in handler_object.params
@@ -0,0 +1,22 @@
+from dishka import Provider, Scope, provide
+
+from src.infrastructure.config import Config
+from src.presentation.bot.utils.inline_results import (
+    InlineCachePolicy,
+    InlineResultCache,
+)
+
+
+class BotProvider(Provider):
+    scope = Scope.APP
+
+    @provide
+    def get_inline_result_cache(self, config: Config) -> InlineResultCache:
+        return InlineResultCache(max_size=config.cache.inline_result_max_size)
+
+    @provide
+    def get_inline_cache_policy(self, config: Config) -> InlineCachePolicy:
+        return InlineCachePolicy(
+            content_cache_seconds=config.inline.content_cache_seconds,
+            short_cache_seconds=config.inline.short_cache_seconds,
+        )
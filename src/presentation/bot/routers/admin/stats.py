@@ -1,6 +1,6 @@
 import logging
 
-from aiogram import F, Router
+from aiogram import F, Router, html
 from aiogram.filters import Command
 from aiogram.types import (
     CallbackQuery,
@@ -11,6 +11,7 @@ from aiogram.types import (
 from dishka.integrations.aiogram import FromDishka, inject
 from fluentogram import TranslatorHub
 
+from src.application.post.top_shared import GetTopSharedPostsInteractor
 from src.application.referral.stats import GetStatsInteractor, GetTopReferrersInteractor
 from src.presentation.bot.utils.i18n import extract_language_code
 
@@ -44,7 +45,13 @@ async def stats_handler(
                     text="Check Alive",
                     callback_data="check_alive",
                 ),
-            ]
+            ],
+            [
+                InlineKeyboardButton(
+                    text=i18n.get("stats-top-posts-btn"),
+                    callback_data="post_top",
+                ),
+            ],
         ]
     )
 
@@ -90,6 +97,35 @@ async def ref_top_callback(
     await callback.answer()
 
 
+@router.callback_query(F.data == "post_top")
+@inject
+async def post_top_callback(
+    callback: CallbackQuery,
+    hub: FromDishka[TranslatorHub],
+    interactor: FromDishka[GetTopSharedPostsInteractor],
+) -> None:
+    """Handle top shared posts callback."""
+    logger.info("Admin %s requested top shared posts", callback.from_user.id)
+    locale = extract_language_code(callback.from_user.language_code)
+    i18n = hub.get_translator_by_locale(locale)
+
+    limit = 10
+    top = await interactor(limit)
+
+    if not top:
+        await callback.message.edit_text(text=i18n.get("stats-no-shared-posts"))
+        await callback.answer()
+        return
+
+    text = i18n.get("stats-top-posts-header", limit=limit) + "\n\n"
+    for i, post in enumerate(top, 1):
+        preview = html.quote(post.text_preview or post.content_type)
+        text += f"{i}. <code>{post.unique_key}</code> {preview} — {post.shares}\n"
+
+    await callback.message.edit_text(text=text)
+    await callback.answer()
+
+
 @router.callback_query(F.data == "admin:back_to_stats")
 @inject
 async def cb_back_to_stats(
@@ -115,7 +151,13 @@ async def cb_back_to_stats(
                     text="Check Alive",
                     callback_data="check_alive",
                 ),
-            ]
+            ],
+            [
+                InlineKeyboardButton(
+                    text=i18n.get("stats-top-posts-btn"),
+                    callback_data="post_top",
+                ),
+            ],
         ]
     )
 
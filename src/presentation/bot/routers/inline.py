@@ -1,25 +1,29 @@
-import hashlib
 import logging
 
 from aiogram import Router
-from aiogram.types import (
-    ChosenInlineResult,
-    InlineQuery,
-    InlineQueryResultArticle,
-    InlineQueryResultCachedGif,
-    InlineQueryResultCachedPhoto,
-    InlineQueryResultCachedVideo,
-    InputTextMessageContent,
-)
+from aiogram.types import ChosenInlineResult, InlineQuery
 from dishka.integrations.aiogram import FromDishka, inject
 from fluentogram import TranslatorRunner
 
-from src.application.post.dtos import PostDetailDTO
+from src.application.post.dtos import PostSearchPageDTO
+from src.application.post.keygen import is_valid_key
+from src.application.post.record_share import (
+    RecordPostShareInputDTO,
+    RecordPostShareInteractor,
+)
 from src.application.post.search_by_key import (
     SearchPostsByKeyInputDTO,
     SearchPostsByKeyInteractor,
 )
-from src.presentation.bot.utils.markups.post import build_inline_keyboard_from_buttons
+from src.application.post.search_by_text import (
+    SearchPostsByTextInputDTO,
+    SearchPostsByTextInteractor,
+)
+from src.presentation.bot.utils.inline_results import (
+    InlineCachePolicy,
+    InlineResultCache,
+    parse_inline_result_id,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -30,8 +34,12 @@ router = Router(name="inline")
 @inject
 async def inline_query_handler(
     query: InlineQuery,
+    *,
     i18n: TranslatorRunner,
     search_posts: FromDishka[SearchPostsByKeyInteractor],
+    search_posts_text: FromDishka[SearchPostsByTextInteractor],
+    result_cache: FromDishka[InlineResultCache],
+    cache_policy: FromDishka[InlineCachePolicy],
 ) -> None:
     logger.info("User %s inline query: %r", query.from_user.id, query.query)
     search_text = query.query.strip()
@@ -39,92 +47,107 @@ async def inline_query_handler(
     if not search_text:
         await query.answer(
             results=[],
-            cache_time=5,
+            cache_time=cache_policy.short_cache_time,
             is_personal=True,
             switch_pm_text=i18n.get("open-bot-to-create-post"),
             switch_pm_parameter="start",
         )
         return
 
-    posts = await search_posts(SearchPostsByKeyInputDTO(query=search_text))
+    page = await search_posts(
+        SearchPostsByKeyInputDTO(
+            query=search_text, user_id=query.from_user.id, offset=query.offset
+        )
+    )
+    if query.offset:
+        # A follow-up page of own posts: answer it as is, even when empty
+        await _answer_page(
+            query,
+            page,
+            is_personal=True,
+            cache_time=cache_policy.short_cache_time,
+            result_cache=result_cache,
+        )
+        return
 
-    if not posts:
+    # A full key matches the same post for everyone, and only that post
+    if page.items and is_valid_key(search_text.lower()):
+        await _answer_page(
+            query,
+            page,
+            is_personal=False,
+            cache_time=cache_policy.exact_key_cache_time(page.items[0]),
+            result_cache=result_cache,
+        )
+        return
+
+    # Any short word also reads as a partial key, so the text of the user's
+    # own posts is always searched and added after the key matches
+    text_page = await search_posts_text(
+        SearchPostsByTextInputDTO(query=search_text, user_id=query.from_user.id)
+    )
+    page = _merge_pages(page, text_page)
+
+    if not page.items:
         await query.answer(
             results=[],
-            cache_time=5,
+            cache_time=cache_policy.short_cache_time,
             is_personal=True,
             switch_pm_text=i18n.get("inline-not-found"),
             switch_pm_parameter="start",
         )
         return
 
+    await _answer_page(
+        query,
+        page,
+        is_personal=True,
+        cache_time=cache_policy.short_cache_time,
+        result_cache=result_cache,
+    )
+
+
+def _merge_pages(
+    key_page: PostSearchPageDTO, text_page: PostSearchPageDTO
+) -> PostSearchPageDTO:
+    """Key matches, then text matches not among them; pages by key only."""
+    seen = {post.id for post in key_page.items}
+    return PostSearchPageDTO(
+        items=[
+            *key_page.items,
+            *(post for post in text_page.items if post.id not in seen),
+        ],
+        next_offset=key_page.next_offset,
+    )
+
+
+async def _answer_page(
+    query: InlineQuery,
+    page: PostSearchPageDTO,
+    *,
+    is_personal: bool,
+    cache_time: int,
+    result_cache: InlineResultCache,
+) -> None:
     results = []
-    for post in posts:
-        result = _build_inline_result(post)
+    for post in page.items:
+        result = result_cache.get_or_build(post)
         if result:
             results.append(result)
 
     await query.answer(
         results=results,
-        cache_time=5,
-        is_personal=False,
+        cache_time=cache_time,
+        is_personal=is_personal,
+        next_offset=page.next_offset,
     )
 
 
-def _build_inline_result(
-    post: PostDetailDTO,
-) -> (
-    InlineQueryResultArticle
-    | InlineQueryResultCachedPhoto
-    | InlineQueryResultCachedVideo
-    | InlineQueryResultCachedGif
-    | None
-):
-    result_id = hashlib.md5(post.unique_key.encode()).hexdigest()  # noqa: S324
-    reply_markup = build_inline_keyboard_from_buttons(post.buttons)
-
-    if post.content_type == "text":
-        return InlineQueryResultArticle(
-            id=result_id,
-            title=post.text_md[:50] if post.text_md else post.unique_key,
-            description=post.text_md[:100] if post.text_md else "",
-            input_message_content=InputTextMessageContent(
-                message_text=post.text_md or "",
-            ),
-            reply_markup=reply_markup,
-        )
-
-    if post.content_type == "photo" and post.telegram_file_id:
-        return InlineQueryResultCachedPhoto(
-            id=result_id,
-            photo_file_id=post.telegram_file_id,
-            caption=post.text_md or "",
-            reply_markup=reply_markup,
-        )
-
-    if post.content_type == "video" and post.telegram_file_id:
-        return InlineQueryResultCachedVideo(
-            id=result_id,
-            video_file_id=post.telegram_file_id,
-            title=post.text_md[:50] if post.text_md else post.unique_key,
-            caption=post.text_md or "",
-            reply_markup=reply_markup,
-        )
-
-    if post.content_type == "gif" and post.telegram_file_id:
-        return InlineQueryResultCachedGif(
-            id=result_id,
-            gif_file_id=post.telegram_file_id,
-            caption=post.text_md or "",
-            reply_markup=reply_markup,
-        )
-
-    return None
-
-
 @router.chosen_inline_result()
+@inject
 async def chosen_inline_result_handler(
     chosen_result: ChosenInlineResult,
+    record_share: FromDishka[RecordPostShareInteractor],
 ) -> None:
     logger.info(
         "Inline result chosen: query=%s, result_id=%s, user_id=%s",
@@ -132,3 +155,6 @@ async def chosen_inline_result_handler(
         chosen_result.result_id,
         chosen_result.from_user.id,
     )
+    post_id = parse_inline_result_id(chosen_result.result_id)
+    if post_id is not None:
+        await record_share(RecordPostShareInputDTO(post_id=post_id))
@@ -2,11 +2,17 @@ import logging
 import uuid
 
 from aiogram import F, Router
+from aiogram.fsm.context import FSMContext
 from aiogram.types import CallbackQuery
 from dishka.integrations.aiogram import FromDishka, inject
 from fluentogram import TranslatorRunner
 
-from src.application.post.delete import DeletePostInputDTO, DeletePostInteractor
+from src.application.post.delete import (
+    DeletePostInputDTO,
+    DeletePostInteractor,
+    DeletePostsInputDTO,
+    DeletePostsInteractor,
+)
 from src.application.post.get_detail import (
     GetPostDetailInputDTO,
     GetPostDetailInteractor,
@@ -17,12 +23,15 @@ from src.application.post.get_user_posts import (
 )
 from src.application.user.dtos import CreateUserOutputDTO
 from src.infrastructure.config import Config
+from src.presentation.bot.states.my_posts import MyPostsSelection
 from src.presentation.bot.utils.cb_data import MainMenuCBData, MyPostsCBData
 from src.presentation.bot.utils.markups.post import (
     build_inline_keyboard_from_buttons,
+    get_bulk_delete_confirm_keyboard,
     get_delete_confirm_keyboard,
     get_main_menu_keyboard,
     get_my_posts_keyboard,
+    get_my_posts_select_keyboard,
     get_post_actions_keyboard,
 )
 
@@ -40,7 +49,7 @@ async def my_posts_list(
     get_user_posts: FromDishka[GetUserPostsInteractor],
 ) -> None:
     logger.info("User %s opened my posts list", callback.from_user.id)
-    await _show_posts_page(callback, i18n, user, get_user_posts, page=1)
+    await _show_posts_page(callback, i18n, user, get_user_posts)
 
 
 @router.callback_query(MyPostsCBData.filter(F.action == "page"))
@@ -52,11 +61,9 @@ async def my_posts_page(
     user: CreateUserOutputDTO,
     get_user_posts: FromDishka[GetUserPostsInteractor],
 ) -> None:
-    logger.info(
-        "User %s navigated to posts page %s", callback.from_user.id, callback_data.page
-    )
+    logger.info("User %s navigated to another posts page", callback.from_user.id)
     await _show_posts_page(
-        callback, i18n, user, get_user_posts, page=callback_data.page
+        callback, i18n, user, get_user_posts, cursor=callback_data.cursor
     )
 
 
@@ -65,9 +72,9 @@ async def _show_posts_page(
     i18n: TranslatorRunner,
     user: CreateUserOutputDTO,
     get_user_posts: GetUserPostsInteractor,
-    page: int,
+    cursor: str = "",
 ) -> None:
-    result = await get_user_posts(GetUserPostsInputDTO(user_id=user.id, page=page))
+    result = await get_user_posts(GetUserPostsInputDTO(user_id=user.id, cursor=cursor))
 
     if not result.items:
         await callback.message.edit_text(
@@ -80,7 +87,11 @@ async def _show_posts_page(
     await callback.message.edit_text(
         text=i18n.get("my-posts-title", count=str(result.total)),
         reply_markup=get_my_posts_keyboard(
-            result.items, result.page, result.total, i18n
+            result.items,
+            i18n,
+            cursor=cursor,
+            prev_cursor=result.prev_cursor,
+            next_cursor=result.next_cursor,
         ),
     )
     await callback.answer()
@@ -137,7 +148,8 @@ async def preview_post(
 
     # Send actions separately
     hint_text = (
-        f"🔑 <code>@{config.telegram.bot_username} {post.unique_key}</code>\n\n"
+        f"🔑 <code>@{config.telegram.bot_username} {post.unique_key}</code>\n"
+        f"{i18n.get('post-shares', count=post.shares)}\n\n"
         f"{i18n.get('post-actions-hint')}"
     )
     await content_message.reply(
@@ -197,3 +209,179 @@ async def delete_post_execute(
             reply_markup=get_main_menu_keyboard(i18n),
         )
     await callback.answer()
+
+
+# Multi-select: the selected post ids and the page being shown live in the
+# FSM data, callback data is too short to carry them next to a cursor
+
+
+@router.callback_query(MyPostsCBData.filter(F.action == "select"))
+@inject
+async def select_posts_page(
+    callback: CallbackQuery,
+    callback_data: MyPostsCBData,
+    *,
+    i18n: TranslatorRunner,
+    user: CreateUserOutputDTO,
+    state: FSMContext,
+    get_user_posts: FromDishka[GetUserPostsInteractor],
+) -> None:
+    if await state.get_state() != MyPostsSelection.selecting:
+        logger.info("User %s started selecting posts", callback.from_user.id)
+        await state.set_state(MyPostsSelection.selecting)
+        await state.set_data({"selected": []})
+    await state.update_data(cursor=callback_data.cursor)
+    await _show_select_page(callback, i18n, user, state, get_user_posts)
+
+
+@router.callback_query(
+    MyPostsSelection.selecting, MyPostsCBData.filter(F.action == "toggle")
+)
+@inject
+async def toggle_post_selection(
+    callback: CallbackQuery,
+    callback_data: MyPostsCBData,
+    *,
+    i18n: TranslatorRunner,
+    user: CreateUserOutputDTO,
+    state: FSMContext,
+    get_user_posts: FromDishka[GetUserPostsInteractor],
+) -> None:
+    data = await state.get_data()
+    selected = set(data.get("selected", []))
+    selected ^= {callback_data.post_id}
+    await state.update_data(selected=sorted(selected))
+    await _show_select_page(callback, i18n, user, state, get_user_posts)
+
+
+async def _show_select_page(
+    callback: CallbackQuery,
+    i18n: TranslatorRunner,
+    user: CreateUserOutputDTO,
+    state: FSMContext,
+    get_user_posts: GetUserPostsInteractor,
+) -> None:
+    data = await state.get_data()
+    selected = set(data.get("selected", []))
+    result = await get_user_posts(
+        GetUserPostsInputDTO(user_id=user.id, cursor=data.get("cursor", ""))
+    )
+
+    if not result.items:
+        await state.clear()
+        await callback.message.edit_text(
+            text=i18n.get("my-posts-empty"),
+            reply_markup=get_main_menu_keyboard(i18n),
+        )
+        await callback.answer()
+        return
+
+    await callback.message.edit_text(
+        text=i18n.get("my-posts-select-title", count=str(len(selected))),
+        reply_markup=get_my_posts_select_keyboard(
+            result.items,
+            selected,
+            i18n,
+            prev_cursor=result.prev_cursor,
+            next_cursor=result.next_cursor,
+        ),
+    )
+    await callback.answer()
+
+
+@router.callback_query(MyPostsCBData.filter(F.action == "select_cancel"))
+@inject
+async def cancel_selection(
+    callback: CallbackQuery,
+    i18n: TranslatorRunner,
+    user: CreateUserOutputDTO,
+    state: FSMContext,
+    get_user_posts: FromDishka[GetUserPostsInteractor],
+) -> None:
+    cursor = ""
+    if await state.get_state() == MyPostsSelection.selecting:
+        cursor = (await state.get_data()).get("cursor", "")
+        await state.clear()
+    await _show_posts_page(callback, i18n, user, get_user_posts, cursor=cursor)
+
+
+@router.callback_query(
+    MyPostsSelection.selecting, MyPostsCBData.filter(F.action == "delete_selected")
+)
+async def delete_selected_confirm(
+    callback: CallbackQuery,
+    i18n: TranslatorRunner,
+    state: FSMContext,
+) -> None:
+    selected = (await state.get_data()).get("selected", [])
+    await callback.message.edit_text(
+        text=i18n.get("delete-selected-confirm", count=str(len(selected))),
+        reply_markup=get_bulk_delete_confirm_keyboard("delete_selected_confirm", i18n),
+    )
+    await callback.answer()
+
+
+@router.callback_query(
+    MyPostsSelection.selecting,
+    MyPostsCBData.filter(F.action == "delete_selected_confirm"),
+)
+@inject
+async def delete_selected_execute(
+    callback: CallbackQuery,
+    i18n: TranslatorRunner,
+    user: CreateUserOutputDTO,
+    state: FSMContext,
+    delete_posts: FromDishka[DeletePostsInteractor],
+) -> None:
+    selected = (await state.get_data()).get("selected", [])
+    await state.clear()
+    logger.info(
+        "User %s confirmed deletion of %d selected posts",
+        callback.from_user.id,
+        len(selected),
+    )
+    deleted = await delete_posts(
+        DeletePostsInputDTO(
+            user_id=user.id, post_ids=[uuid.UUID(post_id) for post_id in selected]
+        )
+    )
+    await _show_deleted(callback, i18n, deleted)
+
+
+@router.callback_query(MyPostsCBData.filter(F.action == "delete_all"))
+async def delete_all_confirm(
+    callback: CallbackQuery,
+    i18n: TranslatorRunner,
+) -> None:
+    logger.info("User %s requested deletion of all posts", callback.from_user.id)
+    await callback.message.edit_text(
+        text=i18n.get("delete-all-confirm"),
+        reply_markup=get_bulk_delete_confirm_keyboard("delete_all_confirm", i18n),
+    )
+    await callback.answer()
+
+
+@router.callback_query(MyPostsCBData.filter(F.action == "delete_all_confirm"))
+@inject
+async def delete_all_execute(
+    callback: CallbackQuery,
+    i18n: TranslatorRunner,
+    user: CreateUserOutputDTO,
+    state: FSMContext,
+    delete_posts: FromDishka[DeletePostsInteractor],
+) -> None:
+    if await state.get_state() == MyPostsSelection.selecting:
+        await state.clear()
+    logger.info("User %s confirmed deletion of all posts", callback.from_user.id)
+    deleted = await delete_posts(DeletePostsInputDTO(user_id=user.id))
+    await _show_deleted(callback, i18n, deleted)
+
+
+async def _show_deleted(
+    callback: CallbackQuery, i18n: TranslatorRunner, deleted: int
+) -> None:
+    await callback.message.edit_text(
+        text=i18n.get("posts-deleted", count=str(deleted)),
+        reply_markup=get_main_menu_keyboard(i18n),
+    )
+    await callback.answer()
@@ -4,20 +4,19 @@ from datetime import UTC, datetime
 from aiogram import F, Router
 from aiogram.exceptions import TelegramAPIError
 from aiogram.fsm.context import FSMContext
-from aiogram.types import (
-    CallbackQuery,
-    InlineKeyboardButton,
-    InlineKeyboardMarkup,
-    Message,
-)
+from aiogram.types import CallbackQuery, Message
 from dishka.integrations.aiogram import FromDishka, inject
 from fluentogram import TranslatorRunner
 
-from src.application.post.button_dsl import ButtonDslError, parse_buttons_dsl
+from src.application.post.button_dsl import (
+    ButtonDslError,
+    ParsedButton,
+    parse_buttons_dsl,
+)
 from src.application.post.create import CreatePostInteractor
-from src.application.post.dtos import CreatePostInputDTO
+from src.application.post.dtos import CreatePostInputDTO, PostButtonDTO
 from src.application.user.dtos import CreateUserOutputDTO
-from src.domain.post.vo import ButtonStyle, ContentType
+from src.domain.post.vo import ContentType
 from src.infrastructure.config import Config
 from src.presentation.bot.states.post_wizard import PostWizard
 from src.presentation.bot.utils import edit_or_answer
@@ -28,6 +27,7 @@ from src.presentation.bot.utils.cb_data import (
 )
 from src.presentation.bot.utils.markups import back_markup
 from src.presentation.bot.utils.markups.post import (
+    build_inline_keyboard_from_buttons,
     get_main_menu_keyboard,
     get_post_saved_keyboard,
     get_post_type_keyboard,
@@ -163,7 +163,7 @@ async def skip_buttons(
     i18n: TranslatorRunner,
 ) -> None:
     logger.info("User %s skipped buttons step", callback.from_user.id)
-    await state.update_data(buttons_dsl=None)
+    await state.update_data(buttons=None)
     await callback.message.delete_reply_markup()
 
     await _show_preview(callback.message, state, i18n)
@@ -185,44 +185,34 @@ async def collect_buttons(
         return
 
     try:
-        parse_buttons_dsl(message.text)
+        parsed_rows = parse_buttons_dsl(message.text)
     except ButtonDslError as e:
         await message.answer(str(e))
         return
 
-    await state.update_data(buttons_dsl=message.text)
+    # Parsed once here; preview and creation reuse the stored rows
+    await state.update_data(buttons=_buttons_to_state(parsed_rows))
     await _show_preview(message, state, i18n)
 
 
 # --- Preview helpers ---
 
 
-_STYLE_MAP = {
-    ButtonStyle.DEFAULT: None,
-    ButtonStyle.GREEN: "success",
-    ButtonStyle.BLUE: "primary",
-    ButtonStyle.RED: "danger",
-}
+def _buttons_to_state(
+    parsed_rows: list[list[ParsedButton]],
+) -> list[list[dict[str, str]]]:
+    """Plain dicts, so the rows survive any FSM storage serializer."""
+    return [
+        [{"text": btn.text, "url": btn.url, "style": btn.style.value} for btn in row]
+        for row in parsed_rows
+    ]
 
 
-def _build_preview_buttons_keyboard(
-    buttons_dsl: str | None,
-) -> InlineKeyboardMarkup | None:
-    if not buttons_dsl:
+def _buttons_from_state(data: dict) -> list[list[PostButtonDTO]] | None:
+    rows = data.get("buttons")
+    if rows is None:
         return None
-    parsed_rows = parse_buttons_dsl(buttons_dsl)
-    keyboard = [
-        [
-            InlineKeyboardButton(
-                text=btn.text,
-                url=btn.url,
-                style=_STYLE_MAP.get(btn.style),
-            )
-            for btn in row
-        ]
-        for row in parsed_rows
-    ]
-    return InlineKeyboardMarkup(inline_keyboard=keyboard)
+    return [[PostButtonDTO(**btn) for btn in row] for row in rows]
 
 
 async def _show_preview(
@@ -234,9 +224,8 @@ async def _show_preview(
     content_type = data["content_type"]
     text_md = data.get("text_md")
     telegram_file_id = data.get("telegram_file_id")
-    buttons_dsl = data.get("buttons_dsl")
 
-    buttons_kb = _build_preview_buttons_keyboard(buttons_dsl)
+    buttons_kb = build_inline_keyboard_from_buttons(_buttons_from_state(data) or [])
 
     preview_text = i18n.get("preview-title")
     if text_md:
@@ -329,7 +318,7 @@ async def confirm_post(
                 content_type=data["content_type"],
                 text_md=data.get("text_md"),
                 telegram_file_id=data.get("telegram_file_id"),
-                buttons_dsl=data.get("buttons_dsl"),
+                buttons=_buttons_from_state(data),
             )
         )
     except Exception:
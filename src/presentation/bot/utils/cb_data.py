@@ -36,6 +36,8 @@ class WizardCBData:
 
 
 class MyPostsCBData(CallbackData, prefix="myposts"):
-    action: str  # page, preview, delete, delete_confirm, back
+    # page, preview, delete, delete_confirm, back; multi-select: select,
+    # toggle, select_cancel, delete_selected(_confirm), delete_all(_confirm)
+    action: str
     post_id: str = ""  # UUID as string
-    page: int = 1
+    cursor: str = ""  # page cursor from GetUserPostsInteractor, "" = first page
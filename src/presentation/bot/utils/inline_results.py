@@ -0,0 +1,128 @@
+import uuid
+from collections.abc import Mapping
+from datetime import datetime
+
+from aiogram.types import (
+    InlineQueryResultArticle,
+    InlineQueryResultCachedGif,
+    InlineQueryResultCachedPhoto,
+    InlineQueryResultCachedVideo,
+    InputTextMessageContent,
+)
+
+from src.application.post.dtos import PostDetailDTO
+from src.infrastructure.cache import LRUCache
+from src.presentation.bot.utils.markups.post import build_inline_keyboard_from_buttons
+
+type InlineResult = (
+    InlineQueryResultArticle
+    | InlineQueryResultCachedPhoto
+    | InlineQueryResultCachedVideo
+    | InlineQueryResultCachedGif
+)
+
+
+class InlineResultCache(LRUCache[tuple[uuid.UUID, datetime], InlineResult]):
+    """Ready-to-send inline results keyed by post id and `updated_at`.
+
+    Any edit to a post bumps `updated_at`, so a stale result can never be
+    served and entries need no TTL, only the LRU bound.
+    """
+
+    def get_or_build(self, post: PostDetailDTO) -> InlineResult | None:
+        key = (post.id, post.updated_at)
+        result = self.get(key)
+        if result is None:
+            result = build_inline_result(post)
+            if result is not None:
+                self.set(key, result)
+        return result
+
+
+class InlineCachePolicy:
+    """Picks the `cache_time` Telegram may serve an inline answer for.
+
+    Telegram caches the whole answer per query text, whatever the result
+    ids, so a cached answer outlives edits and deletes of its posts and
+    misses posts created since. Only the answer to an exact key, which can
+    only ever hold that one post, is cached for long, per content type.
+    Every other answer stays short.
+    """
+
+    def __init__(
+        self, content_cache_seconds: Mapping[str, int], short_cache_seconds: int
+    ) -> None:
+        self._content_cache_seconds = dict(content_cache_seconds)
+        self._short_cache_seconds = short_cache_seconds
+
+    @property
+    def short_cache_time(self) -> int:
+        return self._short_cache_seconds
+
+    def exact_key_cache_time(self, post: PostDetailDTO) -> int:
+        return self._content_cache_seconds.get(
+            post.content_type, self._short_cache_seconds
+        )
+
+
+def inline_result_id(post: PostDetailDTO) -> str:
+    """Stable id of one version of a post.
+
+    Any change to the post bumps `updated_at`, so results cached on our
+    side and chosen results reported back never mix up two versions of
+    the same post.
+    """
+    version = int(post.updated_at.timestamp() * 1_000_000)
+    return f"{post.id.hex}-{version:x}"
+
+
+def parse_inline_result_id(result_id: str) -> uuid.UUID | None:
+    """Post id encoded in an `inline_result_id`, or None for foreign ids."""
+    post_hex, _, _version = result_id.partition("-")
+    try:
+        return uuid.UUID(hex=post_hex)
+    except ValueError:
+        return None
+
+
+def build_inline_result(post: PostDetailDTO) -> InlineResult | None:
+    result_id = inline_result_id(post)
+    reply_markup = build_inline_keyboard_from_buttons(post.buttons)
+
+    if post.content_type == "text":
+        return InlineQueryResultArticle(
+            id=result_id,
+            title=post.text_md[:50] if post.text_md else post.unique_key,
+            description=post.text_md[:100] if post.text_md else "",
+            input_message_content=InputTextMessageContent(
+                message_text=post.text_md or "",
+            ),
+            reply_markup=reply_markup,
+        )
+
+    if post.content_type == "photo" and post.telegram_file_id:
+        return InlineQueryResultCachedPhoto(
+            id=result_id,
+            photo_file_id=post.telegram_file_id,
+            caption=post.text_md or "",
+            reply_markup=reply_markup,
+        )
+
+    if post.content_type == "video" and post.telegram_file_id:
+        return InlineQueryResultCachedVideo(
+            id=result_id,
+            video_file_id=post.telegram_file_id,
+            title=post.text_md[:50] if post.text_md else post.unique_key,
+            caption=post.text_md or "",
+            reply_markup=reply_markup,
+        )
+
+    if post.content_type == "gif" and post.telegram_file_id:
+        return InlineQueryResultCachedGif(
+            id=result_id,
+            gif_file_id=post.telegram_file_id,
+            caption=post.text_md or "",
+            reply_markup=reply_markup,
+        )
+
+    return None
@@ -10,8 +10,6 @@ from src.presentation.bot.utils.cb_data import (
     WizardCBData,
 )
 
-POSTS_PER_PAGE = 10
-
 
 def get_main_menu_keyboard(i18n: TranslatorRunner) -> InlineKeyboardMarkup:
     """Main menu with Create Post and My Posts buttons in one row."""
@@ -117,11 +115,13 @@ def get_preview_keyboard(i18n: TranslatorRunner) -> InlineKeyboardMarkup:
 
 def get_my_posts_keyboard(
     posts: list[PostListItemDTO],
-    page: int,
-    total: int,
     i18n: TranslatorRunner,
+    *,
+    cursor: str = "",
+    prev_cursor: str = "",
+    next_cursor: str = "",
 ) -> InlineKeyboardMarkup:
-    """Paginated list of user posts."""
+    """Paginated list of user posts; `cursor` is the page being shown."""
     keyboard: list[list[InlineKeyboardButton]] = []
 
     for post in posts:
@@ -139,28 +139,39 @@ def get_my_posts_keyboard(
         )
 
     # Pagination
-    total_pages = max(1, (total + POSTS_PER_PAGE - 1) // POSTS_PER_PAGE)
     nav_buttons: list[InlineKeyboardButton] = []
 
-    if page > 1:
+    if prev_cursor:
         nav_buttons.append(
             InlineKeyboardButton(
                 text=i18n.get("btn-prev-page"),
-                callback_data=MyPostsCBData(action="page", page=page - 1).pack(),
+                callback_data=MyPostsCBData(action="page", cursor=prev_cursor).pack(),
             )
         )
 
-    if page < total_pages:
+    if next_cursor:
         nav_buttons.append(
             InlineKeyboardButton(
                 text=i18n.get("btn-next-page"),
-                callback_data=MyPostsCBData(action="page", page=page + 1).pack(),
+                callback_data=MyPostsCBData(action="page", cursor=next_cursor).pack(),
             )
         )
 
     if nav_buttons:
         keyboard.append(nav_buttons)
 
+    keyboard.append(
+        [
+            InlineKeyboardButton(
+                text=i18n.get("btn-select"),
+                callback_data=MyPostsCBData(action="select", cursor=cursor).pack(),
+            ),
+            InlineKeyboardButton(
+                text=i18n.get("btn-delete-all"),
+                callback_data=MyPostsCBData(action="delete_all").pack(),
+            ),
+        ]
+    )
     keyboard.append(
         [
             InlineKeyboardButton(
@@ -173,6 +184,74 @@ def get_my_posts_keyboard(
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
 
+def get_my_posts_select_keyboard(
+    posts: list[PostListItemDTO],
+    selected: set[str],
+    i18n: TranslatorRunner,
+    *,
+    prev_cursor: str = "",
+    next_cursor: str = "",
+) -> InlineKeyboardMarkup:
+    """Page of user posts where tapping a post toggles its selection."""
+    keyboard: list[list[InlineKeyboardButton]] = []
+
+    for post in posts:
+        post_id = str(post.id)
+        mark = "✅" if post_id in selected else "⬜"
+        date_str = post.created_at.strftime("%d.%m.%Y")
+        keyboard.append(
+            [
+                InlineKeyboardButton(
+                    text=f"{mark} {post.unique_key} | {post.content_type} | {date_str}",
+                    callback_data=MyPostsCBData(
+                        action="toggle", post_id=post_id
+                    ).pack(),
+                ),
+            ]
+        )
+
+    nav_buttons: list[InlineKeyboardButton] = []
+
+    if prev_cursor:
+        nav_buttons.append(
+            InlineKeyboardButton(
+                text=i18n.get("btn-prev-page"),
+                callback_data=MyPostsCBData(action="select", cursor=prev_cursor).pack(),
+            )
+        )
+
+    if next_cursor:
+        nav_buttons.append(
+            InlineKeyboardButton(
+                text=i18n.get("btn-next-page"),
+                callback_data=MyPostsCBData(action="select", cursor=next_cursor).pack(),
+            )
+        )
+
+    if nav_buttons:
+        keyboard.append(nav_buttons)
+
+    if selected:
+        keyboard.append(
+            [
+                InlineKeyboardButton(
+                    text=i18n.get("btn-delete-selected", count=len(selected)),
+                    callback_data=MyPostsCBData(action="delete_selected").pack(),
+                ),
+            ]
+        )
+    keyboard.append(
+        [
+            InlineKeyboardButton(
+                text=i18n.get("btn-cancel"),
+                callback_data=MyPostsCBData(action="select_cancel").pack(),
+            ),
+        ]
+    )
+
+    return InlineKeyboardMarkup(inline_keyboard=keyboard)
+
+
 def get_post_actions_keyboard(
     post_id: str, unique_key: str, i18n: TranslatorRunner
 ) -> InlineKeyboardMarkup:
@@ -196,7 +275,7 @@ def get_post_actions_keyboard(
             [
                 InlineKeyboardButton(
                     text=i18n.get("btn-back-to-list"),
-                    callback_data=MyPostsCBData(action="page", page=1).pack(),
+                    callback_data=MyPostsCBData(action="page").pack(),
                 ),
             ],
         ]
@@ -227,6 +306,26 @@ def get_delete_confirm_keyboard(
     )
 
 
+def get_bulk_delete_confirm_keyboard(
+    action: str, i18n: TranslatorRunner
+) -> InlineKeyboardMarkup:
+    """Confirm deleting the selected posts or all posts; `action` confirms."""
+    return InlineKeyboardMarkup(
+        inline_keyboard=[
+            [
+                InlineKeyboardButton(
+                    text=i18n.get("btn-delete-yes"),
+                    callback_data=MyPostsCBData(action=action).pack(),
+                ),
+                InlineKeyboardButton(
+                    text=i18n.get("btn-cancel"),
+                    callback_data=MyPostsCBData(action="select_cancel").pack(),
+                ),
+            ],
+        ]
+    )
+
+
 def get_post_saved_keyboard(
     unique_key: str, i18n: TranslatorRunner
 ) -> InlineKeyboardMarkup:
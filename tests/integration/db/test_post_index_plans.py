@@ -0,0 +1,162 @@
+"""The planner picks the active-only partial indexes for the post queries.
+
+Each test runs a real repository or query service call, captures the
+statement it sends and EXPLAINs it against seeded posts, most of them
+deleted, the way a long-lived library looks.
+"""
+
+import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from src.application.interfaces.post_queries import PostCursor
+from src.domain.user.vo import UserId
+from src.infrastructure.db.queries import PostQueryServiceImpl
+from src.infrastructure.db.repos.post import PostRepositoryImpl
+
+OWNER_ID = 1
+OWNERS = 200
+POSTS = 40_000
+
+OWNER_INDEX = "ix_posts_active_owner_created"
+KEY_INDEX = "ix_posts_active_unique_key_pattern"
+
+
+@pytest.fixture
+async def seeded_session(
+    native_db_session: AsyncSession,
+) -> AsyncIterator[AsyncSession]:
+    session = native_db_session
+    await session.execute(
+        text(
+            "INSERT INTO users (id, first_name)"
+            " SELECT i, 'User ' || i FROM generate_series(1, :owners) AS i"
+        ),
+        {"owners": OWNERS},
+    )
+    # Nine in ten posts of every owner are deleted; keys are hex, so the
+    # lookup of "zz00" below matches nothing
+    await session.execute(
+        text(
+            "INSERT INTO posts (id, owner_user_id, unique_key, content_type,"
+            " text_md, buttons, status, created_at)"
+            " SELECT gen_random_uuid(), 1 + i % :owners, left(md5(i::text), 8),"
+            " 'text', 'Post ' || i, '[]',"
+            " CASE WHEN i / :owners % 10 = 0 THEN 'active' ELSE 'deleted' END,"
+            " now() - i * interval '1 minute'"
+            " FROM generate_series(1, :posts) AS i"
+        ),
+        {"owners": OWNERS, "posts": POSTS},
+    )
+    # Statistics are transactional too, so they are committed before the
+    # tests roll their own statements back
+    await session.execute(text("ANALYZE posts"))
+    await session.commit()
+    yield session
+
+
+async def _plan(
+    session: AsyncSession, call: Callable[[], Awaitable[object]]
+) -> list[dict[str, Any]]:
+    """EXPLAIN the last statement `call` sends; returns the plan nodes."""
+    statements: list[tuple[str, Any]] = []
+    engine: AsyncEngine = session.bind
+
+    def capture(conn, cursor, statement, parameters, context, executemany) -> None:  # noqa: PLR0917
+        statements.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        await call()
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+    statement, parameters = statements[-1]
+    connection = await session.connection()
+    result = await connection.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {statement}", parameters
+    )
+    plan = result.scalar()
+    await session.rollback()
+    return list(_nodes(plan[0]["Plan"]))
+
+
+def _nodes(node: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    yield node
+    for child in node.get("Plans", ()):
+        yield from _nodes(child)
+
+
+def _indexes(nodes: list[dict[str, Any]]) -> set[str]:
+    return {node["Index Name"] for node in nodes if "Index Name" in node}
+
+
+def _node_types(nodes: list[dict[str, Any]]) -> set[str]:
+    return {node["Node Type"] for node in nodes}
+
+
+class TestPostIndexPlans:
+    async def test_owner_listing_reads_partial_index_in_order(
+        self, seeded_session: AsyncSession
+    ) -> None:
+        queries = PostQueryServiceImpl(seeded_session)
+
+        nodes = await _plan(
+            seeded_session, lambda: queries.get_user_posts(OWNER_ID, limit=11)
+        )
+
+        assert OWNER_INDEX in _indexes(nodes)
+        # Index order is the page order, nothing left to sort
+        assert "Sort" not in _node_types(nodes)
+
+    async def test_owner_listing_after_cursor(
+        self, seeded_session: AsyncSession
+    ) -> None:
+        queries = PostQueryServiceImpl(seeded_session)
+        cursor = PostCursor(datetime.now(UTC) - timedelta(days=10), uuid.uuid4())
+
+        nodes = await _plan(
+            seeded_session,
+            lambda: queries.get_user_posts(OWNER_ID, limit=11, cursor=cursor),
+        )
+
+        assert OWNER_INDEX in _indexes(nodes)
+        assert "Sort" not in _node_types(nodes)
+
+    async def test_key_prefix_search(self, seeded_session: AsyncSession) -> None:
+        queries = PostQueryServiceImpl(seeded_session)
+
+        nodes = await _plan(
+            seeded_session,
+            lambda: queries.search_posts_by_key("ab", limit=11, owner_user_id=OWNER_ID),
+        )
+
+        # Partial keys only match the searcher's posts; either active-only
+        # index narrows them down, but none may scan the table
+        assert _indexes(nodes) & {KEY_INDEX, OWNER_INDEX}
+        assert "Seq Scan" not in _node_types(nodes)
+
+    async def test_key_lookup(self, seeded_session: AsyncSession) -> None:
+        repository = PostRepositoryImpl(seeded_session)
+
+        nodes = await _plan(seeded_session, lambda: repository.get_post_by_key("zz00"))
+
+        # The active-only index is a tenth of the unique constraint's index
+        assert _indexes(nodes) == {KEY_INDEX}
+        assert "Seq Scan" not in _node_types(nodes)
+
+    async def test_delete_all_finds_active_posts_by_owner(
+        self, seeded_session: AsyncSession
+    ) -> None:
+        repository = PostRepositoryImpl(seeded_session)
+
+        nodes = await _plan(
+            seeded_session, lambda: repository.soft_delete_posts(UserId(OWNER_ID))
+        )
+
+        assert OWNER_INDEX in _indexes(nodes)
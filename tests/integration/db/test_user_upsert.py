@@ -0,0 +1,50 @@
+"""Guarded user upserts against a real database."""
+
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.user import User
+from src.domain.user.repository import UserActivity
+from src.domain.user.vo import FirstName, UserId
+from src.infrastructure.db.repos.user import UserRepositoryImpl
+
+
+async def test_late_flush_keeps_newer_profile(
+    native_db_session: AsyncSession,
+) -> None:
+    session = native_db_session
+    repository = UserRepositoryImpl(session)
+    buffered_at = datetime.now(UTC) - timedelta(minutes=10)
+    synced_at = buffered_at + timedelta(minutes=5)
+    await repository.upsert_user(
+        User(
+            id=UserId(1),
+            first_name=FirstName("Newer"),
+            last_name=None,
+            username=None,
+            bio=None,
+            created_at=synced_at,
+            updated_at=synced_at,
+            last_login_at=synced_at,
+        )
+    )
+    await session.commit()
+
+    written = await repository.bulk_upsert_activity(
+        [
+            UserActivity(
+                user_id=1,
+                username=None,
+                first_name="Older",
+                last_name=None,
+                seen_at=buffered_at,
+            )
+        ]
+    )
+    await session.commit()
+
+    user = await UserRepositoryImpl(session).get_user(UserId(1))
+    assert written == 0
+    assert user is not None
+    assert user.first_name == FirstName("Newer")
@@ -0,0 +1,36 @@
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+
+from src.domain.post.entity import Post
+from src.domain.post.vo import ContentType, PostStatus, TextMd, UniqueKey
+from src.domain.user.vo import UserId
+from src.infrastructure.cache import PostDetailCache, PostKeyBloomFilter
+
+
+@pytest.fixture
+def sample_post() -> Post:
+    now = datetime.now(UTC)
+    return Post(
+        id=uuid.uuid4(),
+        owner_user_id=UserId(123),
+        unique_key=UniqueKey("abcd1234"),
+        content_type=ContentType.TEXT,
+        status=PostStatus.ACTIVE,
+        created_at=now,
+        updated_at=now,
+        text_md=TextMd("Hello"),
+    )
+
+
+@pytest.fixture
+def post_cache() -> PostDetailCache:
+    return PostDetailCache(max_size=10, ttl=60)
+
+
+@pytest.fixture
+def key_filter() -> PostKeyBloomFilter:
+    key_filter = PostKeyBloomFilter(capacity=100)
+    key_filter.add("abcd1234")
+    return key_filter
@@ -0,0 +1,193 @@
+import random
+import re
+from urllib.parse import urlparse
+
+import pytest
+
+from src.application.post.button_dsl import (
+    COLOR_ALIASES,
+    ButtonDslError,
+    ButtonDslIssue,
+    ParsedButton,
+    _parse_cached,
+    parse_buttons_dsl,
+)
+from src.domain.post.vo import ButtonStyle
+
+
+class TestParseButtonsDsl:
+    def test_rows_and_styles(self) -> None:
+        rows = parse_buttons_dsl(
+            "[A + a.com] [B + http://b.com + синий]\n\n[C + c.com]"
+        )
+
+        assert rows == [
+            [
+                ParsedButton(text="A", url="https://a.com", style=ButtonStyle.DEFAULT),
+                ParsedButton(text="B", url="http://b.com", style=ButtonStyle.BLUE),
+            ],
+            [ParsedButton(text="C", url="https://c.com", style=ButtonStyle.DEFAULT)],
+        ]
+
+    @pytest.mark.parametrize(
+        "raw", ["no brackets", "[only text]", "[ + a.com]", "[A + a.com + purple]"]
+    )
+    def test_invalid_input(self, raw: str) -> None:
+        with pytest.raises(ButtonDslError):
+            parse_buttons_dsl(raw)
+
+    def test_reports_every_issue_with_position(self) -> None:
+        raw = "[A + a.com]\n[ + b.com] [B + https:// + purple]\njust text"
+
+        with pytest.raises(ButtonDslError) as exc_info:
+            parse_buttons_dsl(raw)
+
+        assert exc_info.value.issues == [
+            ButtonDslIssue(2, 1, "Button text cannot be empty."),
+            ButtonDslIssue(2, 17, 'Invalid URL for button "B"'),
+            ButtonDslIssue(
+                2, 28, 'Unknown color "purple". Use: default, green, blue, red.'
+            ),
+            ButtonDslIssue(
+                3, 1, "Could not parse buttons. Example: [Text + https://url + green]"
+            ),
+        ]
+        assert str(exc_info.value).splitlines()[0] == (
+            "Line 2, column 1: Button text cannot be empty."
+        )
+
+    @pytest.mark.parametrize(
+        ("raw", "column"), [("[A + a.com] [B + b.com", 13), ("[A + a.com", 1)]
+    )
+    def test_reports_unclosed_bracket(self, raw: str, column: int) -> None:
+        with pytest.raises(ButtonDslError) as exc_info:
+            parse_buttons_dsl(raw)
+
+        assert exc_info.value.issues == [
+            ButtonDslIssue(1, column, 'Unclosed "[": end the button with "]".')
+        ]
+
+    def test_same_text_is_parsed_once(self) -> None:
+        raw = "[Memo + memo.example.com + green]"
+        _parse_cached.cache_clear()
+
+        first = parse_buttons_dsl(raw)
+        second = parse_buttons_dsl(raw)
+
+        info = _parse_cached.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+        assert first == second
+
+    def test_cached_rows_are_not_shared(self) -> None:
+        raw = "[Copy + copy.example.com]"
+
+        parse_buttons_dsl(raw)[0].append(
+            ParsedButton(text="X", url="https://x.com", style=ButtonStyle.RED)
+        )
+
+        assert len(parse_buttons_dsl(raw)[0]) == 1
+
+
+# The regex and urlparse based parser this one replaced, plus the check for
+# an unclosed "["; fuzzing checks the tokenizer reaches the same verdict on
+# arbitrary input.
+_UNCLOSED = 'Unclosed "[": end the button with "]".'
+
+
+def _reference_parse(raw: str) -> list[list[ParsedButton]]:
+    rows = []
+    for raw_line in raw.strip().splitlines():
+        line = raw_line.strip()
+        if not line:
+            continue
+        matches = re.findall(r"\[([^\]]+)\]", line)
+        unclosed = "[" in line[line.rfind("]") + 1 :]
+        if not matches and unclosed:
+            raise ButtonDslError([ButtonDslIssue(0, 0, _UNCLOSED)])
+        if not matches:
+            msg = "Could not parse buttons. Example: [Text + https://url + green]"
+            raise ButtonDslError([ButtonDslIssue(0, 0, msg)])
+        row = []
+        for match in matches:
+            parts = [p.strip() for p in match.split("+")]
+            if len(parts) < 2:
+                msg = (
+                    "Each button must have at least text and URL. "
+                    "Example: [Text + https://url]"
+                )
+                raise ButtonDslError([ButtonDslIssue(0, 0, msg)])
+            text, url = parts[0], parts[1]
+            if not text:
+                raise ButtonDslError(
+                    [ButtonDslIssue(0, 0, "Button text cannot be empty.")]
+                )
+            if not url.startswith(("http://", "https://")):
+                url = f"https://{url}"
+            try:
+                result = urlparse(url)
+                if not result.scheme or not result.netloc:
+                    raise ValueError
+            except ValueError:
+                msg = f'Invalid URL for button "{text}"'
+                raise ButtonDslError([ButtonDslIssue(0, 0, msg)]) from None
+            style = (parts[2] if len(parts) >= 3 else "default").lower()
+            style = COLOR_ALIASES.get(style, style)
+            if style not in {s.value for s in ButtonStyle}:
+                msg = f'Unknown color "{style}". Use: default, green, blue, red.'
+                raise ButtonDslError([ButtonDslIssue(0, 0, msg)])
+            row.append(ParsedButton(text=text, url=url, style=ButtonStyle(style)))
+        if unclosed:
+            raise ButtonDslError([ButtonDslIssue(0, 0, _UNCLOSED)])
+        rows.append(row)
+    return rows
+
+
+_FRAGMENTS = [
+    "[", "]", "+", " + ", " ", "\t", "\n", "\n\n", "Go", "Кнопка", "a.com",
+    "http://", "https://", "/path", "?q=1", "#top", ":8080", "@", "red", "Green",
+    "синий", "purple", "\uff0f", "\u2100", "x",
+]  # fmt: skip
+
+
+def _random_button(rng: random.Random) -> str:
+    # Mostly well-formed, with a bad field now and then
+    bad = rng.random() < 0.1
+    text = rng.choice(["", " "] if bad else ["Go", " Buy now ", "Кнопка"])
+    url = rng.choice(["http://", "/p", "https://?q"] if bad else ["a.com", "c.io/x"])
+    parts = [text, url]
+    if rng.random() < 0.5:
+        parts.append(rng.choice(["red", " BLUE ", "зелёный", "default"]))
+    return "[" + " + ".join(parts) + "]"
+
+
+def _random_dsl(rng: random.Random) -> str:
+    if rng.random() < 0.5:
+        return "".join(rng.choice(_FRAGMENTS) for _ in range(rng.randint(0, 30)))
+    lines = []
+    for _ in range(rng.randint(1, 5)):
+        line = " ".join(_random_button(rng) for _ in range(rng.randint(1, 4)))
+        if rng.random() < 0.05:
+            index = rng.randint(0, len(line))
+            line = line[:index] + rng.choice(_FRAGMENTS) + line[index:]
+        lines.append(line)
+    return "\n".join(lines)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_fuzz_matches_reference_parser(seed: int) -> None:
+    rng = random.Random(seed)
+    for _ in range(1000):
+        raw = _random_dsl(rng)
+        try:
+            expected = _reference_parse(raw)
+        except ButtonDslError as e:
+            with pytest.raises(ButtonDslError) as exc_info:
+                parse_buttons_dsl(raw)
+            issues = exc_info.value.issues
+            assert issues[0].message == e.issues[0].message, raw
+            lines = raw.splitlines()
+            for issue in issues:
+                assert 1 <= issue.line <= len(lines), raw
+                assert 1 <= issue.column <= len(lines[issue.line - 1]), raw
+        else:
+            assert parse_buttons_dsl(raw) == expected, raw
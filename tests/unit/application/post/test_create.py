@@ -0,0 +1,134 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.application.post.create import CreatePostInteractor
+from src.application.post.dtos import CreatePostInputDTO, PostButtonDTO
+from src.domain.post.entity import PostButton
+from src.domain.post.vo import ButtonStyle
+
+
+class TestCreatePostInteractor:
+    @pytest.fixture
+    def key_allocator(self) -> MagicMock:
+        allocator = MagicMock()
+        allocator.allocate = AsyncMock(side_effect=["key00007", "key00008", "key00009"])
+        return allocator
+
+    @pytest.fixture
+    def mock_post_repository(self) -> AsyncMock:
+        repository = AsyncMock()
+        repository.create_post.side_effect = lambda post: post
+        return repository
+
+    @pytest.fixture
+    def interactor(
+        self, mock_post_repository, key_filter, key_allocator
+    ) -> CreatePostInteractor:
+        return CreatePostInteractor(
+            post_repository=mock_post_repository,
+            transaction_manager=AsyncMock(),
+            key_filter=key_filter,
+            key_allocator=key_allocator,
+        )
+
+    @pytest.fixture
+    def input_dto(self) -> CreatePostInputDTO:
+        return CreatePostInputDTO(owner_user_id=123, content_type="text", text_md="Hi")
+
+    async def test_key_comes_from_allocator(
+        self, interactor, mock_post_repository, key_filter, key_allocator, input_dto
+    ) -> None:
+        result = await interactor(input_dto)
+
+        assert result.unique_key == "key00007"
+        mock_post_repository.create_post.assert_awaited_once()
+        mock_post_repository.key_exists.assert_not_called()
+        key_allocator.mark_used.assert_called_once_with("key00007")
+        assert key_filter.might_contain(result.unique_key)
+
+    async def test_failed_creation_releases_the_key(
+        self, interactor, mock_post_repository, key_allocator, input_dto
+    ) -> None:
+        mock_post_repository.create_post.side_effect = ConnectionError("lost")
+
+        with pytest.raises(ConnectionError):
+            await interactor(input_dto)
+
+        key_allocator.release.assert_called_once_with("key00007")
+        key_allocator.mark_used.assert_not_called()
+
+    async def test_failed_retry_releases_the_replacement_key(
+        self, interactor, mock_post_repository, key_allocator, input_dto
+    ) -> None:
+        mock_post_repository.create_post.side_effect = [None, ConnectionError("lost")]
+
+        with pytest.raises(ConnectionError):
+            await interactor(input_dto)
+
+        # The taken key is used up; only the one never inserted goes back
+        key_allocator.mark_used.assert_called_once_with("key00007")
+        key_allocator.release.assert_called_once_with("key00008")
+
+    async def test_post_ids_are_time_ordered(self, interactor, input_dto) -> None:
+        first = await interactor(input_dto)
+        second = await interactor(input_dto)
+
+        assert first.post_id.version == 7
+        assert second.post_id > first.post_id
+
+    async def test_taken_key_is_replaced(
+        self, interactor, mock_post_repository, key_allocator, input_dto
+    ) -> None:
+        mock_post_repository.create_post.side_effect = _taken_then_free(2)
+
+        result = await interactor(input_dto)
+
+        assert result.unique_key == "key00009"
+        assert mock_post_repository.create_post.await_count == 3
+        used = [c.args[0] for c in key_allocator.mark_used.call_args_list]
+        assert used == ["key00007", "key00008", "key00009"]
+
+    async def test_pre_parsed_buttons_skip_the_dsl(
+        self, interactor, mock_post_repository
+    ) -> None:
+        data = CreatePostInputDTO(
+            owner_user_id=123,
+            content_type="text",
+            text_md="Hi",
+            buttons_dsl="not parsed at all",
+            buttons=[[PostButtonDTO(text="Go", url="https://a.com", style="blue")]],
+        )
+
+        await interactor(data)
+
+        post = mock_post_repository.create_post.await_args.args[0]
+        assert post.buttons == [
+            [PostButton(text="Go", url="https://a.com", style=ButtonStyle.BLUE)]
+        ]
+
+    async def test_buttons_dsl_is_parsed_without_pre_parsed_buttons(
+        self, interactor, mock_post_repository
+    ) -> None:
+        data = CreatePostInputDTO(
+            owner_user_id=123,
+            content_type="text",
+            text_md="Hi",
+            buttons_dsl="[Go + a.com + red]",
+        )
+
+        await interactor(data)
+
+        post = mock_post_repository.create_post.await_args.args[0]
+        assert post.buttons == [
+            [PostButton(text="Go", url="https://a.com", style=ButtonStyle.RED)]
+        ]
+
+
+def _taken_then_free(taken: int):
+    calls = iter(range(taken + 1))
+
+    def create_post(post):
+        return None if next(calls) < taken else post
+
+    return create_post
@@ -0,0 +1,124 @@
+import uuid
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.application.post.delete import (
+    DeletePostInputDTO,
+    DeletePostInteractor,
+    DeletePostsInputDTO,
+    DeletePostsInteractor,
+)
+from src.application.post.dtos import post_to_detail
+from src.domain.user.vo import UserId
+
+
+class TestDeletePostInteractor:
+    @pytest.fixture
+    def mock_post_repository(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def mock_transaction_manager(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def interactor(
+        self, mock_post_repository, mock_transaction_manager, post_cache
+    ) -> DeletePostInteractor:
+        return DeletePostInteractor(
+            post_repository=mock_post_repository,
+            transaction_manager=mock_transaction_manager,
+            post_cache=post_cache,
+        )
+
+    async def test_delete_drops_cached_inline_result(
+        self, interactor, mock_post_repository, post_cache, sample_post
+    ) -> None:
+        mock_post_repository.soft_delete_posts.return_value = ["abcd1234"]
+        post_cache.set("abcd1234", post_to_detail(sample_post))
+
+        deleted = await interactor(
+            DeletePostInputDTO(post_id=sample_post.id, user_id=123)
+        )
+
+        assert deleted is True
+        # Ownership is checked by the delete itself, nothing is read first
+        mock_post_repository.soft_delete_posts.assert_awaited_once_with(
+            UserId(123), [sample_post.id]
+        )
+        mock_post_repository.get_post_by_id.assert_not_called()
+        assert "abcd1234" not in post_cache
+
+    async def test_foreign_post_is_not_deleted(
+        self,
+        interactor,
+        mock_post_repository,
+        mock_transaction_manager,
+        post_cache,
+        sample_post,
+    ) -> None:
+        mock_post_repository.soft_delete_posts.return_value = []
+        post_cache.set("abcd1234", post_to_detail(sample_post))
+
+        deleted = await interactor(
+            DeletePostInputDTO(post_id=sample_post.id, user_id=999)
+        )
+
+        assert deleted is False
+        mock_transaction_manager.commit.assert_not_called()
+        assert "abcd1234" in post_cache
+
+
+class TestDeletePostsInteractor:
+    @pytest.fixture
+    def mock_post_repository(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def mock_transaction_manager(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def interactor(
+        self, mock_post_repository, mock_transaction_manager, post_cache
+    ) -> DeletePostsInteractor:
+        return DeletePostsInteractor(
+            post_repository=mock_post_repository,
+            transaction_manager=mock_transaction_manager,
+            post_cache=post_cache,
+        )
+
+    async def test_selected_posts_are_deleted_in_one_call(
+        self, interactor, mock_post_repository, post_cache, sample_post
+    ) -> None:
+        ids = [uuid.uuid4() for _ in range(3)]
+        mock_post_repository.soft_delete_posts.return_value = ["abcd1234", "k2"]
+        post_cache.set("abcd1234", post_to_detail(sample_post))
+
+        deleted = await interactor(DeletePostsInputDTO(user_id=123, post_ids=ids))
+
+        # One of the three was foreign or already gone
+        assert deleted == 2
+        mock_post_repository.soft_delete_posts.assert_awaited_once_with(
+            UserId(123), ids
+        )
+        assert "abcd1234" not in post_cache
+
+    async def test_delete_all_passes_no_ids(
+        self, interactor, mock_post_repository, mock_transaction_manager
+    ) -> None:
+        mock_post_repository.soft_delete_posts.return_value = ["k1"]
+
+        assert await interactor(DeletePostsInputDTO(user_id=123)) == 1
+        mock_post_repository.soft_delete_posts.assert_awaited_once_with(
+            UserId(123), None
+        )
+        mock_transaction_manager.commit.assert_awaited_once()
+
+    async def test_empty_selection_skips_the_query(
+        self, interactor, mock_post_repository, mock_transaction_manager
+    ) -> None:
+        assert await interactor(DeletePostsInputDTO(user_id=123, post_ids=[])) == 0
+        mock_post_repository.soft_delete_posts.assert_not_called()
+        mock_transaction_manager.commit.assert_not_called()
@@ -0,0 +1,175 @@
+import dataclasses
+import uuid
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.application.interfaces.post_queries import PostCursor
+from src.application.post.dtos import PostListItemDTO
+from src.application.post.get_user_posts import (
+    POSTS_PER_PAGE,
+    GetUserPostsInputDTO,
+    GetUserPostsInteractor,
+    decode_cursor,
+    encode_cursor,
+)
+from src.domain.post.entity import Post
+
+
+def _item(post: Post) -> PostListItemDTO:
+    return PostListItemDTO(
+        id=post.id,
+        unique_key=post.unique_key.value,
+        content_type=post.content_type.value,
+        text_preview=None,
+        created_at=post.created_at,
+    )
+
+
+def _page(
+    sample_post: Post, count: int, total: int = 25
+) -> tuple[list[PostListItemDTO], int]:
+    """`count` list items, newest first, and the user's total."""
+    items = [
+        dataclasses.replace(
+            _item(sample_post),
+            id=uuid.uuid4(),
+            created_at=sample_post.created_at - timedelta(minutes=i),
+        )
+        for i in range(count)
+    ]
+    return items, total
+
+
+class TestCursor:
+    def test_round_trip(self, sample_post) -> None:
+        raw = encode_cursor(_item(sample_post), backward=True)
+
+        cursor, backward = decode_cursor(raw)
+
+        assert cursor == PostCursor(sample_post.created_at, sample_post.id)
+        assert backward
+        # Fits Telegram's 64-byte callback data next to the other fields
+        assert len(f"myposts:page::{raw}".encode()) <= 64
+
+    def test_microseconds_survive(self, sample_post) -> None:
+        post = dataclasses.replace(
+            sample_post, created_at=datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=UTC)
+        )
+
+        cursor, backward = decode_cursor(encode_cursor(_item(post)))
+
+        assert cursor.created_at == post.created_at
+        assert not backward
+
+    @pytest.mark.parametrize("raw", ["", "n", "x" + "A" * 32, "n!!!", "nAAAA"])
+    def test_malformed(self, raw: str) -> None:
+        assert decode_cursor(raw) is None
+
+
+class TestGetUserPostsInteractor:
+    @pytest.fixture
+    def mock_post_queries(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def interactor(self, mock_post_queries) -> GetUserPostsInteractor:
+        return GetUserPostsInteractor(post_queries=mock_post_queries)
+
+    async def test_first_page_fetches_one_extra_row(
+        self, interactor, mock_post_queries, sample_post
+    ) -> None:
+        page = _page(sample_post, POSTS_PER_PAGE + 1)
+        posts = page[0]
+        mock_post_queries.get_user_posts.return_value = page
+
+        result = await interactor(GetUserPostsInputDTO(user_id=123))
+
+        kwargs = mock_post_queries.get_user_posts.await_args.kwargs
+        assert kwargs["limit"] == POSTS_PER_PAGE + 1
+        assert kwargs["cursor"] is None
+        assert len(result.items) == POSTS_PER_PAGE
+        # The total comes with the page, no separate count query
+        assert result.total == 25
+        assert result.prev_cursor == ""
+        assert decode_cursor(result.next_cursor) == (
+            PostCursor(posts[9].created_at, posts[9].id),
+            False,
+        )
+
+    async def test_last_page_has_no_next(
+        self, interactor, mock_post_queries, sample_post
+    ) -> None:
+        page = _page(sample_post, 3)
+        posts = page[0]
+        mock_post_queries.get_user_posts.return_value = page
+
+        result = await interactor(
+            GetUserPostsInputDTO(user_id=123, cursor=encode_cursor(_item(sample_post)))
+        )
+
+        assert result.next_cursor == ""
+        assert decode_cursor(result.prev_cursor) == (
+            PostCursor(posts[0].created_at, posts[0].id),
+            True,
+        )
+
+    async def test_backward_page_drops_the_extra_newest_row(
+        self, interactor, mock_post_queries, sample_post
+    ) -> None:
+        page = _page(sample_post, POSTS_PER_PAGE + 1)
+        posts = page[0]
+        mock_post_queries.get_user_posts.return_value = page
+
+        result = await interactor(
+            GetUserPostsInputDTO(
+                user_id=123, cursor=encode_cursor(_item(sample_post), backward=True)
+            )
+        )
+
+        assert mock_post_queries.get_user_posts.await_args.kwargs["backward"]
+        assert [item.id for item in result.items] == [p.id for p in posts[1:]]
+        assert result.prev_cursor
+        assert result.next_cursor
+
+    async def test_backward_to_first_page_has_no_prev(
+        self, interactor, mock_post_queries, sample_post
+    ) -> None:
+        mock_post_queries.get_user_posts.return_value = _page(sample_post, 4)
+
+        result = await interactor(
+            GetUserPostsInputDTO(
+                user_id=123, cursor=encode_cursor(_item(sample_post), backward=True)
+            )
+        )
+
+        assert result.prev_cursor == ""
+        assert result.next_cursor
+
+    async def test_emptied_page_falls_back_to_first(
+        self, interactor, mock_post_queries, sample_post
+    ) -> None:
+        mock_post_queries.get_user_posts.side_effect = [
+            ([], 0),
+            _page(sample_post, 2, total=2),
+        ]
+
+        result = await interactor(
+            GetUserPostsInputDTO(user_id=123, cursor=encode_cursor(_item(sample_post)))
+        )
+
+        assert len(result.items) == 2
+        calls = mock_post_queries.get_user_posts.await_args_list
+        assert calls[1].kwargs["cursor"] is None
+
+    async def test_malformed_cursor_shows_first_page(
+        self, interactor, mock_post_queries
+    ) -> None:
+        mock_post_queries.get_user_posts.return_value = ([], 0)
+
+        result = await interactor(GetUserPostsInputDTO(user_id=123, cursor="garbage"))
+
+        assert result.items == []
+        mock_post_queries.get_user_posts.assert_awaited_once()
+        assert mock_post_queries.get_user_posts.await_args.kwargs["cursor"] is None
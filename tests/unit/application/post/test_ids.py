@@ -0,0 +1,60 @@
+import time
+import uuid
+
+import pytest
+
+from src.application.post import ids
+from src.application.post.ids import uuid7, uuid7_timestamp_ms
+
+NOW_NS = 1_700_000_000_000_000_000
+NOW_MS = NOW_NS // 1_000_000
+
+
+@pytest.fixture(autouse=True)
+def fresh_state(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(ids, "_last_timestamp_ms", -1)
+    monkeypatch.setattr(ids, "_last_counter", 0)
+
+
+class TestUuid7:
+    def test_version_variant_and_timestamp(self) -> None:
+        before = time.time_ns() // 1_000_000
+        value = uuid7()
+        after = time.time_ns() // 1_000_000
+
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+        assert before <= uuid7_timestamp_ms(value) <= after
+
+    def test_strictly_increasing_within_a_millisecond(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(ids.time, "time_ns", lambda: NOW_NS)
+
+        values = [uuid7() for _ in range(10_000)]
+
+        assert values == sorted(values)
+        assert len(set(values)) == len(values)
+        assert {uuid7_timestamp_ms(value) for value in values} == {NOW_MS}
+
+    def test_clock_stepping_back_keeps_order(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(ids.time, "time_ns", lambda: NOW_NS)
+        first = uuid7()
+        monkeypatch.setattr(ids.time, "time_ns", lambda: NOW_NS - 5_000_000)
+        second = uuid7()
+
+        assert second > first
+        assert uuid7_timestamp_ms(second) == NOW_MS
+
+    def test_counter_overflow_moves_to_next_millisecond(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(ids.time, "time_ns", lambda: NOW_NS)
+        first = uuid7()
+        monkeypatch.setattr(ids, "_last_counter", ids._COUNTER_MAX)
+        second = uuid7()
+
+        assert second > first
+        assert uuid7_timestamp_ms(second) == NOW_MS + 1
@@ -0,0 +1,15 @@
+from unittest.mock import AsyncMock
+
+from src.application.post.key_allocator import SequenceKeyAllocator
+from src.application.post.keygen import KeyPermutation
+
+
+class TestSequenceKeyAllocator:
+    async def test_permutes_next_sequence_number(self) -> None:
+        repository = AsyncMock()
+        repository.next_key_number.return_value = 41
+        permutation = KeyPermutation(b"test")
+
+        key = await SequenceKeyAllocator(repository, permutation).allocate()
+
+        assert key == permutation.key_for(41)
@@ -0,0 +1,24 @@
+import pytest
+
+from src.application.post.keygen import KEY_SPACE, KeyPermutation, is_valid_key
+
+
+class TestKeyPermutation:
+    def test_consecutive_numbers_give_distinct_valid_keys(self) -> None:
+        permutation = KeyPermutation(b"secret")
+
+        keys = [permutation.key_for(number) for number in range(20_000)]
+
+        assert len(set(keys)) == len(keys)
+        assert all(is_valid_key(key) for key in keys)
+
+    def test_same_secret_gives_same_keys(self) -> None:
+        assert KeyPermutation(b"a").key_for(42) == KeyPermutation(b"a").key_for(42)
+        assert KeyPermutation(b"a").key_for(42) != KeyPermutation(b"b").key_for(42)
+
+    def test_edges_of_key_space(self) -> None:
+        permutation = KeyPermutation(b"secret")
+
+        assert is_valid_key(permutation.key_for(KEY_SPACE - 1))
+        with pytest.raises(ValueError, match="outside the key space"):
+            permutation.key_for(KEY_SPACE)
@@ -0,0 +1,142 @@
+import dataclasses
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.application.post.dtos import post_to_detail
+from src.application.post.search_by_key import (
+    SearchPostsByKeyInputDTO,
+    SearchPostsByKeyInteractor,
+)
+
+
+class TestSearchPostsByKeyInteractor:
+    @pytest.fixture
+    def mock_post_queries(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def interactor(
+        self, mock_post_queries, post_cache, key_filter
+    ) -> SearchPostsByKeyInteractor:
+        return SearchPostsByKeyInteractor(
+            post_queries=mock_post_queries,
+            post_cache=post_cache,
+            key_filter=key_filter,
+        )
+
+    async def test_repeated_lookups_are_served_from_cache(
+        self, interactor, mock_post_queries, post_cache, sample_post
+    ) -> None:
+        mock_post_queries.search_posts_by_key.return_value = [
+            post_to_detail(sample_post)
+        ]
+
+        first = await interactor(
+            SearchPostsByKeyInputDTO(query="ABCD1234 ", user_id=123)
+        )
+        second = await interactor(
+            SearchPostsByKeyInputDTO(query="abcd1234", user_id=123)
+        )
+
+        assert first == second
+        assert second.items[0].unique_key == "abcd1234"
+        # A full key is a capability: it finds the post whoever owns it
+        mock_post_queries.search_posts_by_key.assert_awaited_once_with(
+            prefix="abcd1234", limit=1
+        )
+        assert post_cache.stats.hits == 1
+
+    async def test_misses_are_not_cached(
+        self, interactor, mock_post_queries, post_cache
+    ) -> None:
+        mock_post_queries.search_posts_by_key.return_value = []
+
+        assert (
+            await interactor(SearchPostsByKeyInputDTO(query="abcd1234", user_id=123))
+        ).items == []
+
+        mock_post_queries.search_posts_by_key.assert_awaited_once()
+        assert len(post_cache) == 0
+
+    @pytest.mark.parametrize("query", ["ab", "abcd12345", "abcd-123", "абвгдежз"])
+    async def test_malformed_query_skips_lookup(
+        self, interactor, mock_post_queries, query
+    ) -> None:
+        assert (
+            await interactor(SearchPostsByKeyInputDTO(query=query, user_id=123))
+        ).items == []
+
+        mock_post_queries.search_posts_by_key.assert_not_called()
+
+    async def test_unallocated_key_skips_lookup(
+        self, interactor, mock_post_queries, key_filter
+    ) -> None:
+        assert (
+            await interactor(SearchPostsByKeyInputDTO(query="zzzz9999", user_id=123))
+        ).items == []
+
+        mock_post_queries.search_posts_by_key.assert_not_called()
+        assert key_filter.stats.negatives == 1
+
+    async def test_empty_query_skips_lookup(
+        self, interactor, mock_post_queries
+    ) -> None:
+        assert (
+            await interactor(SearchPostsByKeyInputDTO(query="  ", user_id=123))
+        ).items == []
+
+        mock_post_queries.search_posts_by_key.assert_not_called()
+
+    async def test_partial_key_searches_by_prefix(
+        self, interactor, mock_post_queries, post_cache, sample_post
+    ) -> None:
+        mock_post_queries.search_posts_by_key.return_value = [
+            post_to_detail(sample_post)
+        ]
+
+        result = await interactor(SearchPostsByKeyInputDTO(query="AbC", user_id=123))
+
+        assert [post.unique_key for post in result.items] == ["abcd1234"]
+        assert result.next_offset == ""
+        mock_post_queries.search_posts_by_key.assert_awaited_once_with(
+            prefix="abc", limit=11, after=None, owner_user_id=123
+        )
+        assert len(post_cache) == 0
+
+    async def test_full_page_returns_last_key_as_cursor(
+        self, interactor, mock_post_queries, sample_post
+    ) -> None:
+        mock_post_queries.search_posts_by_key.return_value = [
+            dataclasses.replace(post_to_detail(sample_post), unique_key=f"abc{i:05d}")
+            for i in range(11)
+        ]
+
+        result = await interactor(SearchPostsByKeyInputDTO(query="abc", user_id=123))
+
+        assert len(result.items) == 10
+        assert result.next_offset == "abc00009"
+
+    async def test_offset_continues_after_cursor(
+        self, interactor, mock_post_queries
+    ) -> None:
+        mock_post_queries.search_posts_by_key.return_value = []
+
+        await interactor(
+            SearchPostsByKeyInputDTO(query="abc", user_id=123, offset="abc00009")
+        )
+
+        mock_post_queries.search_posts_by_key.assert_awaited_once_with(
+            prefix="abc", limit=11, after="abc00009", owner_user_id=123
+        )
+
+    @pytest.mark.parametrize("offset", ["xyz00009", "abc0", "abc-0009"])
+    async def test_foreign_offset_ends_paging(
+        self, interactor, mock_post_queries, offset
+    ) -> None:
+        result = await interactor(
+            SearchPostsByKeyInputDTO(query="abc", user_id=123, offset=offset)
+        )
+
+        assert result.items == []
+        mock_post_queries.search_posts_by_key.assert_not_called()
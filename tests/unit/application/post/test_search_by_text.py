@@ -0,0 +1,43 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.application.post.search_by_text import (
+    SearchPostsByTextInputDTO,
+    SearchPostsByTextInteractor,
+)
+from src.domain.user.vo import UserId
+
+
+class TestSearchPostsByTextInteractor:
+    @pytest.fixture
+    def mock_post_repository(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def interactor(self, mock_post_repository) -> SearchPostsByTextInteractor:
+        return SearchPostsByTextInteractor(post_repository=mock_post_repository)
+
+    async def test_searches_with_normalized_query(
+        self, interactor, mock_post_repository, sample_post
+    ) -> None:
+        mock_post_repository.search_posts_by_text.return_value = [sample_post]
+
+        result = await interactor(
+            SearchPostsByTextInputDTO(query="  summer   sale ", user_id=123)
+        )
+
+        assert [post.id for post in result.items] == [sample_post.id]
+        assert result.next_offset == ""
+        mock_post_repository.search_posts_by_text.assert_awaited_once_with(
+            query="summer sale", user_id=UserId(123), limit=10
+        )
+
+    async def test_short_query_skips_search(
+        self, interactor, mock_post_repository
+    ) -> None:
+        result = await interactor(SearchPostsByTextInputDTO(query="ab", user_id=1))
+
+        assert result.items == []
+
+        mock_post_repository.search_posts_by_text.assert_not_called()
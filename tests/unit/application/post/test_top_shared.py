@@ -0,0 +1,18 @@
+import dataclasses
+from unittest.mock import AsyncMock
+
+from src.application.post.top_shared import GetTopSharedPostsInteractor
+
+
+class TestGetTopSharedPostsInteractor:
+    async def test_returns_share_counts(self, sample_post) -> None:
+        repository = AsyncMock()
+        repository.get_top_shared_posts.return_value = [
+            dataclasses.replace(sample_post, shares=42)
+        ]
+
+        top = await GetTopSharedPostsInteractor(post_repository=repository)(5)
+
+        assert [(p.unique_key, p.shares) for p in top] == [("abcd1234", 42)]
+        assert top[0].text_preview == "Hello"
+        repository.get_top_shared_posts.assert_awaited_once_with(limit=5)
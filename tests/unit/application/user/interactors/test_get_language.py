@@ -0,0 +1,34 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.application.user.interactors.get_language import (
+    GetUserLanguageDTO,
+    GetUserLanguageInteractor,
+)
+from src.domain.user.vo import LanguageCode, UserId
+
+
+class TestGetUserLanguageInteractor:
+    @pytest.fixture
+    def mock_user_repository(self) -> AsyncMock:
+        return AsyncMock()
+
+    async def test_returns_saved_language(
+        self, mock_user_repository: AsyncMock
+    ) -> None:
+        mock_user_repository.get_language.return_value = LanguageCode("ru")
+        interactor = GetUserLanguageInteractor(mock_user_repository)
+
+        result = await interactor(GetUserLanguageDTO(user_id=UserId(123456)))
+
+        assert result == "ru"
+        mock_user_repository.get_language.assert_awaited_once_with(UserId(123456))
+
+    async def test_returns_none_without_saved_language(
+        self, mock_user_repository: AsyncMock
+    ) -> None:
+        mock_user_repository.get_language.return_value = None
+        interactor = GetUserLanguageInteractor(mock_user_repository)
+
+        assert await interactor(GetUserLanguageDTO(user_id=UserId(123456))) is None
@@ -0,0 +1,60 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.application.user.service import UpsertUserData, UserService
+from src.domain.user import User
+from src.domain.user.vo import FirstName, UserId, Username
+
+
+class TestUserServiceUpsert:
+    @pytest.fixture
+    def mock_user_repository(self) -> AsyncMock:
+        repository = AsyncMock()
+        repository.upsert_user.side_effect = lambda user: user
+        return repository
+
+    @pytest.fixture
+    def service(self, mock_user_repository: AsyncMock) -> UserService:
+        return UserService(mock_user_repository)
+
+    async def test_upsert_is_a_single_repository_call(
+        self, service: UserService, mock_user_repository: AsyncMock
+    ) -> None:
+        await service.upsert_user(
+            UpsertUserData(id=42, username="johnny", first_name="John", last_name="")
+        )
+
+        mock_user_repository.upsert_user.assert_awaited_once()
+        mock_user_repository.get_user.assert_not_called()
+        mock_user_repository.create_user.assert_not_called()
+        mock_user_repository.update_user.assert_not_called()
+
+    async def test_upsert_builds_user_from_telegram_profile(
+        self, service: UserService, mock_user_repository: AsyncMock
+    ) -> None:
+        await service.upsert_user(
+            UpsertUserData(id=42, username="johnny", first_name="John", last_name="")
+        )
+
+        user: User = mock_user_repository.upsert_user.call_args.args[0]
+        assert user.id == UserId(42)
+        assert user.first_name == FirstName("John")
+        assert user.username == Username("johnny")
+        assert user.last_name is None
+        assert user.created_at == user.last_login_at == user.updated_at
+
+    async def test_is_new_comes_from_repository(
+        self, service: UserService, mock_user_repository: AsyncMock
+    ) -> None:
+        def _upsert(user: User) -> User:
+            user.inserted = False
+            return user
+
+        mock_user_repository.upsert_user.side_effect = _upsert
+
+        user = await service.upsert_user(
+            UpsertUserData(id=42, username=None, first_name="John", last_name=None)
+        )
+
+        assert user.is_new is False
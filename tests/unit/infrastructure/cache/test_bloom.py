@@ -0,0 +1,41 @@
+import pytest
+
+from src.application.post.keygen import generate_unique_key
+from src.infrastructure.cache import BloomFilter
+
+
+class TestBloomFilter:
+    def test_has_no_false_negatives(self) -> None:
+        bloom = BloomFilter(capacity=1_000)
+        keys = [generate_unique_key() for _ in range(1_000)]
+        for key in keys:
+            bloom.add(key)
+
+        assert all(bloom.might_contain(key) for key in keys)
+        assert len(bloom) == 1_000
+
+    def test_false_positive_rate_is_near_target(self) -> None:
+        bloom = BloomFilter(capacity=1_000, error_rate=0.01)
+        for i in range(1_000):
+            bloom.add(f"key-{i}")
+
+        false_positives = sum(bloom.might_contain(f"other-{i}") for i in range(10_000))
+
+        assert false_positives < 300
+
+    def test_counts_negatives(self) -> None:
+        bloom = BloomFilter(capacity=10)
+        bloom.add("abcd1234")
+
+        bloom.might_contain("abcd1234")
+        bloom.might_contain("zzzz9999")
+
+        assert bloom.stats.checks == 2
+        assert bloom.stats.negatives == 1
+
+    @pytest.mark.parametrize(
+        ("capacity", "error_rate"), [(0, 0.01), (10, 0.0), (10, 1.0)]
+    )
+    def test_rejects_invalid_parameters(self, capacity, error_rate) -> None:
+        with pytest.raises(ValueError):
+            BloomFilter(capacity=capacity, error_rate=error_rate)
@@ -0,0 +1,77 @@
+import pytest
+
+from src.infrastructure.cache import LRUCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLRUCache:
+    def test_get_returns_stored_value_and_counts_hit(self) -> None:
+        cache: LRUCache[str, int] = LRUCache(max_size=2)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 0
+
+    def test_missing_key_counts_miss(self) -> None:
+        cache: LRUCache[str, int] = LRUCache(max_size=2)
+
+        assert cache.get("missing") is None
+        assert cache.stats.misses == 1
+        assert cache.stats.hit_rate == 0.0
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache: LRUCache[str, int] = LRUCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+
+        cache.set("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert cache.stats.evictions == 1
+
+    def test_entries_expire_after_ttl(self) -> None:
+        clock = FakeClock()
+        cache: LRUCache[str, int] = LRUCache(max_size=2, ttl=10, clock=clock)
+        cache.set("a", 1)
+
+        clock.now = 9.9
+        assert cache.get("a") == 1
+
+        clock.now = 10.0
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_invalidate_removes_entry(self) -> None:
+        cache: LRUCache[str, int] = LRUCache(max_size=2)
+        cache.set("a", 1)
+
+        cache.invalidate("a")
+        cache.invalidate("a")
+
+        assert cache.get("a") is None
+        assert cache.stats.invalidations == 1
+
+    def test_hit_rate(self) -> None:
+        cache: LRUCache[str, int] = LRUCache(max_size=2)
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("a")
+        cache.get("a")
+        cache.get("b")
+
+        assert cache.stats.hit_rate == 0.75
+
+    def test_rejects_non_positive_size(self) -> None:
+        with pytest.raises(ValueError):
+            LRUCache(max_size=0)
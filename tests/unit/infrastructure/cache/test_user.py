@@ -0,0 +1,284 @@
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.domain.user import User
+from src.domain.user.vo import FirstName, LanguageCode, UserId, Username
+from src.infrastructure.cache import (
+    CachedUserRepository,
+    UserCache,
+    UserLanguageCache,
+)
+from src.infrastructure.db.transaction import CommitHooks
+
+
+@pytest.fixture
+def sample_user() -> User:
+    now = datetime.now(UTC)
+    return User(
+        id=UserId(7),
+        first_name=FirstName("John"),
+        last_name=None,
+        username=Username("johnny"),
+        bio=None,
+        created_at=now,
+        updated_at=now,
+        last_login_at=now,
+    )
+
+
+@pytest.fixture
+def inner() -> AsyncMock:
+    return AsyncMock()
+
+
+@pytest.fixture
+def cache() -> UserCache:
+    return UserCache(max_size=10, ttl=60)
+
+
+@pytest.fixture
+def recorder() -> Mock:
+    return Mock()
+
+
+@pytest.fixture
+def languages() -> UserLanguageCache:
+    return UserLanguageCache(max_size=10, ttl=60)
+
+
+@pytest.fixture
+def hooks() -> CommitHooks:
+    return CommitHooks()
+
+
+@pytest.fixture
+def repository(
+    inner: AsyncMock,
+    cache: UserCache,
+    recorder: Mock,
+    languages: UserLanguageCache,
+    hooks: CommitHooks,
+) -> CachedUserRepository:
+    return CachedUserRepository(inner, cache, recorder, languages, hooks)
+
+
+class TestCachedUserRepository:
+    async def test_repeated_reads_hit_the_database_once(
+        self, repository, inner, cache, sample_user
+    ) -> None:
+        inner.get_user.return_value = sample_user
+
+        first = await repository.get_user(UserId(7))
+        second = await repository.get_user(UserId(7))
+
+        assert first == second == sample_user
+        inner.get_user.assert_awaited_once()
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+
+    async def test_cached_user_is_a_copy(
+        self, repository, inner, cache, sample_user
+    ) -> None:
+        inner.get_user.return_value = sample_user
+
+        first = await repository.get_user(UserId(7))
+        first.language_code = LanguageCode("ru")
+        second = await repository.get_user(UserId(7))
+
+        assert first is sample_user
+        assert second is not first
+        assert cache.get(7) is not second
+        assert second.language_code is None
+
+    async def test_entity_changed_before_commit_is_cached_as_written(
+        self, repository, inner, cache, hooks, sample_user
+    ) -> None:
+        inner.create_user.return_value = sample_user
+
+        await repository.create_user(sample_user)
+        sample_user.language_code = LanguageCode("ru")
+        hooks.run()
+
+        assert cache.get(7).language_code is None
+
+    async def test_missing_user_is_not_cached(self, repository, inner) -> None:
+        inner.get_user.return_value = None
+
+        await repository.get_user(UserId(7))
+        await repository.get_user(UserId(7))
+
+        assert inner.get_user.await_count == 2
+
+    async def test_username_lookup_bypasses_cache(
+        self, repository, inner, cache, sample_user
+    ) -> None:
+        inner.get_user.return_value = sample_user
+
+        await repository.get_user(Username("johnny"))
+
+        assert len(cache) == 0
+
+    async def test_create_user_populates_cache_after_commit(
+        self, repository, inner, cache, hooks, sample_user
+    ) -> None:
+        inner.create_user.return_value = sample_user
+
+        await repository.create_user(sample_user)
+        assert 7 not in cache
+        hooks.run()
+
+        assert await repository.get_user(UserId(7)) == sample_user
+        inner.get_user.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("method", "args"),
+        [
+            ("update_language", (UserId(7), LanguageCode("ru"))),
+            ("set_referred_by", (UserId(7), UserId(8))),
+            ("increment_referral_count", (UserId(7),)),
+        ],
+    )
+    async def test_writes_invalidate_entry_after_commit(
+        self, inner, cache, sample_user, method, args
+    ) -> None:
+        hooks = CommitHooks()
+        repository = CachedUserRepository(
+            inner, cache, Mock(), UserLanguageCache(max_size=10), hooks
+        )
+        cache.set(7, sample_user)
+
+        await getattr(repository, method)(*args)
+        assert 7 in cache
+        hooks.run()
+
+        getattr(inner, method).assert_awaited_once_with(*args)
+        assert 7 not in cache
+
+    async def test_update_user_invalidates_entry_after_commit(
+        self, repository, inner, cache, hooks, sample_user
+    ) -> None:
+        cache.set(7, sample_user)
+        inner.update_user.return_value = sample_user
+
+        await repository.update_user(sample_user)
+        hooks.run()
+
+        assert 7 not in cache
+
+    async def test_rolled_back_write_leaves_cache_alone(
+        self, repository, inner, cache, hooks, sample_user
+    ) -> None:
+        cache.set(7, sample_user)
+
+        await repository.increment_referral_count(UserId(7))
+        hooks.clear()
+
+        assert cache.get(7) is sample_user
+
+    async def test_written_user_is_read_past_cache_until_commit(
+        self, repository, inner, cache, hooks, sample_user
+    ) -> None:
+        cache.set(7, sample_user)
+        updated = replace(sample_user, first_name=FirstName("Updated"))
+        inner.get_user.return_value = updated
+
+        await repository.increment_referral_count(UserId(7))
+        assert await repository.get_user(UserId(7)) is updated
+        assert 7 in cache
+
+        hooks.run()
+
+        assert 7 not in cache
+
+
+class TestCachedUserRepositoryUpsert:
+    async def test_cold_user_is_upserted_and_cached(
+        self, repository, inner, *, cache, hooks, recorder, sample_user
+    ) -> None:
+        inner.upsert_user.return_value = replace(sample_user, inserted=True)
+
+        user = await repository.upsert_user(sample_user)
+        hooks.run()
+
+        assert user.is_new is True
+        inner.upsert_user.assert_awaited_once_with(sample_user)
+        recorder.record.assert_not_called()
+        assert 7 in cache
+
+    async def test_cached_user_is_written_behind(
+        self, repository, inner, cache, recorder, sample_user
+    ) -> None:
+        cache.set(7, sample_user)
+        later = sample_user.last_login_at + timedelta(minutes=5)
+        seen = replace(
+            sample_user,
+            first_name=FirstName("Renamed"),
+            updated_at=later,
+            last_login_at=later,
+        )
+
+        user = await repository.upsert_user(seen)
+
+        inner.upsert_user.assert_not_called()
+        recorder.record.assert_called_once()
+        activity = recorder.record.call_args.args[0]
+        assert activity.first_name == "Renamed"
+        assert activity.seen_at == later
+        assert user.first_name == FirstName("Renamed")
+        assert user.created_at == sample_user.created_at
+        assert user.is_new is False
+
+    async def test_written_behind_snapshot_is_cached(
+        self, repository, inner, cache, sample_user
+    ) -> None:
+        cache.set(7, sample_user)
+
+        await repository.upsert_user(
+            replace(sample_user, first_name=FirstName("Renamed"))
+        )
+        user = await repository.get_user(UserId(7))
+
+        inner.get_user.assert_not_called()
+        assert user.first_name == FirstName("Renamed")
+        assert user.inserted is None
+
+    async def test_language_lookups_are_cached(self, repository, inner) -> None:
+        inner.get_language.return_value = LanguageCode("ru")
+
+        first = await repository.get_language(UserId(7))
+        second = await repository.get_language(UserId(7))
+
+        assert first == second == LanguageCode("ru")
+        inner.get_language.assert_awaited_once()
+
+    async def test_unknown_language_is_cached_too(self, repository, inner) -> None:
+        inner.get_language.return_value = None
+
+        assert await repository.get_language(UserId(7)) is None
+        assert await repository.get_language(UserId(7)) is None
+        inner.get_language.assert_awaited_once()
+
+    async def test_user_reads_fill_language_map(
+        self, repository, inner, sample_user
+    ) -> None:
+        inner.get_user.return_value = replace(
+            sample_user, language_code=LanguageCode("ru")
+        )
+
+        await repository.get_user(UserId(7))
+
+        assert await repository.get_language(UserId(7)) == LanguageCode("ru")
+        inner.get_language.assert_not_called()
+
+    async def test_update_language_drops_cached_language(
+        self, repository, inner, hooks, languages
+    ) -> None:
+        languages.set(7, LanguageCode("en"))
+
+        await repository.update_language(UserId(7), LanguageCode("ru"))
+        hooks.run()
+
+        assert 7 not in languages
@@ -0,0 +1,100 @@
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.domain.user.repository import UserActivity
+from src.infrastructure.db.activity import UserActivityBuffer
+
+
+def _activity(user_id: int, first_name: str = "John") -> UserActivity:
+    return UserActivity(
+        user_id=user_id,
+        username=None,
+        first_name=first_name,
+        last_name=None,
+        seen_at=datetime.now(UTC),
+    )
+
+
+class TestUserActivityBuffer:
+    @pytest.fixture
+    def session(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def session_maker(self, session: AsyncMock) -> MagicMock:
+        maker = MagicMock()
+        maker.return_value.__aenter__.return_value = session
+        return maker
+
+    @pytest.fixture
+    def repository_cls(self):
+        with patch("src.infrastructure.db.activity.UserRepositoryImpl") as repo_cls:
+            repo_cls.return_value.bulk_upsert_activity = AsyncMock(side_effect=len)
+            yield repo_cls
+
+    async def test_coalesces_updates_per_user(
+        self, session_maker: MagicMock, repository_cls: MagicMock
+    ) -> None:
+        buffer = UserActivityBuffer(session_maker)
+
+        buffer.record(_activity(1, "First"))
+        buffer.record(_activity(1, "Second"))
+        buffer.record(_activity(2))
+
+        flushed = await buffer.flush()
+
+        assert flushed == 2
+        assert buffer.stats.coalesced == 1
+        batch = repository_cls.return_value.bulk_upsert_activity.call_args.args[0]
+        assert {a.user_id: a.first_name for a in batch} == {1: "Second", 2: "John"}
+
+    async def test_flush_commits_once_per_chunk(
+        self,
+        session_maker: MagicMock,
+        session: AsyncMock,
+        repository_cls: MagicMock,
+    ) -> None:
+        buffer = UserActivityBuffer(session_maker, max_batch_size=2)
+        for user_id in range(1, 6):
+            buffer.record(_activity(user_id))
+
+        await buffer.flush()
+
+        assert repository_cls.return_value.bulk_upsert_activity.await_count == 3
+        assert session.commit.await_count == 3
+        assert buffer.pending == 0
+
+    async def test_empty_flush_does_not_touch_db(
+        self, session_maker: MagicMock, repository_cls: MagicMock
+    ) -> None:
+        buffer = UserActivityBuffer(session_maker)
+
+        assert await buffer.flush() == 0
+        session_maker.assert_not_called()
+
+    async def test_failed_flush_keeps_activity_for_retry(
+        self, session_maker: MagicMock, repository_cls: MagicMock
+    ) -> None:
+        repository_cls.return_value.bulk_upsert_activity.side_effect = RuntimeError
+        buffer = UserActivityBuffer(session_maker)
+        buffer.record(_activity(1))
+
+        with pytest.raises(RuntimeError):
+            await buffer.flush()
+
+        assert buffer.pending == 1
+        assert buffer.stats.failed_flushes == 1
+
+    async def test_close_flushes_pending_activity(
+        self, session_maker: MagicMock, repository_cls: MagicMock
+    ) -> None:
+        buffer = UserActivityBuffer(session_maker, flush_interval=60)
+        buffer.start()
+        buffer.record(_activity(1))
+
+        await buffer.close()
+
+        repository_cls.return_value.bulk_upsert_activity.assert_awaited_once()
+        assert buffer.pending == 0
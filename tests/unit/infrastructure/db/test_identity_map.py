@@ -0,0 +1,167 @@
+import uuid
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.domain.post.entity import Post
+from src.domain.post.vo import ContentType, PostStatus, UniqueKey
+from src.domain.user import User
+from src.domain.user.vo import FirstName, LanguageCode, UserId
+from src.infrastructure.db.identity_map import IdentityMap
+from src.infrastructure.db.repos.post import PostRepositoryImpl
+from src.infrastructure.db.repos.user import UserRepositoryImpl
+from src.infrastructure.db.transaction import CommitHooks, TransactionManagerImpl
+
+
+@pytest.fixture
+def sample_user() -> User:
+    now = datetime.now(UTC)
+    return User(
+        id=UserId(7),
+        first_name=FirstName("John"),
+        last_name=None,
+        username=None,
+        bio=None,
+        created_at=now,
+        updated_at=now,
+        last_login_at=now,
+    )
+
+
+@pytest.fixture
+def sample_post() -> Post:
+    now = datetime.now(UTC)
+    return Post(
+        id=uuid.uuid4(),
+        owner_user_id=UserId(7),
+        unique_key=UniqueKey("abcd1234"),
+        content_type=ContentType.TEXT,
+        status=PostStatus.ACTIVE,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+@pytest.fixture
+def identity_map() -> IdentityMap:
+    return IdentityMap()
+
+
+@pytest.fixture
+def session() -> AsyncMock:
+    return AsyncMock()
+
+
+class TestIdentityMap:
+    def test_counts_hits_and_misses(self, identity_map, sample_user) -> None:
+        assert identity_map.get(User, 7) is None
+        identity_map.add(sample_user, 7)
+
+        assert identity_map.get(User, 7) is sample_user
+        assert identity_map.stats.hits == 1
+        assert identity_map.stats.misses == 1
+
+    def test_peek_does_not_count(self, identity_map, sample_user) -> None:
+        identity_map.add(sample_user, 7)
+
+        assert identity_map.peek(User, 7) is sample_user
+        assert identity_map.stats.hits == 0
+
+    def test_keys_are_scoped_by_entity_type(self, identity_map, sample_user) -> None:
+        identity_map.add(sample_user, 7)
+
+        assert identity_map.get(Post, 7) is None
+
+    async def test_rollback_clears_map(
+        self, identity_map, session, sample_user
+    ) -> None:
+        identity_map.add(sample_user, 7)
+
+        await TransactionManagerImpl(session, identity_map).rollback()
+
+        assert len(identity_map) == 0
+
+
+class TestCommitHooks:
+    async def test_commit_runs_hooks_after_session_commit(self, session) -> None:
+        hooks = CommitHooks()
+        calls = []
+        session.commit.side_effect = lambda: calls.append("commit")
+        hooks.after_commit(lambda: calls.append("hook"))
+
+        await TransactionManagerImpl(session, commit_hooks=hooks).commit()
+
+        assert calls == ["commit", "hook"]
+        assert len(hooks) == 0
+
+    async def test_failed_commit_keeps_hooks_pending(self, session) -> None:
+        hooks = CommitHooks()
+        callback = Mock()
+        session.commit.side_effect = RuntimeError
+        hooks.after_commit(callback)
+
+        with pytest.raises(RuntimeError):
+            await TransactionManagerImpl(session, commit_hooks=hooks).commit()
+
+        callback.assert_not_called()
+
+    async def test_rollback_drops_hooks(self, session) -> None:
+        hooks = CommitHooks()
+        callback = Mock()
+        hooks.after_commit(callback)
+
+        await TransactionManagerImpl(session, commit_hooks=hooks).rollback()
+        hooks.run()
+
+        callback.assert_not_called()
+
+
+class TestRepositoriesShareIdentityMap:
+    async def test_repeated_get_user_queries_once(
+        self, identity_map, session, sample_user
+    ) -> None:
+        repository = UserRepositoryImpl(session, identity_map=identity_map)
+        identity_map.add(sample_user, 7)
+
+        user = await repository.get_user(UserId(7))
+
+        assert user is sample_user
+        session.execute.assert_not_called()
+        assert identity_map.stats.avoided_queries == 1
+
+    async def test_update_language_keeps_entity_current(
+        self, identity_map, session, sample_user
+    ) -> None:
+        repository = UserRepositoryImpl(session, identity_map=identity_map)
+        identity_map.add(sample_user, 7)
+
+        await repository.update_language(UserId(7), LanguageCode("ru"))
+
+        user = await repository.get_user(UserId(7))
+        assert user.language_code == LanguageCode("ru")
+
+    async def test_repeated_get_post_by_id_queries_once(
+        self, identity_map, session, sample_post
+    ) -> None:
+        repository = PostRepositoryImpl(session, identity_map)
+        identity_map.add(sample_post, sample_post.id)
+
+        first = await repository.get_post_by_id(sample_post.id)
+        second = await repository.get_post_by_id(sample_post.id)
+
+        assert first is second is sample_post
+        session.execute.assert_not_called()
+
+    async def test_soft_delete_updates_mapped_post(
+        self, identity_map, session, sample_post
+    ) -> None:
+        repository = PostRepositoryImpl(session, identity_map)
+        identity_map.add(sample_post, sample_post.id)
+
+        session.execute.return_value = [(sample_post.id, sample_post.unique_key.value)]
+
+        await repository.soft_delete_posts(sample_post.owner_user_id, [sample_post.id])
+
+        assert sample_post.status == PostStatus.DELETED
+        assert sample_post.deleted_at is not None
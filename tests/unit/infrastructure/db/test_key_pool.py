@@ -0,0 +1,118 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.application.post.keygen import KeyPermutation
+from src.infrastructure.db.key_pool import PostKeyPool
+
+
+class TestPostKeyPool:
+    @pytest.fixture
+    def session(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def session_maker(self, session: AsyncMock) -> MagicMock:
+        maker = MagicMock()
+        maker.return_value.__aenter__.return_value = session
+        return maker
+
+    @pytest.fixture
+    def repository(self):
+        with patch(
+            "src.infrastructure.db.key_pool.PostKeyPoolRepositoryImpl"
+        ) as repo_cls:
+            repository = repo_cls.return_value = AsyncMock()
+            repository.reclaim.return_value = []
+            repository.next_key_numbers.side_effect = lambda count: list(range(count))
+            repository.reserve.side_effect = lambda keys, owner: keys
+            yield repository
+
+    @pytest.fixture
+    def pool(self, session_maker: MagicMock) -> PostKeyPool:
+        return PostKeyPool(
+            session_maker, KeyPermutation(b"test"), low_water=2, batch_size=3
+        )
+
+    async def test_refill_tops_queue_up(self, pool, repository) -> None:
+        assert await pool.refill() == 5
+
+        assert pool.depth == 5
+        repository.next_key_numbers.assert_awaited_once_with(5)
+        assert pool.stats.reserved == 5
+
+    async def test_reclaimed_keys_come_first(self, pool, repository) -> None:
+        repository.reclaim.return_value = ["aaaaaaaa", "bbbbbbbb"]
+
+        await pool.refill()
+
+        assert await pool.allocate() == "aaaaaaaa"
+        repository.next_key_numbers.assert_awaited_once_with(3)
+        assert pool.stats.reclaimed == 2
+
+    async def test_full_queue_skips_refill(self, pool, repository) -> None:
+        await pool.refill()
+
+        assert await pool.refill() == 0
+        repository.next_key_numbers.assert_awaited_once()
+
+    async def test_used_keys_are_deleted_on_next_refill(self, pool, repository) -> None:
+        await pool.refill()
+        key = await pool.allocate()
+        pool.mark_used(key)
+
+        await pool.refill()
+
+        repository.delete_keys.assert_awaited_with([key])
+
+    async def test_allocation_waits_for_background_refill(
+        self, pool, repository
+    ) -> None:
+        pool.start()
+        try:
+            key = await asyncio.wait_for(pool.allocate(), 1)
+        finally:
+            await pool.close()
+
+        assert len(key) == 8
+        assert pool.stats.starved == 1
+
+    async def test_allocation_gives_up_without_refills(self, session_maker) -> None:
+        # Never started, as in a process that does not run the pool
+        pool = PostKeyPool(
+            session_maker, KeyPermutation(b"test"), allocate_timeout=0.01
+        )
+
+        with pytest.raises(RuntimeError, match="No post key available"):
+            await pool.allocate()
+
+        assert pool.stats.timed_out == 1
+        assert pool.stats.allocated == 0
+
+    async def test_released_key_is_handed_out_again(self, pool, repository) -> None:
+        await pool.refill()
+        key = await pool.allocate()
+
+        pool.release(key)
+
+        assert pool.depth == 5
+        assert pool.stats.released == 1
+        # Not used, so it stays in the pool table
+        assert all(key not in c.args[0] for c in repository.delete_keys.await_args_list)
+
+    async def test_close_releases_leases(self, pool, repository, session) -> None:
+
+        await pool.refill()
+
+        await pool.close()
+
+        repository.release.assert_awaited_once_with(pool.owner)
+        session.commit.assert_awaited()
+
+    async def test_close_without_leases_does_not_touch_db(
+        self, pool, session_maker
+    ) -> None:
+        await pool.close()
+
+        session_maker.assert_not_called()
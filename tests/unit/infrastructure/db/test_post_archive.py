@@ -0,0 +1,122 @@
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.infrastructure.db.post_archive import PostArchiver
+from src.infrastructure.db.repos.post_archive import PostArchiveRepositoryImpl
+
+
+class TestPostArchiveRepo:
+    async def test_moves_one_locked_batch_in_one_statement(self) -> None:
+        session = AsyncMock()
+        session.execute.return_value.rowcount = 3
+        cutoff = datetime(2026, 1, 1, tzinfo=UTC)
+
+        assert (
+            await PostArchiveRepositoryImpl(session).archive_deleted(cutoff, 500) == 3
+        )
+
+        session.execute.assert_awaited_once()
+        stmt = session.execute.call_args.args[0]
+        sql = str(
+            stmt.compile(
+                dialect=postgresql.asyncpg.dialect(),
+                compile_kwargs={"render_postcompile": True},
+            )
+        )
+        # Inlined, so ix_posts_deleted_at matches
+        assert "posts.status = 'deleted'" in sql
+        assert "ORDER BY posts.deleted_at" in sql
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert "DELETE FROM posts USING batch" in sql
+        assert "INSERT INTO posts_archive" in sql
+        assert "text_tsv" not in sql
+        assert {cutoff, 500} <= set(stmt.compile().params.values())
+
+
+class TestPostArchiver:
+    @pytest.fixture
+    def session(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def session_maker(self, session: AsyncMock) -> MagicMock:
+        maker = MagicMock()
+        maker.return_value.__aenter__.return_value = session
+        return maker
+
+    @pytest.fixture
+    def repository(self):
+        with patch(
+            "src.infrastructure.db.post_archive.PostArchiveRepositoryImpl"
+        ) as repo_cls:
+            repository = repo_cls.return_value = AsyncMock()
+            yield repository
+
+    @pytest.fixture
+    def sleep(self):
+        with patch(
+            "src.infrastructure.db.post_archive.asyncio.sleep", new=AsyncMock()
+        ) as sleep:
+            yield sleep
+
+    async def test_moves_batches_until_a_short_one(
+        self, session_maker, session, repository, sleep
+    ) -> None:
+        archiver = PostArchiver(
+            session_maker, retention=timedelta(days=7), batch_size=2
+        )
+        repository.archive_deleted.side_effect = [2, 2, 1]
+
+        assert await archiver.archive() == 5
+
+        cutoffs = {c.args[0] for c in repository.archive_deleted.await_args_list}
+        assert len(cutoffs) == 1
+        cutoff = cutoffs.pop()
+        assert cutoff < datetime.now(UTC) - timedelta(days=7) + timedelta(minutes=1)
+        # Every batch commits on its own, releasing its row locks
+        assert session.commit.await_count == 3
+        assert archiver.stats.archived == 5
+        assert archiver.stats.batches == 3
+        assert archiver.stats.runs == 1
+
+    async def test_throughput_ceiling_pauses_between_batches(
+        self, session_maker, repository, sleep
+    ) -> None:
+        archiver = PostArchiver(session_maker, batch_size=100, max_rows_per_second=50)
+        repository.archive_deleted.side_effect = [100, 0]
+
+        await archiver.archive()
+
+        # 100 rows at 50 rows/s take two seconds, minus the batch's own time
+        delay = sleep.await_args.args[0]
+        assert 1.9 < delay <= 2
+        assert archiver.stats.throttled_seconds == delay
+
+    async def test_dry_run_only_counts(
+        self, session_maker, session, repository, sleep
+    ) -> None:
+        archiver = PostArchiver(session_maker, dry_run=True)
+        repository.count_archivable.return_value = 42
+
+        assert await archiver.archive() == 42
+
+        repository.archive_deleted.assert_not_called()
+        session.commit.assert_not_called()
+        assert archiver.stats.archivable == 42
+        assert archiver.stats.archived == 0
+
+    async def test_failed_run_keeps_progress_so_far(
+        self, session_maker, repository, sleep
+    ) -> None:
+        archiver = PostArchiver(session_maker, batch_size=2)
+        repository.archive_deleted.side_effect = [2, RuntimeError("connection lost")]
+
+        with pytest.raises(RuntimeError):
+            await archiver.archive()
+
+        assert archiver.stats.archived == 2
+        assert archiver.stats.failed_runs == 1
+        assert archiver.stats.runs == 0
@@ -0,0 +1,60 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.infrastructure.db.post_counts import ActivePostCountReconciler
+
+
+class TestActivePostCountReconciler:
+    @pytest.fixture
+    def session(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def session_maker(self, session: AsyncMock) -> MagicMock:
+        maker = MagicMock()
+        maker.return_value.__aenter__.return_value = session
+        return maker
+
+    @pytest.fixture
+    def repository(self):
+        with patch("src.infrastructure.db.post_counts.PostRepositoryImpl") as repo_cls:
+            repository = repo_cls.return_value = AsyncMock()
+            yield repository
+
+    @pytest.fixture
+    def reconciler(self, session_maker: MagicMock) -> ActivePostCountReconciler:
+        return ActivePostCountReconciler(session_maker, batch_size=2)
+
+    async def test_walks_users_batch_by_batch(
+        self, reconciler, repository, session
+    ) -> None:
+        repository.reconcile_active_post_counts.side_effect = [
+            (5, 1),
+            (8, 0),
+            (None, 0),
+        ]
+
+        assert await reconciler.reconcile() == 1
+
+        calls = repository.reconcile_active_post_counts.await_args_list
+        assert [c.args for c in calls] == [(0, 2), (5, 2), (8, 2)]
+        # Every batch commits on its own, releasing its row locks
+        assert session.commit.await_count == 3
+        assert reconciler.stats.runs == 1
+        assert reconciler.stats.repaired == 1
+
+    async def test_failed_run_keeps_repairs_so_far(
+        self, reconciler, repository
+    ) -> None:
+        repository.reconcile_active_post_counts.side_effect = [
+            (5, 2),
+            RuntimeError("connection lost"),
+        ]
+
+        with pytest.raises(RuntimeError):
+            await reconciler.reconcile()
+
+        assert reconciler.stats.failed_runs == 1
+        assert reconciler.stats.repaired == 2
+        assert reconciler.stats.runs == 0
@@ -0,0 +1,164 @@
+import uuid
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.application.interfaces.post_queries import PostCursor
+from src.infrastructure.db.queries import PostQueryServiceImpl
+
+
+def _compile(stmt) -> str:
+    return str(
+        stmt.compile(
+            dialect=postgresql.asyncpg.dialect(),
+            compile_kwargs={"render_postcompile": True},
+        )
+    )
+
+
+def _list_row(created_at: datetime, **overrides) -> SimpleNamespace:
+    values = {
+        "id": uuid.uuid4(),
+        "unique_key": "abcd1234",
+        "content_type": "text",
+        "text_preview": "Hello",
+        "created_at": created_at,
+        "total": 5,
+    }
+    return SimpleNamespace(**(values | overrides))
+
+
+@pytest.fixture
+def session() -> AsyncMock:
+    session = AsyncMock()
+    session.execute.return_value = MagicMock()
+    session.execute.return_value.__iter__.return_value = iter([])
+    session.execute.return_value.all.return_value = []
+    return session
+
+
+class TestPostDetail:
+    async def test_selects_columns_not_entities(self, session) -> None:
+        now = datetime.now(UTC)
+        session.execute.return_value.first.return_value = SimpleNamespace(
+            id=uuid.uuid4(),
+            unique_key="abcd1234",
+            content_type="photo",
+            text_md="",
+            telegram_file_id="file",
+            buttons=[[{"text": "Go", "url": "https://example.com", "style": "green"}]],
+            created_at=now,
+            updated_at=now,
+            shares=None,
+        )
+
+        detail = await PostQueryServiceImpl(session).get_post_detail(uuid.uuid4())
+
+        sql = _compile(session.execute.call_args.args[0])
+        assert "posts.owner_user_id" not in sql
+        assert detail.text_md is None
+        assert detail.telegram_file_id == "file"
+        assert detail.buttons[0][0].style == "green"
+        assert detail.shares == 0
+
+    async def test_missing_post(self, session) -> None:
+        session.execute.return_value.first.return_value = None
+
+        assert await PostQueryServiceImpl(session).get_post_detail(uuid.uuid4()) is None
+
+
+class TestKeyPrefixSearch:
+    async def test_prefix_becomes_index_friendly_range(self, session) -> None:
+        await PostQueryServiceImpl(session).search_posts_by_key("ab3", limit=10)
+
+        stmt = session.execute.call_args.args[0]
+        sql = _compile(stmt)
+        params = stmt.compile().params
+        assert "posts.unique_key ~>=~" in sql
+        assert "posts.unique_key ~<~" in sql
+        assert "ORDER BY posts.unique_key USING ~<~" in sql
+        # Inlined so the partial index predicate matches under generic plans
+        assert "posts.status = 'active'" in sql
+        assert {"ab3", "ab4"} <= set(params.values())
+
+    async def test_upper_bound_of_last_letter(self, session) -> None:
+        await PostQueryServiceImpl(session).search_posts_by_key("abz")
+
+        params = session.execute.call_args.args[0].compile().params
+        assert "ab{" in params.values()
+
+    async def test_cursor_continues_after_last_key(self, session) -> None:
+        await PostQueryServiceImpl(session).search_posts_by_key("ab3", after="ab3xxxxx")
+
+        stmt = session.execute.call_args.args[0]
+        assert "posts.unique_key ~>~" in _compile(stmt)
+        assert "ab3xxxxx" in stmt.compile().params.values()
+
+    async def test_owner_restricts_matches(self, session) -> None:
+        queries = PostQueryServiceImpl(session)
+
+        await queries.search_posts_by_key("ab3")
+        assert "posts.owner_user_id" not in _compile(session.execute.call_args.args[0])
+
+        await queries.search_posts_by_key("ab3", owner_user_id=42)
+        stmt = session.execute.call_args.args[0]
+        assert "posts.owner_user_id =" in _compile(stmt)
+        assert 42 in stmt.compile().params.values()
+
+
+class TestUserPosts:
+    async def test_first_page_has_no_offset(self, session) -> None:
+        items, total = await PostQueryServiceImpl(session).get_user_posts(1, limit=11)
+
+        stmt = session.execute.call_args.args[0]
+        sql = _compile(stmt)
+        assert items == []
+        assert total == 0
+        assert "OFFSET" not in sql
+        # The total is read from the owner's counter in the same query
+        assert "(SELECT users.active_post_count" in sql
+        assert "ORDER BY posts.created_at DESC, posts.id DESC" in sql
+        # Inlined so ix_posts_active_owner_created matches under generic plans
+        assert "posts.status = 'active'" in sql
+        assert 11 in stmt.compile().params.values()
+
+    async def test_preview_is_cut_in_sql(self, session) -> None:
+        session.execute.return_value.all.return_value = [
+            _list_row(datetime.now(UTC), text_preview="")
+        ]
+
+        items, total = await PostQueryServiceImpl(session).get_user_posts(1)
+
+        stmt = session.execute.call_args.args[0]
+        assert "left(posts.text_md," in _compile(stmt)
+        assert 50 in stmt.compile().params.values()
+        assert items[0].text_preview is None
+        assert total == 5
+
+    async def test_cursor_seeks_on_created_at(self, session) -> None:
+        cursor = PostCursor(datetime.now(UTC), uuid.uuid4())
+
+        await PostQueryServiceImpl(session).get_user_posts(1, cursor=cursor)
+
+        sql = _compile(session.execute.call_args.args[0])
+        assert "posts.created_at <= " in sql
+        assert "posts.created_at < " in sql
+        assert "posts.id < " in sql
+
+    async def test_backward_returns_newest_first(self, session) -> None:
+        older, newer = (_list_row(datetime(2026, 1, d, tzinfo=UTC)) for d in (1, 2))
+        session.execute.return_value.all.return_value = [older, newer]
+        cursor = PostCursor(datetime(2025, 1, 1, tzinfo=UTC), uuid.uuid4())
+
+        items, total = await PostQueryServiceImpl(session).get_user_posts(
+            1, cursor=cursor, backward=True
+        )
+
+        sql = _compile(session.execute.call_args.args[0])
+        assert "posts.created_at >= " in sql
+        assert "ORDER BY posts.created_at ASC, posts.id ASC" in sql
+        assert [item.id for item in items] == [newer.id, older.id]
+        assert total == 5
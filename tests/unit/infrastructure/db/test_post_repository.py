@@ -0,0 +1,200 @@
+import uuid
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.domain.post.entity import Post
+from src.domain.post.vo import ContentType, PostStatus, UniqueKey
+from src.domain.user.vo import UserId
+from src.infrastructure.db.mappers.post import PostMapper
+from src.infrastructure.db.repos.post import PostRepositoryImpl
+
+
+def _compile(stmt) -> str:
+    return str(
+        stmt.compile(
+            dialect=postgresql.asyncpg.dialect(),
+            compile_kwargs={"render_postcompile": True},
+        )
+    )
+
+
+class TestKeyLookup:
+    async def test_active_filter_is_inlined(self) -> None:
+        session = AsyncMock()
+        session.execute.return_value = MagicMock()
+        session.execute.return_value.scalars.return_value.first.return_value = None
+
+        assert await PostRepositoryImpl(session).get_post_by_key("abcd1234") is None
+
+        # Bound, the predicate would keep generic plans off the partial index
+        sql = _compile(session.execute.call_args.args[0])
+        assert "posts.status = 'active'" in sql
+
+
+class TestTextSearch:
+    @pytest.fixture
+    def session(self) -> AsyncMock:
+        session = AsyncMock()
+        session.execute.return_value = MagicMock()
+        session.execute.return_value.scalars.return_value.all.return_value = []
+        return session
+
+    async def test_only_own_posts_are_searched(self, session) -> None:
+        await PostRepositoryImpl(session).search_posts_by_text("summer sa", UserId(5))
+
+        stmt = session.execute.call_args_list[0].args[0]
+        sql = _compile(stmt)
+        assert "text_tsv @@ to_tsquery" in sql
+        assert "posts.owner_user_id = " in sql
+        assert "ORDER BY ts_rank(" in sql
+        assert "summer:* & sa:*" in stmt.compile().params.values()
+
+    async def test_falls_back_to_trigram_match(self, session) -> None:
+        await PostRepositoryImpl(session).search_posts_by_text("50%_off", UserId(5))
+
+        calls = session.execute.call_args_list
+        assert len(calls) == 2
+        fallback = calls[1].args[0]
+        sql = _compile(fallback)
+        assert "ILIKE" in sql
+        assert "posts.owner_user_id = " in sql
+        assert "%50/%/_off%" in fallback.compile().params.values()
+
+    async def test_full_text_hits_skip_trigram_match(self, session) -> None:
+        session.execute.return_value.scalars.return_value.all.return_value = [
+            MagicMock()
+        ]
+
+        with patch.object(PostMapper, "to_domain", side_effect=lambda model: model):
+            posts = await PostRepositoryImpl(session).search_posts_by_text(
+                "summer", UserId(5), limit=2
+            )
+
+        assert len(posts) == 1
+        session.execute.assert_awaited_once()
+
+
+class TestAddShares:
+    async def test_single_update_keeps_updated_at(self) -> None:
+        session = AsyncMock()
+        session.execute.return_value = MagicMock(rowcount=2)
+        shares = {uuid.uuid4(): 3, uuid.uuid4(): 1}
+
+        written = await PostRepositoryImpl(session).add_shares(shares)
+
+        assert written == 2
+        session.execute.assert_awaited_once()
+        sql = _compile(session.execute.call_args.args[0])
+        assert "shares=(posts.shares + deltas.delta)" in sql
+        assert "updated_at=posts.updated_at" in sql
+        assert "FROM (VALUES" in sql
+
+    async def test_no_shares_skip_query(self) -> None:
+        session = AsyncMock()
+
+        assert await PostRepositoryImpl(session).add_shares({}) == 0
+        session.execute.assert_not_called()
+
+
+class TestCreatePost:
+    @pytest.fixture
+    def post(self) -> Post:
+        now = datetime.now(UTC)
+        return Post(
+            id=uuid.uuid4(),
+            owner_user_id=UserId(7),
+            unique_key=UniqueKey("abcd1234"),
+            content_type=ContentType.TEXT,
+            status=PostStatus.ACTIVE,
+            created_at=now,
+            updated_at=now,
+        )
+
+    async def test_taken_key_returns_none(self, post) -> None:
+        session = AsyncMock()
+        session.scalar.return_value = None
+
+        assert await PostRepositoryImpl(session).create_post(post) is None
+
+        sql = _compile(session.scalar.call_args.args[0])
+        assert "ON CONFLICT (unique_key) DO NOTHING" in sql
+        # Archived posts left the constraint but still hold their keys
+        assert "WHERE NOT (EXISTS (SELECT posts_archive.id" in sql
+        assert "RETURNING" in sql
+        session.execute.assert_not_called()
+
+    async def test_created_post_counts_for_its_owner(self, post) -> None:
+        session = AsyncMock()
+        session.scalar.return_value = PostMapper.to_model(post)
+
+        assert await PostRepositoryImpl(session).create_post(post) is not None
+
+        sql = _compile(session.execute.call_args.args[0])
+        assert "UPDATE users SET" in sql
+        assert "active_post_count=(users.active_post_count + " in sql
+        assert "updated_at=users.updated_at" in sql
+
+
+class TestSoftDeletePosts:
+    async def test_owner_check_and_counter_in_one_statement(self) -> None:
+        session = AsyncMock()
+        session.execute.return_value = [(uuid.uuid4(), "abcd1234")]
+        post_ids = [uuid.uuid4(), uuid.uuid4()]
+
+        keys = await PostRepositoryImpl(session).soft_delete_posts(UserId(7), post_ids)
+
+        assert keys == ["abcd1234"]
+        session.execute.assert_awaited_once()
+        stmt = session.execute.call_args.args[0]
+        sql = _compile(stmt)
+        assert "posts.owner_user_id = " in sql
+        assert "posts.id = ANY (" in sql
+        assert "posts.status = 'active'" in sql
+        assert "RETURNING posts.id, posts.unique_key" in sql
+        assert "active_post_count=(users.active_post_count - (SELECT count(*)" in sql
+        assert "updated_at=users.updated_at" in sql
+        params = stmt.compile().params
+        assert params["post_ids"] == post_ids
+        assert 7 in params.values()
+
+    async def test_without_ids_deletes_every_active_post(self) -> None:
+        session = AsyncMock()
+        session.execute.return_value = []
+
+        keys = await PostRepositoryImpl(session).soft_delete_posts(UserId(7))
+
+        assert keys == []
+        sql = _compile(session.execute.call_args.args[0])
+        assert "ANY" not in sql
+        assert "posts.owner_user_id = " in sql
+
+
+class TestReconcileActivePostCounts:
+    async def test_locks_batch_then_recounts(self) -> None:
+        session = AsyncMock()
+        session.scalars.return_value = [UserId(3), UserId(9)]
+        session.execute.return_value = MagicMock(rowcount=1)
+
+        last, repaired = await PostRepositoryImpl(session).reconcile_active_post_counts(
+            0, 2
+        )
+
+        assert (last, repaired) == (9, 1)
+        assert "FOR UPDATE" in _compile(session.scalars.call_args.args[0])
+        sql = _compile(session.execute.call_args.args[0])
+        assert "active_post_count=(SELECT count(*)" in sql
+        assert "posts.owner_user_id = users.id AND posts.status = 'active'" in sql
+        assert "users.active_post_count != (SELECT count(*)" in sql
+
+    async def test_past_last_user(self) -> None:
+        session = AsyncMock()
+        session.scalars.return_value = []
+
+        assert await PostRepositoryImpl(session).reconcile_active_post_counts(9, 2) == (
+            None,
+            0,
+        )
+        session.execute.assert_not_called()
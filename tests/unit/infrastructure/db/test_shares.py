@@ -0,0 +1,94 @@
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.infrastructure.db.shares import PostShareBuffer
+
+
+class TestPostShareBuffer:
+    @pytest.fixture
+    def session(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def session_maker(self, session: AsyncMock) -> MagicMock:
+        maker = MagicMock()
+        maker.return_value.__aenter__.return_value = session
+        return maker
+
+    @pytest.fixture
+    def repository_cls(self):
+        with patch("src.infrastructure.db.shares.PostRepositoryImpl") as repo_cls:
+            repo_cls.return_value.add_shares = AsyncMock(side_effect=len)
+            yield repo_cls
+
+    async def test_sums_shares_per_post(
+        self, session_maker: MagicMock, repository_cls: MagicMock
+    ) -> None:
+        viral, quiet = uuid.uuid4(), uuid.uuid4()
+        buffer = PostShareBuffer(session_maker)
+        for _ in range(1000):
+            buffer.record(viral)
+        buffer.record(quiet)
+
+        flushed = await buffer.flush()
+
+        assert flushed == 2
+        shares = repository_cls.return_value.add_shares.call_args.args[0]
+        assert shares == {viral: 1000, quiet: 1}
+
+    async def test_flush_commits_once_per_chunk(
+        self,
+        session_maker: MagicMock,
+        session: AsyncMock,
+        repository_cls: MagicMock,
+    ) -> None:
+        buffer = PostShareBuffer(session_maker, max_batch_size=2)
+        for _ in range(5):
+            buffer.record(uuid.uuid4())
+
+        await buffer.flush()
+
+        assert repository_cls.return_value.add_shares.await_count == 3
+        assert session.commit.await_count == 3
+        assert buffer.pending == 0
+
+    async def test_empty_flush_does_not_touch_db(
+        self, session_maker: MagicMock, repository_cls: MagicMock
+    ) -> None:
+        buffer = PostShareBuffer(session_maker)
+
+        assert await buffer.flush() == 0
+        session_maker.assert_not_called()
+
+    async def test_failed_flush_keeps_counts_for_retry(
+        self, session_maker: MagicMock, repository_cls: MagicMock
+    ) -> None:
+        repository_cls.return_value.add_shares.side_effect = RuntimeError
+        post_id = uuid.uuid4()
+        buffer = PostShareBuffer(session_maker)
+        buffer.record(post_id)
+        buffer.record(post_id)
+
+        with pytest.raises(RuntimeError):
+            await buffer.flush()
+        buffer.record(post_id)
+
+        assert buffer.stats.failed_flushes == 1
+        repository_cls.return_value.add_shares.side_effect = len
+        await buffer.flush()
+        shares = repository_cls.return_value.add_shares.call_args.args[0]
+        assert shares == {post_id: 3}
+
+    async def test_close_flushes_pending_shares(
+        self, session_maker: MagicMock, repository_cls: MagicMock
+    ) -> None:
+        buffer = PostShareBuffer(session_maker, flush_interval=60)
+        buffer.start()
+        buffer.record(uuid.uuid4())
+
+        await buffer.close()
+
+        repository_cls.return_value.add_shares.assert_awaited_once()
+        assert buffer.pending == 0
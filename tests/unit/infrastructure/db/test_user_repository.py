@@ -0,0 +1,135 @@
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.domain.user import User
+from src.domain.user.repository import UserActivity
+from src.domain.user.vo import FirstName, UserId
+from src.infrastructure.db.mappers import UserMapper
+from src.infrastructure.db.models.user import UserModel
+from src.infrastructure.db.repos.user import UserRepositoryImpl, UserWriteStats
+
+
+def _compile(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.asyncpg.dialect()))
+
+
+def _activity(user_id: int) -> UserActivity:
+    return UserActivity(
+        user_id=user_id,
+        username=None,
+        first_name="John",
+        last_name=None,
+        seen_at=datetime.now(UTC),
+    )
+
+
+def _user() -> User:
+    now = datetime.now(UTC)
+    return User(
+        id=UserId(1),
+        first_name=FirstName("John"),
+        last_name=None,
+        username=None,
+        bio=None,
+        created_at=now,
+        updated_at=now,
+        last_login_at=now,
+    )
+
+
+def _user_model() -> UserModel:
+    return UserMapper.to_model(_user())
+
+
+class TestGuardedUserUpsert:
+    @pytest.fixture
+    def session(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def stats(self) -> UserWriteStats:
+        return UserWriteStats()
+
+    @pytest.fixture
+    def repository(self, session, stats) -> UserRepositoryImpl:
+        return UserRepositoryImpl(
+            session, last_login_granularity=timedelta(minutes=5), stats=stats
+        )
+
+    def test_update_is_guarded_by_distinct_profile_or_stale_login(
+        self, repository: UserRepositoryImpl
+    ) -> None:
+        row = {
+            "id": 1,
+            "username": None,
+            "first_name": "John",
+            "last_name": None,
+            "created_at": datetime.now(UTC),
+            "updated_at": datetime.now(UTC),
+            "last_login_at": datetime.now(UTC),
+        }
+
+        sql = _compile(repository._guarded_upsert([row]))
+
+        _, _, where = sql.rpartition(" WHERE ")
+        assert "users.first_name IS DISTINCT FROM excluded.first_name" in where
+        assert "users.last_login_at < excluded.last_login_at" in where
+        assert "excluded.updated_at > users.updated_at" in where
+        assert "first_name = CASE WHEN" in sql
+        assert "updated_at = CASE WHEN" in sql
+        assert "last_login_at = CASE WHEN" in sql
+
+    async def test_upsert_reads_unchanged_row_in_the_same_statement(
+        self, repository: UserRepositoryImpl, session: AsyncMock, stats
+    ) -> None:
+        result = MagicMock()
+        result.one_or_none.return_value = (_user_model(), False, False)
+        session.execute.return_value = result
+
+        user = await repository.upsert_user(_user())
+
+        session.execute.assert_awaited_once()
+        sql = _compile(session.execute.call_args.args[0])
+        assert sql.startswith("WITH upserted AS")
+        assert "UNION ALL" in sql
+        assert "NOT (EXISTS (SELECT upserted.id" in sql
+        assert user.is_new is False
+        assert stats.suppressed == 1
+        assert stats.written == 0
+
+    async def test_upsert_counts_written_row(
+        self, repository: UserRepositoryImpl, session: AsyncMock, stats
+    ) -> None:
+        result = MagicMock()
+        result.one_or_none.return_value = (_user_model(), True, True)
+        session.execute.return_value = result
+
+        user = await repository.upsert_user(_user())
+
+        assert user.is_new is True
+        assert stats.written == 1
+        assert stats.suppressed == 0
+
+    async def test_bulk_upsert_counts_suppressed_rows(
+        self, repository: UserRepositoryImpl, session: AsyncMock, stats
+    ) -> None:
+        result = MagicMock()
+        result.all.return_value = [(1,)]
+        session.execute.return_value = result
+
+        written = await repository.bulk_upsert_activity(
+            [_activity(1), _activity(2), _activity(3)]
+        )
+
+        assert written == 1
+        assert stats.written == 1
+        assert stats.suppressed == 2
+
+    async def test_bulk_upsert_of_nothing_skips_the_database(
+        self, repository: UserRepositoryImpl, session: AsyncMock
+    ) -> None:
+        assert await repository.bulk_upsert_activity([]) == 0
+        session.execute.assert_not_called()
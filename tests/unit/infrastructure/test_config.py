@@ -1,4 +1,5 @@
 import tempfile
+from datetime import timedelta
 from pathlib import Path
 from unittest.mock import mock_open, patch
 
@@ -9,8 +10,10 @@ from pydantic import ValidationError
 from src.infrastructure.config import (
     AuthConfig,
     Config,
+    InlineConfig,
     PostgresConfig,
     TelegramConfig,
+    UserActivityConfig,
     load_config,
 )
 
@@ -284,6 +287,44 @@ class TestConfig:
                 Config(postgres=postgres)
 
 
+class TestUserActivityConfig:
+    def test_defaults(self):
+        config = UserActivityConfig()
+
+        assert config.flush_interval_ms == 1000
+        assert config.max_batch_size == 500
+        assert config.last_login_granularity == timedelta(minutes=1)
+
+    def test_zero_granularity_is_allowed(self):
+        config = UserActivityConfig(last_login_granularity_seconds=0)
+
+        assert config.last_login_granularity == timedelta(0)
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"flush_interval_ms": 0},
+            {"max_batch_size": -1},
+            {"last_login_granularity_seconds": -5},
+        ],
+    )
+    def test_invalid_values(self, overrides):
+        with pytest.raises(ValidationError):
+            UserActivityConfig(**overrides)
+
+
+class TestInlineConfig:
+    def test_content_cache_seconds_cover_every_content_type(self):
+        config = InlineConfig(photo_cache_seconds=60)
+
+        assert set(config.content_cache_seconds) == {"text", "photo", "video", "gif"}
+        assert config.content_cache_seconds["photo"] == 60
+
+    def test_negative_cache_time_is_rejected(self):
+        with pytest.raises(ValidationError):
+            InlineConfig(short_cache_seconds=-1)
+
+
 class TestLoadConfig:
     def test_load_valid_config_file(self):
         config_data = {
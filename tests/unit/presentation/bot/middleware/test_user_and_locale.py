@@ -0,0 +1,112 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiogram.dispatcher.event.handler import HandlerObject
+from aiogram.types import Message, User
+from dishka.integrations.aiogram import CONTAINER_NAME
+from fluentogram import TranslatorHub
+
+from src.application.user.create import CreateUserInteractor
+from src.application.user.dtos import CreateUserOutputDTO
+from src.application.user.interactors import GetUserLanguageInteractor
+from src.presentation.bot.middleware.user_and_locale import UserAndLocaleMiddleware
+
+
+async def handler_with_user(message: Message, user: CreateUserOutputDTO) -> None: ...
+
+
+async def handler_without_user(message: Message) -> None: ...
+
+
+class TestUserAndLocaleMiddleware:
+    @pytest.fixture
+    def event(self) -> MagicMock:
+        message = MagicMock(spec=Message)
+        message.from_user = MagicMock(spec=User)
+        message.from_user.id = 123456
+        message.from_user.username = "testuser"
+        message.from_user.first_name = "John"
+        message.from_user.last_name = None
+        message.from_user.language_code = "en"
+        return message
+
+    @pytest.fixture
+    def create_user(self) -> AsyncMock:
+        return AsyncMock(
+            return_value=CreateUserOutputDTO(
+                id=123456,
+                username="testuser",
+                first_name="John",
+                last_name=None,
+                is_new=False,
+                language_code="ru",
+            )
+        )
+
+    @pytest.fixture
+    def get_language(self) -> AsyncMock:
+        return AsyncMock(return_value="ru")
+
+    @pytest.fixture
+    def hub(self) -> MagicMock:
+        return MagicMock(spec=TranslatorHub)
+
+    @pytest.fixture
+    def container(
+        self, create_user: AsyncMock, get_language: AsyncMock, hub: MagicMock
+    ) -> MagicMock:
+        deps = {
+            CreateUserInteractor: create_user,
+            GetUserLanguageInteractor: get_language,
+            TranslatorHub: hub,
+        }
+
+        async def mock_get(dep_type: type, **kwargs: object) -> object:
+            return deps[dep_type]
+
+        container = MagicMock()
+        container.get = mock_get
+        return container
+
+    async def test_resolves_user_for_handlers_that_declare_it(
+        self, event, container, create_user, get_language, hub
+    ) -> None:
+        data = {
+            CONTAINER_NAME: container,
+            "handler": HandlerObject(callback=handler_with_user),
+        }
+
+        await UserAndLocaleMiddleware()(AsyncMock(), event, data)
+
+        create_user.assert_awaited_once()
+        get_language.assert_not_awaited()
+        assert data["user"] is create_user.return_value
+        hub.get_translator_by_locale.assert_called_once_with("ru")
+
+    async def test_skips_upsert_for_handlers_without_user(
+        self, event, container, create_user, get_language, hub
+    ) -> None:
+        data = {
+            CONTAINER_NAME: container,
+            "handler": HandlerObject(callback=handler_without_user),
+        }
+
+        await UserAndLocaleMiddleware()(AsyncMock(), event, data)
+
+        create_user.assert_not_awaited()
+        get_language.assert_awaited_once()
+        assert "user" not in data
+        hub.get_translator_by_locale.assert_called_once_with("ru")
+
+    async def test_falls_back_to_telegram_language(
+        self, event, container, get_language, hub
+    ) -> None:
+        get_language.return_value = None
+        data = {
+            CONTAINER_NAME: container,
+            "handler": HandlerObject(callback=handler_without_user),
+        }
+
+        await UserAndLocaleMiddleware()(AsyncMock(), event, data)
+
+        hub.get_translator_by_locale.assert_called_once_with("en")
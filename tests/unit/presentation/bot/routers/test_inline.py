@@ -0,0 +1,151 @@
+import uuid
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiogram.types import InlineQuery, User
+from fluentogram import TranslatorHub
+
+from src.application.post.dtos import PostDetailDTO, PostSearchPageDTO
+from src.application.post.search_by_key import SearchPostsByKeyInteractor
+from src.application.post.search_by_text import (
+    SearchPostsByTextInputDTO,
+    SearchPostsByTextInteractor,
+)
+from src.infrastructure.i18n import create_translator_hub
+from src.presentation.bot.routers.inline import inline_query_handler
+from src.presentation.bot.utils.inline_results import (
+    InlineCachePolicy,
+    InlineResultCache,
+)
+
+
+def _post(unique_key: str) -> PostDetailDTO:
+    now = datetime(2026, 1, 1, tzinfo=UTC)
+    return PostDetailDTO(
+        id=uuid.uuid4(),
+        unique_key=unique_key,
+        content_type="text",
+        text_md=f"Post {unique_key}",
+        telegram_file_id=None,
+        buttons=[],
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def _query(text: str, offset: str = "") -> MagicMock:
+    query = MagicMock(spec=InlineQuery)
+    query.query = text
+    query.offset = offset
+    query.from_user = MagicMock(spec=User)
+    query.from_user.id = 123
+    query.answer = AsyncMock()
+    return query
+
+
+def _answered_keys(query: MagicMock) -> list[str]:
+    return [r.title for r in query.answer.call_args.kwargs["results"]]
+
+
+class TestInlineQuery:
+    @pytest.fixture
+    def i18n(self):
+        locales_dir = (
+            Path(__file__).parent.parent.parent.parent.parent.parent / "locales"
+        )
+        hub: TranslatorHub = create_translator_hub(locales_dir)
+        return hub.get_translator_by_locale("en")
+
+    @pytest.fixture
+    def deps(self) -> dict[type, object]:
+        return {
+            SearchPostsByKeyInteractor: AsyncMock(
+                return_value=PostSearchPageDTO(items=[])
+            ),
+            SearchPostsByTextInteractor: AsyncMock(
+                return_value=PostSearchPageDTO(items=[])
+            ),
+            InlineResultCache: InlineResultCache(max_size=100),
+            InlineCachePolicy: InlineCachePolicy(
+                content_cache_seconds={"text": 600}, short_cache_seconds=5
+            ),
+        }
+
+    @pytest.fixture
+    def container(self, deps) -> MagicMock:
+        container = MagicMock()
+
+        async def mock_get(dep_type: type, **kwargs: object) -> object:
+            return deps[dep_type]
+
+        container.get = mock_get
+        return container
+
+    async def test_full_key_is_shared_without_text_search(
+        self, i18n, deps, container
+    ) -> None:
+        deps[SearchPostsByKeyInteractor].return_value = PostSearchPageDTO(
+            items=[_post("abcd1234")]
+        )
+        query = _query("ABCD1234")
+
+        await inline_query_handler(query, i18n=i18n, dishka_container=container)
+
+        deps[SearchPostsByTextInteractor].assert_not_called()
+        assert _answered_keys(query) == ["Post abcd1234"]
+        kwargs = query.answer.call_args.kwargs
+        assert kwargs["is_personal"] is False
+        assert kwargs["cache_time"] == 600
+
+    async def test_word_merges_key_and_text_matches(
+        self, i18n, deps, container
+    ) -> None:
+        key_match, text_match = _post("cat00001"), _post("zq9x0001")
+        deps[SearchPostsByKeyInteractor].return_value = PostSearchPageDTO(
+            items=[key_match], next_offset="cat00001"
+        )
+        # The key match found by its text too is listed once
+        deps[SearchPostsByTextInteractor].return_value = PostSearchPageDTO(
+            items=[text_match, key_match]
+        )
+        query = _query("cat")
+
+        await inline_query_handler(query, i18n=i18n, dishka_container=container)
+
+        deps[SearchPostsByTextInteractor].assert_awaited_once_with(
+            SearchPostsByTextInputDTO(query="cat", user_id=123)
+        )
+        assert _answered_keys(query) == ["Post cat00001", "Post zq9x0001"]
+        kwargs = query.answer.call_args.kwargs
+        assert kwargs["is_personal"] is True
+        # Partial key and text answers change with every new or deleted post
+        assert kwargs["cache_time"] == 5
+        assert kwargs["next_offset"] == "cat00001"
+
+    async def test_unknown_full_key_falls_back_to_text(
+        self, i18n, deps, container
+    ) -> None:
+        deps[SearchPostsByTextInteractor].return_value = PostSearchPageDTO(
+            items=[_post("zq9x0001")]
+        )
+        query = _query("postcard")
+
+        await inline_query_handler(query, i18n=i18n, dishka_container=container)
+
+        assert _answered_keys(query) == ["Post zq9x0001"]
+        assert query.answer.call_args.kwargs["is_personal"] is True
+
+    async def test_follow_up_page_is_personal(self, i18n, deps, container) -> None:
+        deps[SearchPostsByKeyInteractor].return_value = PostSearchPageDTO(
+            items=[_post("cat00002")]
+        )
+        query = _query("cat", offset="cat00001")
+
+        await inline_query_handler(query, i18n=i18n, dishka_container=container)
+
+        deps[SearchPostsByTextInteractor].assert_not_called()
+        kwargs = query.answer.call_args.kwargs
+        assert kwargs["is_personal"] is True
+        assert kwargs["cache_time"] == 5
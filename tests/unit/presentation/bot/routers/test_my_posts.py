@@ -0,0 +1,171 @@
+import uuid
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiogram.fsm.context import FSMContext
+from aiogram.fsm.storage.base import StorageKey
+from aiogram.fsm.storage.memory import MemoryStorage
+from aiogram.types import CallbackQuery, Message, User
+from fluentogram import TranslatorHub
+
+from src.application.post.delete import DeletePostsInputDTO, DeletePostsInteractor
+from src.application.post.dtos import PostListItemDTO, PostListOutputDTO
+from src.application.post.get_user_posts import GetUserPostsInteractor
+from src.application.user.dtos import CreateUserOutputDTO
+from src.infrastructure.i18n import create_translator_hub
+from src.presentation.bot.routers.my_posts import (
+    delete_all_execute,
+    delete_selected_execute,
+    select_posts_page,
+    toggle_post_selection,
+)
+from src.presentation.bot.states.my_posts import MyPostsSelection
+from src.presentation.bot.utils.cb_data import MyPostsCBData
+
+USER = CreateUserOutputDTO(
+    id=123,
+    username="testuser",
+    first_name="John",
+    last_name=None,
+    language_code="en",
+    is_new=False,
+)
+
+
+def _item() -> PostListItemDTO:
+    return PostListItemDTO(
+        id=uuid.uuid4(),
+        unique_key="abcd1234",
+        content_type="text",
+        text_preview="Hello",
+        created_at=datetime(2026, 1, 1, tzinfo=UTC),
+    )
+
+
+def _buttons(callback: MagicMock) -> list[str]:
+    markup = callback.message.edit_text.call_args.kwargs["reply_markup"]
+    return [button.text for row in markup.inline_keyboard for button in row]
+
+
+class TestMultiSelect:
+    @pytest.fixture
+    def i18n(self):
+        locales_dir = (
+            Path(__file__).parent.parent.parent.parent.parent.parent / "locales"
+        )
+        hub: TranslatorHub = create_translator_hub(locales_dir)
+        return hub.get_translator_by_locale("en")
+
+    @pytest.fixture
+    def state(self) -> FSMContext:
+        return FSMContext(
+            storage=MemoryStorage(),
+            key=StorageKey(bot_id=1, chat_id=123, user_id=123),
+        )
+
+    @pytest.fixture
+    def callback(self) -> MagicMock:
+        callback = MagicMock(spec=CallbackQuery)
+        callback.from_user = MagicMock(spec=User)
+        callback.from_user.id = 123
+        callback.message = MagicMock(spec=Message)
+        callback.message.edit_text = AsyncMock()
+        callback.answer = AsyncMock()
+        return callback
+
+    @pytest.fixture
+    def deps(self) -> dict[type, AsyncMock]:
+        get_user_posts = AsyncMock()
+        get_user_posts.return_value = PostListOutputDTO(
+            items=[_item(), _item()], total=2
+        )
+        delete_posts = AsyncMock(return_value=2)
+        return {
+            GetUserPostsInteractor: get_user_posts,
+            DeletePostsInteractor: delete_posts,
+        }
+
+    @pytest.fixture
+    def container(self, deps) -> MagicMock:
+        container = MagicMock()
+
+        async def mock_get(dep_type: type, **kwargs: object) -> object:
+            return deps[dep_type]
+
+        container.get = mock_get
+        return container
+
+    async def test_toggling_marks_posts(
+        self, callback, i18n, state, deps, container
+    ) -> None:
+        items = deps[GetUserPostsInteractor].return_value.items
+        post_id = str(items[0].id)
+        await select_posts_page(
+            callback,
+            MyPostsCBData(action="select", cursor="ncursor"),
+            i18n=i18n,
+            user=USER,
+            state=state,
+            dishka_container=container,
+        )
+        assert await state.get_state() == MyPostsSelection.selecting
+
+        await toggle_post_selection(
+            callback,
+            MyPostsCBData(action="toggle", post_id=post_id),
+            i18n=i18n,
+            user=USER,
+            state=state,
+            dishka_container=container,
+        )
+
+        data = await state.get_data()
+        assert data == {"selected": [post_id], "cursor": "ncursor"}
+        buttons = _buttons(callback)
+        assert buttons[0].startswith("✅")
+        assert buttons[1].startswith("⬜")
+        assert any(b.startswith("Delete selected (") for b in buttons)
+
+        await toggle_post_selection(
+            callback,
+            MyPostsCBData(action="toggle", post_id=post_id),
+            i18n=i18n,
+            user=USER,
+            state=state,
+            dishka_container=container,
+        )
+
+        assert (await state.get_data())["selected"] == []
+        assert not any(b.startswith("Delete selected") for b in _buttons(callback))
+
+    async def test_delete_selected_sends_all_ids_at_once(
+        self, callback, i18n, state, deps, container
+    ) -> None:
+        delete_posts = deps[DeletePostsInteractor]
+        items = deps[GetUserPostsInteractor].return_value.items
+        await state.set_state(MyPostsSelection.selecting)
+        await state.set_data({"selected": [str(item.id) for item in items]})
+
+        await delete_selected_execute(
+            callback, i18n, USER, state, dishka_container=container
+        )
+
+        delete_posts.assert_awaited_once_with(
+            DeletePostsInputDTO(user_id=123, post_ids=[item.id for item in items])
+        )
+        assert await state.get_state() is None
+        text = callback.message.edit_text.call_args.kwargs["text"]
+        assert text.startswith("Posts deleted:")
+        assert "2" in text
+
+    async def test_delete_all_passes_no_ids(
+        self, callback, i18n, state, deps, container
+    ) -> None:
+        delete_posts = deps[DeletePostsInteractor]
+        await delete_all_execute(
+            callback, i18n, USER, state, dishka_container=container
+        )
+
+        delete_posts.assert_awaited_once_with(DeletePostsInputDTO(user_id=123))
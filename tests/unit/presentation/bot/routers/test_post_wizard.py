@@ -10,6 +10,7 @@ from src.domain.post.vo import ContentType
 from src.infrastructure.i18n import create_translator_hub
 from src.presentation.bot.routers.post_wizard import (
     _show_preview,
+    collect_buttons,
     collect_content,
 )
 
@@ -224,7 +225,7 @@ class TestShowPreview:
             "content_type": ContentType.TEXT.value,
             "text_md": "<b>Hello</b>",
             "telegram_file_id": None,
-            "buttons_dsl": None,
+            "buttons": None,
         }
         msg = self._make_message()
 
@@ -239,7 +240,7 @@ class TestShowPreview:
             "content_type": ContentType.PHOTO.value,
             "text_md": "caption",
             "telegram_file_id": "photo_123",
-            "buttons_dsl": None,
+            "buttons": None,
         }
         msg = self._make_message()
 
@@ -253,7 +254,7 @@ class TestShowPreview:
             "content_type": ContentType.VIDEO.value,
             "text_md": "caption",
             "telegram_file_id": "video_456",
-            "buttons_dsl": None,
+            "buttons": None,
         }
         msg = self._make_message()
 
@@ -267,7 +268,7 @@ class TestShowPreview:
             "content_type": ContentType.GIF.value,
             "text_md": "caption",
             "telegram_file_id": "gif_789",
-            "buttons_dsl": None,
+            "buttons": None,
         }
         msg = self._make_message()
 
@@ -281,7 +282,7 @@ class TestShowPreview:
             "content_type": ContentType.TEXT.value,
             "text_md": None,
             "telegram_file_id": None,
-            "buttons_dsl": None,
+            "buttons": None,
         }
         msg = self._make_message()
 
@@ -289,3 +290,75 @@ class TestShowPreview:
 
         msg.answer.assert_called_once()
         assert msg.answer.call_args.kwargs["text"] == ""
+
+    async def test_preview_buttons_come_from_state(self, mock_state, i18n) -> None:
+        mock_state.get_data.return_value = {
+            "content_type": ContentType.TEXT.value,
+            "text_md": "Hi",
+            "telegram_file_id": None,
+            "buttons": [[{"text": "Go", "url": "https://a.com", "style": "green"}]],
+        }
+        msg = self._make_message()
+
+        await _show_preview(msg, mock_state, i18n)
+
+        markup = msg.answer.call_args.kwargs["reply_markup"]
+        button = markup.inline_keyboard[0][0]
+        assert (button.text, button.url, button.style) == (
+            "Go",
+            "https://a.com",
+            "success",
+        )
+
+
+class TestCollectButtons:
+    @pytest.fixture
+    def hub(self) -> TranslatorHub:
+        locales_dir = (
+            Path(__file__).parent.parent.parent.parent.parent.parent / "locales"
+        )
+        return create_translator_hub(locales_dir)
+
+    @pytest.fixture
+    def i18n(self, hub: TranslatorHub):
+        return hub.get_translator_by_locale("en")
+
+    @pytest.fixture
+    def mock_state(self) -> AsyncMock:
+        state = AsyncMock(spec=FSMContext)
+        state.get_data.return_value = {
+            "content_type": ContentType.TEXT.value,
+            "text_md": "Hi",
+        }
+        return state
+
+    def _make_message(self, text: str) -> MagicMock:
+        message = MagicMock(spec=Message)
+        message.text = text
+        message.from_user = User(id=1, is_bot=False, first_name="Test")
+        message.answer = AsyncMock()
+        message.answer.return_value.reply = AsyncMock()
+        return message
+
+    async def test_stores_parsed_rows(self, mock_state, i18n) -> None:
+        msg = self._make_message("[A + a.com] [B + b.com + red]\n[C + c.com]")
+
+        await collect_buttons(msg, mock_state, i18n)
+
+        mock_state.update_data.assert_awaited_once_with(
+            buttons=[
+                [
+                    {"text": "A", "url": "https://a.com", "style": "default"},
+                    {"text": "B", "url": "https://b.com", "style": "red"},
+                ],
+                [{"text": "C", "url": "https://c.com", "style": "default"}],
+            ]
+        )
+
+    async def test_invalid_dsl_is_not_stored(self, mock_state, i18n) -> None:
+        msg = self._make_message("[A + a.com + purple]")
+
+        await collect_buttons(msg, mock_state, i18n)
+
+        mock_state.update_data.assert_not_awaited()
+        assert "purple" in msg.answer.call_args.args[0]
@@ -0,0 +1,121 @@
+import uuid
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from aiogram.types import InlineQueryResultArticle, InlineQueryResultCachedPhoto
+
+from src.application.post.dtos import PostButtonDTO, PostDetailDTO
+from src.presentation.bot.utils.inline_results import (
+    InlineCachePolicy,
+    InlineResultCache,
+    build_inline_result,
+    inline_result_id,
+    parse_inline_result_id,
+)
+
+
+@pytest.fixture
+def text_post() -> PostDetailDTO:
+    now = datetime.now(UTC)
+    return PostDetailDTO(
+        id=uuid.uuid4(),
+        unique_key="abcd1234",
+        content_type="text",
+        text_md="Hello",
+        telegram_file_id=None,
+        buttons=[[PostButtonDTO(text="Go", url="https://example.com", style="green")]],
+        created_at=now,
+        updated_at=now,
+    )
+
+
+class TestBuildInlineResult:
+    def test_text_post_becomes_article(self, text_post) -> None:
+        result = build_inline_result(text_post)
+
+        assert isinstance(result, InlineQueryResultArticle)
+        assert result.reply_markup.inline_keyboard[0][0].url == "https://example.com"
+
+    def test_photo_post_uses_cached_file(self, text_post) -> None:
+        post = replace(text_post, content_type="photo", telegram_file_id="file-id")
+
+        result = build_inline_result(post)
+
+        assert isinstance(result, InlineQueryResultCachedPhoto)
+        assert result.photo_file_id == "file-id"
+
+    def test_media_post_without_file_is_skipped(self, text_post) -> None:
+        assert build_inline_result(replace(text_post, content_type="gif")) is None
+
+
+class TestInlineResultCache:
+    def test_repeated_posts_reuse_built_result(self, text_post) -> None:
+        cache = InlineResultCache(max_size=10)
+
+        first = cache.get_or_build(text_post)
+        second = cache.get_or_build(replace(text_post))
+
+        assert first is second
+        assert cache.stats.hits == 1
+
+    def test_edited_post_is_rebuilt(self, text_post) -> None:
+        cache = InlineResultCache(max_size=10)
+        first = cache.get_or_build(text_post)
+
+        edited = replace(
+            text_post,
+            text_md="Edited",
+            updated_at=text_post.updated_at + timedelta(seconds=1),
+        )
+        second = cache.get_or_build(edited)
+
+        assert second is not first
+        assert second.input_message_content.message_text == "Edited"
+
+    def test_unsupported_posts_are_not_cached(self, text_post) -> None:
+        cache = InlineResultCache(max_size=10)
+
+        assert cache.get_or_build(replace(text_post, content_type="gif")) is None
+        assert len(cache) == 0
+
+
+class TestInlineResultId:
+    def test_same_version_keeps_id(self, text_post) -> None:
+        assert inline_result_id(text_post) == inline_result_id(replace(text_post))
+
+    def test_edit_changes_id(self, text_post) -> None:
+        edited = replace(text_post, updated_at=text_post.updated_at + timedelta(1))
+
+        assert inline_result_id(edited) != inline_result_id(text_post)
+
+    def test_id_fits_telegram_limit(self, text_post) -> None:
+        assert len(inline_result_id(text_post).encode()) <= 64
+
+    def test_id_parses_back_to_post(self, text_post) -> None:
+        assert parse_inline_result_id(inline_result_id(text_post)) == text_post.id
+
+    def test_foreign_id_does_not_parse(self) -> None:
+        assert parse_inline_result_id("not-a-post") is None
+
+
+class TestInlineCachePolicy:
+    @pytest.fixture
+    def policy(self) -> InlineCachePolicy:
+        return InlineCachePolicy(
+            content_cache_seconds={"text": 600, "photo": 3600}, short_cache_seconds=5
+        )
+
+    def test_exact_key_answer_is_cached_per_content_type(
+        self, policy, text_post
+    ) -> None:
+        photo = replace(text_post, content_type="photo")
+
+        assert policy.exact_key_cache_time(photo) == 3600
+        assert policy.exact_key_cache_time(text_post) == 600
+
+    def test_unknown_content_type_stays_short(self, policy, text_post) -> None:
+        post = replace(text_post, content_type="sticker")
+
+        assert policy.exact_key_cache_time(post) == 5
+        assert policy.short_cache_time == 5